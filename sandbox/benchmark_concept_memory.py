@@ -0,0 +1,43 @@
+"""Measure the memory retained per atomic variable, per formula node and per abstract element,
+and the share of the concept indexes in it.
+
+Usage (from the repository root):
+    PYTHONPATH=src:src/naive python sandbox/benchmark_concept_memory.py
+"""
+import gc
+import sys
+import tracemalloc
+
+import naive
+
+core = sys.modules['naive.core']
+
+N = 10000
+
+
+def get_indexes_size():
+    return sum(sys.getsizeof(index) + sum(sys.getsizeof(handles) for handles in index.values())
+               for index in (core._scope_index, core._facet_index, core._codomain_index, core._system_function_index))
+
+
+def measure(label, factory):
+    gc.collect()
+    indexes_size = get_indexes_size()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = factory()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    indexes_size = get_indexes_size() - indexes_size
+    print(f'{label}: {size / N:.0f} bytes, of which concept indexes: {indexes_size / N:.0f} bytes')
+    return objects
+
+
+naive.Log.USE_PRINT_FOR_INFO = False
+naive.set_unique_scope()
+variables = measure('atomic variable', lambda: [naive.av(naive.BA1.b, 'x', i) for i in range(N)])
+formulas = measure('formula node', lambda: [
+    naive.f(naive.BA1.conjunction, variables[i], variables[(i + 1) % N]) for i in range(N)])
+elements = measure('abstract element', lambda: naive.SA1.declare_abstract_set(N))
@@ -1,10 +1,18 @@
 from __future__ import annotations
 import collections.abc
+import concurrent.futures
+import itertools
 import logging
+import os
+import sys
 import threading
 import graphviz
+import heapq
 import typing
 import abc
+import array
+import bisect
+import json
 from textx import metamodel_from_file, metamodel_from_str
 import pkg_resources
 import uuid
@@ -47,6 +55,10 @@ class Const:
     _MNEMONIC_KEY_ALLOWED_CHARACTERS = 'abcdefghijklmnopqrstuvwxyz0123456789_'
 
 
+_facet_registry = []
+"""The static registry of facets. The position of a facet in the registry is its bit position in facet masks."""
+
+
 class Facet(str):
     def __new__(
             cls,
@@ -67,8 +79,40 @@ class Facet(str):
         facet = super().__new__(cls, *args, **kwargs)
         facet._inclusions = inclusions
         facet._exclusions = exclusions
+        # Register the facet, and compute its masks once.
+        facet._bit = len(_facet_registry)
+        _facet_registry.append(facet)
+        facet._mask = 1 << facet._bit
+        facet._inclusions_mask = facet._mask
+        if inclusions is not None:
+            for included_facet in inclusions:
+                facet._inclusions_mask |= included_facet.inclusions_mask
+        facet._exclusions_mask = 0
+        if exclusions is not None:
+            for excluded_facet in exclusions:
+                facet._exclusions_mask |= excluded_facet.mask
         return facet
 
+    @property
+    def bit(self) -> int:
+        """int: The bit position of the facet in facet masks."""
+        return self._bit
+
+    @property
+    def mask(self) -> int:
+        """int: The facet mask of that single facet."""
+        return self._mask
+
+    @property
+    def inclusions_mask(self) -> int:
+        """int: The facet mask of that facet and all its inclusions, recursively."""
+        return self._inclusions_mask
+
+    @property
+    def exclusions_mask(self) -> int:
+        """int: The facet mask of the facets that must not be present whenever that facet is present."""
+        return self._exclusions_mask
+
     @property
     def inclusions(self):
         return self._inclusions
@@ -168,24 +212,48 @@ def has_facet(o, facet):
     """Returns **True** if **o** has facet **facet**, **False** otherwise.
 
     Special case:
-    Return **False** for pythonic objects that don't have a **facets** property."""
-    return hasattr(o, 'facets') and facet in o.facets
+    Return **False** for pythonic objects that don't have a **facet_mask** property."""
+    return getattr(o, '_facet_mask', 0) & facet.mask != 0
 
 
 def has_any_facet(o, facets):
     """Returns **True** if **o** has at least one **facet** among **facets**, **False** otherwise."""
-    return True if o.facets.intersection(facets) else False
+    mask = 0
+    for facet in facets:
+        mask |= facet.mask
+    return getattr(o, '_facet_mask', 0) & mask != 0
+
+
+def get_facets_mask(*args) -> int:
+    """Return the facet mask of one or multiple facets, and their inclusions."""
+    mask = 0
+    for facet in Utils.flatten(args):
+        mask |= facet.inclusions_mask
+    return mask
+
+
+def get_facets_from_mask(mask: int) -> frozenset:
+    """Return the set of facets of a facet mask. Facet sets are interned by mask."""
+    if mask not in _facet_sets:
+        _facet_sets[mask] = frozenset(facet for facet in _facet_registry if mask & facet.mask)
+    return _facet_sets[mask]
 
 
 def add_facets(o, *args):
-    """Add one or multiple facets to **o**, and enforce any related constraints such as automated inclusions."""
-    args = Utils.flatten(args)
-    for facet in args:
-        o.facets.add(facet)
-        if facet.inclusions is not None:
-            for included_facet in facet.inclusions:
-                add_facets(o, included_facet)
-        # TODO: Implement exclusions. Note that it will be harder to keep it truly consistent.
+    """Add one or multiple facets to **o**, and enforce any related constraints such as automated inclusions and exclusions.
+
+    Inclusions are precomputed in the facet masks, and consistency is checked once per distinct facet mask."""
+    mask = getattr(o, '_facet_mask', 0) | get_facets_mask(args)
+    if mask not in _facet_sets:
+        for facet in _facet_registry:
+            if mask & facet.mask and mask & facet.exclusions_mask:
+                Log.log_error('Inconsistent facets',
+                              facet=facet, excluded_facets=get_facets_from_mask(mask & facet.exclusions_mask))
+        get_facets_from_mask(mask)
+    if getattr(o, '_handle', None) is not None:
+        # The concept is already indexed.
+        index_facets(o, mask & ~o._facet_mask)
+    o._facet_mask = mask
 
 
 class RFormats:
@@ -269,7 +337,8 @@ class Log:
 
     @staticmethod
     def log_debug(message: str = '', code: int = 0, **kwargs):
-        if code not in Log.code_exclusion_list:
+        # The arguments are only stringified if the message is emitted.
+        if code not in Log.code_exclusion_list and logging.root.isEnabledFor(logging.DEBUG):
             d = Utils.stringify_dictionary(**kwargs)
             message = f'DEBUGGING: {message} {d}.'
             logging.debug(message)
@@ -763,31 +832,17 @@ class Repr:
             elif has_facet(o, Facets.extensively_defined_finite_set):
                 return base_name + \
                        Repr.subscriptify(Repr.represent(o._indexes, rformat), rformat)
-            elif hasattr(o, '_' + rformat) or hasattr(o, '_' + RFormats.DEFAULT):
-                # TODO: PROBABLY OBSOLETE CONDITION
-                if hasattr(o, '_' + rformat):
-                    return getattr(o, '_' + rformat)
-                elif hasattr(o, '_' + RFormats.DEFAULT):
-                    # We fall back on UTF-8
-                    return getattr(o, '_' + RFormats.DEFAULT)
-                else:
-                    Log.log_error('Missing rformat property', rformat=rformat, __dict__=o.__dict__)
-            elif hasattr(o, '_representations'):
-                Log.log_warning('Obsolete representation method with _representations property ?', rformat=rformat,
-                                __dict__=o.__dict__)
-                if rformat in o._representations:
-                    return o._representations[rformat]
-                elif RFormats.UTF8 in o._representations:
-                    # We fall back on UTF-8
-                    return o._representations[RFormats.UTF8]
-                else:
-                    Log.log_error('Missing rformat in _representations', rformat=rformat, __dict__=o.__dict__)
+            elif o.get_representation(rformat) is not None:
+                return o.get_representation(rformat)
+            elif o.get_representation(RFormats.DEFAULT) is not None:
+                # We fall back on UTF-8
+                return o.get_representation(RFormats.DEFAULT)
             else:
                 Log.log_error('No representation solution',
                               type=type(o),
                               rformat=rformat,
-                              facets=o.facets if hasattr(o, 'facets') else None,
-                              __dict__=o.__dict__)
+                              facets=o.facets,
+                              qualified_key=o.qualified_key)
         else:  # elif not isinstance(o, Core.Concept):
             # The final fallback method before raising an error.
             # Provides support for all base types and non-naive classes.
@@ -862,6 +917,8 @@ class Glyphs:
     logical_negation = Repr.Glyph(utf8='¬', latex=r'\lnot', html='&not;', usascii='not')
     logical_conjunction = Repr.Glyph(utf8='∧', latex=r'\land', html='&and;', usascii='and')
     logical_disjunction = Repr.Glyph(utf8='∨', latex=r'\lor', html='&or;', usascii='or')
+    logical_n_ary_conjunction = Repr.Glyph(utf8='⋀', latex=r'\bigwedge', html='&xwedge;', usascii='AND')
+    logical_n_ary_disjunction = Repr.Glyph(utf8='⋁', latex=r'\bigvee', html='&xvee;', usascii='OR')
     logical_material_implication = Repr.Glyph(utf8='⇒', latex=r'\implies', html='&rArr;', usascii='implies')
     logical_material_equivalence = Repr.Glyph(utf8='⇔', latex=r'\iif', html='&hArr;', usascii='iif')
 
@@ -981,9 +1038,77 @@ def get_qualified_key(scope_key, base_key,
 _concept_database = {}
 """The static database of concepts."""
 
+_concept_handles = []
+"""The static database of concepts, by handle."""
+
+_facet_sets = {}
+"""The static database of interned facet sets, by facet mask."""
+
 _token_database = {}
 """The static database of tokens."""
 
+_formula_database = {}
+"""The static structural index of hash-consed formulas."""
+
+_atomic_variable_database = {}
+"""The static database of atomic variables, by scope key, in the order of declaration.
+
+The position of an atomic variable in its scope list is its **variable_number**."""
+
+_variable_numbers = {}
+"""The static mapping from the handles of atomic variables to their **variable_number**."""
+
+_scope_index = {}
+"""The static index of concept handles, by scope key."""
+
+_facet_index = {}
+"""The static index of concept handles, by facet bit."""
+
+_codomain_index = {}
+"""The static index of concept handles, by codomain key (see **get_index_key**)."""
+
+_system_function_index = {}
+"""The static index of formula handles, by system function key (see **get_index_key**).
+
+These are the reverse edges from functions to the formulae that call them."""
+
+
+def get_index_key(o):
+    """Return the key of **o** in the concept indexes.
+
+    Concepts are keyed on their handle, other values on themselves, in distinct key spaces."""
+    handle = getattr(o, '_handle', None)
+    return ('value', o) if handle is None else ('handle', handle)
+
+
+def append_handle(index: dict, key, handle: int):
+    """Add a handle to the bucket of **key**, keeping the bucket sorted."""
+    handles = index.get(key)
+    if handles is None:
+        index[key] = array.array('q', (handle,))
+    elif handles[-1] < handle:
+        handles.append(handle)
+    else:
+        # Facets that are added after creation are inserted in order.
+        bisect.insort(handles, handle)
+
+
+def index_concept(o):
+    """Add a concept to the concept indexes."""
+    append_handle(_scope_index, o.scope_key, o.handle)
+    index_facets(o, o.facet_mask)
+    if o.codomain is not None:
+        append_handle(_codomain_index, get_index_key(o.codomain), o.handle)
+    if o.system_function is not None:
+        append_handle(_system_function_index, get_index_key(o.system_function), o.handle)
+
+
+def index_facets(o, mask: int):
+    """Add a concept to the facet index, for the facets of **mask**."""
+    for facet in _facet_registry:
+        if mask & facet.mask:
+            append_handle(_facet_index, facet.bit, o.handle)
+
 
 class Core:
     class Concept:
@@ -991,13 +1116,18 @@ class Core:
         global _concept_database
         global _token_database
 
+        __slots__ = (
+            '_scope_key', '_language_key', '_base_key', '_qualified_key', '_handle', '_facet_mask',
+            '_base_name', '_indexes', '_arguments', '_arity', '_codomain', '_system_function', '_parent_set',
+            '_properties')
+
         def __init__(self, scope_key, base_key,
                      facets,
                      language_key=None,  # TODO: Remove this obsolete argument
                      utf8=None, latex=None, html=None, usascii=None, tokens=None,
                      base_name=None, indexes=None, exponent=None,
                      domain=None, codomain=None, arity=None, python_value=None,
-                     arguments=None, algorithm=None, elements=None,
+                     arguments=None, algorithm=None, mask_algorithm=None, mask_expression=None, elements=None,
                      parent_set=None,
                      system_function=None,
                      **kwargs):
@@ -1010,33 +1140,37 @@ class Core:
             else:
                 self._language_key = language_key
             self._base_key = base_key
+            # The qualified key is computed once, and interned.
+            self._qualified_key = sys.intern(get_qualified_key(
+                scope_key=self._scope_key, language_key=self._language_key, base_key=self._base_key))
+            self._handle = None
             # Structural properties
-            self._facets = set()
+            self._facet_mask = 0
             # Recall add_facets to assure that facet logic is applied.
             add_facets(self, facets)
             # Representation Properties
-            self._utf8 = utf8
-            self._latex = latex
-            self._html = html
-            self._usascii = usascii
             self._base_name = base_name
             self._indexes = indexes
-            self._exponent = exponent
-            self._tokens = tokens
             # Other properties
             self._arguments = arguments
             self._arity = arity
-            self._domain = domain
             self._codomain = codomain
-            self._algorithm = algorithm
-            if elements is None:
-                # TODO: Leave this = None if facet is not applicable
-                self._elements = []
-            else:
-                self._elements = elements
             self._system_function = system_function
-            self._python_value = python_value
             self._parent_set = parent_set
+            # Optional properties are only stored if they are present.
+            self._properties = None
+            for key, value in (
+                    ('utf8', utf8), ('latex', latex), ('html', html), ('usascii', usascii),
+                    ('tokens', tokens), ('exponent', exponent), ('domain', domain), ('python_value', python_value),
+                    ('algorithm', algorithm), ('mask_algorithm', mask_algorithm), ('mask_expression', mask_expression),
+                    ('elements', elements)):
+                if value is not None:
+                    if self._properties is None:
+                        self._properties = {}
+                    self._properties[key] = value
+            # Caches that only formulae use are also optional properties, set on demand:
+            # 'compilations' (see BA1.compile), 'simplification' (see BA1.simplify),
+            # 'support', 'support_mask' and 'sorted_support' (see support).
             # Populate the token-concept mapping
             # to facilitate the retrieval of concepts during parsing
             # TODO: Consider the following approach: append utf8, latex, etc. as primary tokens,
@@ -1051,8 +1185,16 @@ class Core:
                             f'The "{token}" token was already in the token static database. We need to implement a priority algorithm to manage these situations.',
                             token=token, self=self)
             # Append the concept in the database
-            if self.qualified_key not in _concept_database:
-                _concept_database[self.qualified_key] = self
+            if self._qualified_key not in _concept_database:
+                _concept_database[self._qualified_key] = self
+                self._handle = len(_concept_handles)
+                _concept_handles.append(self)
+                index_concept(self)
+                # Atomic variables are numbered once registered, so that failed constructions leave no gap.
+                if has_facet(self, Facets.atomic_variable):
+                    scope_variables = _atomic_variable_database.setdefault(self._scope_key, [])
+                    _variable_numbers[self._handle] = len(scope_variables)
+                    scope_variables.append(self)
             else:
                 Log.log_error(
                     'The initialization of the concept could not be completed because the qualified key was already present in the static database.',
@@ -1071,7 +1213,7 @@ class Core:
             Facets:
                 * programmatic_function
             """
-            return self._algorithm
+            return self.get_property('algorithm')
 
         @property
         def arity(self):
@@ -1123,7 +1265,7 @@ class Core:
 
         @property
         def domain(self):
-            return self._domain
+            return self.get_property('domain')
 
         @property
         def elements(self):
@@ -1136,21 +1278,45 @@ class Core:
             Facets:
                 * extensively_defined_finite_set
             """
-            return self._elements
+            if self._properties is None or 'elements' not in self._properties:
+                # The list of elements is allocated on demand.
+                self.set_property('elements', [])
+            return self._properties['elements']
 
         @property
         def exponent(self):
-            return self._exponent
+            return self.get_property('exponent')
 
         @property
-        def facets(self) -> str:
-            return self._facets
+        def facet_mask(self) -> int:
+            """int: The facet mask of the concept, i.e. the bits of its facets (see **Facet.bit**)."""
+            return self._facet_mask
+
+        @property
+        def facets(self) -> frozenset:
+            return get_facets_from_mask(self._facet_mask)
+
+        def get_property(self, key: str):
+            """Return an optional property of the concept (e.g. 'utf8', 'algorithm'), or **None** if it is absent."""
+            if self._properties is None:
+                return None
+            return self._properties.get(key)
+
+        def get_representation(self, rformat: str):
+            """Return the representation of the concept in the **rformat** representation format, or **None**."""
+            return self.get_property(rformat)
+
+        def set_property(self, key: str, value):
+            """Set an optional property of the concept."""
+            if self._properties is None:
+                self._properties = {}
+            self._properties[key] = value
 
         @staticmethod
         def get_concept_from_decomposed_key(scope_key: str, language_key: str, base_key: str,
                                             **kwargs):
             if scope_key is not None and language_key is not None and base_key is not None:
-                qualified_key = get_qualified_key(scope_key, language_key, base_key)
+                qualified_key = get_qualified_key(scope_key=scope_key, language_key=language_key, base_key=base_key)
                 return Core.Concept.get_concept_from_qualified_key(
                     qualified_key, scope=scope_key, language=language_key, base_key=base_key,
                     **kwargs)
@@ -1169,6 +1335,11 @@ class Core:
                 Log.log_error('Getting concept with None qualified key is impossible.',
                               qualified_key=qualified_key, **kwargs)
 
+        @staticmethod
+        def get_concept_from_handle(handle: int):
+            """Return the concept whose handle is **handle**."""
+            return _concept_handles[handle]
+
         @staticmethod
         def get_concept_from_token(token):
             """
@@ -1183,17 +1354,53 @@ class Core:
             else:
                 return None
 
+        @property
+        def handle(self) -> int:
+            """int: The dense integer handle of the concept, i.e. its position in the order of creation of concepts.
+
+            Handles are compact keys for indexes, caches and arrays."""
+            return self._handle
+
         @property
         def indexes(self):
             return self._indexes
 
         def is_equal_concept(self, other: Core.Concept):
-            return self.qualified_key == other.qualified_key
+            if self._handle is None or other._handle is None:
+                # Concepts that are not registered in the database have no handle.
+                return self is other
+            return self._handle == other._handle
 
         @property
         def language(self):
             return self._language_key
 
+        @property
+        def mask_algorithm(self):
+            """function: The *python* function that implements the bit-packed algorithm for that *mathematical* function.
+
+            Bit-packed algorithms receive and return arbitrary-precision **int** masks,
+            where bit i is the value of the phi in world i.
+            They are called with the argument masks, and the keyword argument **vector_size**.
+
+            Facets:
+                * programmatic_function
+            """
+            return self.get_property('mask_algorithm')
+
+        @property
+        def mask_expression(self):
+            """str: The python expression template of the bit-packed algorithm for that *mathematical* function.
+
+            The template is formatted with the python expressions of the arguments as positional fields,
+            and the expression of the all-truth mask as the **mask** field (e.g. '({0} & {1})').
+            For n-ary functions, it is the infix operator that joins the expressions of the arguments (e.g. '&').
+
+            Facets:
+                * programmatic_function
+            """
+            return self.get_property('mask_expression')
+
         @property
         def parent_set(self):
             # TODO: Rename this property to something like "canonical parent set",
@@ -1202,7 +1409,7 @@ class Core:
 
         @property
         def python_value(self):
-            return self._python_value
+            return self.get_property('python_value')
 
         @property
         def system_function(self):
@@ -1210,17 +1417,79 @@ class Core:
 
         @property
         def qualified_key(self):
-            return get_qualified_key(scope_key=self.scope_key,
-                                     language_key=self.language,
-                                     base_key=self.base_key)
+            return self._qualified_key
 
         @property
         def scope_key(self):
             return self._scope_key
 
+        @property
+        def support(self):
+            """frozenset: The atomic variables of that phi, and its subformulae recursively.
+
+            Facets:
+                * atomic_variable
+                * phi
+            """
+            support = self.get_property('support')
+            if support is None:
+                self._compute_support()
+                support = self.get_property('support')
+            return support
+
+        def _compute_support(self):
+            # Subformulae are walked with an explicit stack, hence deep phi do not hit the recursion limit.
+            # Supports are shared with the arguments whenever possible.
+            stack = [self]
+            while len(stack) > 0:
+                o = stack[-1]
+                arguments = [argument for argument in (o._arguments or ()) if isinstance(argument, Core.Concept)]
+                pending = [argument for argument in arguments if argument.get_property('support') is None]
+                if len(pending) > 0:
+                    stack.extend(pending)
+                    continue
+                stack.pop()
+                if o.get_property('support') is not None:
+                    continue
+                variable_number = _variable_numbers.get(o._handle)
+                if variable_number is not None:
+                    # The phi is itself an atomic variable.
+                    o.set_property('support', frozenset((o,)))
+                    o.set_property('support_mask', 1 << variable_number)
+                    continue
+                support = frozenset()
+                support_mask = 0
+                for argument in arguments:
+                    argument_support = argument.get_property('support')
+                    if not argument_support <= support:
+                        support = argument_support if support <= argument_support else support | argument_support
+                    support_mask |= argument.get_property('support_mask')
+                o.set_property('support', support)
+                o.set_property('support_mask', support_mask)
+
+        @property
+        def support_mask(self):
+            """int: The bitmask of the **variable_number** of the atomic variables in the **support**.
+
+            Atomic variables are numbered by scope, hence the mask is only meaningful for phi
+            whose atomic variables belong to a single scope.
+            """
+            if self.get_property('support_mask') is None:
+                self._compute_support()
+            return self.get_property('support_mask')
+
         @property
         def tokens(self):
-            return self._tokens
+            return self.get_property('tokens')
+
+        @property
+        def variable_number(self):
+            """int: The number of that atomic variable in its scope, in the order of declaration.
+
+            Facets:
+                * atomic_variable
+            """
+            return _variable_numbers.get(self._handle)
 
     # Scope.
     system_scope = Concept(
@@ -1241,7 +1510,7 @@ class Core:
         #   here as a canonical mapping to a python object,
         #   with the symbolic value, the later being the naive concept.
         if has_facet(x, Facets.programmatic_constant):
-            return x._python_value
+            return x.python_value
         else:
             raise NotImplementedError('Missing programmatic_constant and/or python_value property', x=x)
 
@@ -1252,22 +1521,103 @@ class Core:
 
     _FORMULA_AUTO_COUNTER = Utils.Counter()
 
+    HASH_CONSING = False
+    """Opt-in hash-consing of formulas.
+
+    If **True**, **write_formula** returns the existing phi whenever an identical
+    system function / arguments combination was already written in the current scope,
+    instead of allocating a new phi. Equality of hash-consed formulas is an identity check."""
+
+    @staticmethod
+    def get_structural_key(o, *args):
+        """Return the key of the phi **o(*args)** in the structural index of hash-consed formulas.
+
+        Concept arguments are identified by their qualified keys,
+        i.e. hash-consed subformulae are identified by their identity,
+        and other arguments by their type and value.
+
+        Returns:
+            tuple: The structural key, or **None** if an argument is not hashable, in which case the phi is not hash-consed.
+        """
+        argument_keys = []
+        for argument in args:
+            if isinstance(argument, Core.Concept):
+                argument_keys.append(argument.qualified_key)
+            else:
+                try:
+                    hash(argument)
+                except TypeError:
+                    return None
+                argument_keys.append((type(argument), argument))
+        return _DEFAULT_SCOPE_KEY, o.qualified_key, tuple(argument_keys)
+
     @staticmethod
     def list_formula_atomic_variables(phi):
-        """Return the sorted set of variables present in the phi, and its subformulae recursively."""
-        atomic_variables = set()
-        if phi.arguments is not None:
-            for argument in phi.arguments:
-                if has_facet(argument, Facets.atomic_variable):
-                    atomic_variables.add(argument)
-                elif has_facet(argument, Facets.formula):
-                    atomic_variables_prime = Core.list_formula_atomic_variables(argument)
-                    for argument_prime in atomic_variables_prime:
-                        atomic_variables.add(argument_prime)
-                else:
-                    Log.log_error('Not implemented yet', argument=argument, phi=phi)
+        """Return the sorted set of variables present in the phi, and its subformulae recursively.
+
+        The support of the phi is computed at construction, and sorted once."""
+        sorted_support = phi.get_property('sorted_support')
+        if sorted_support is None:
+            sorted_support = tuple(sorted(phi.support, key=lambda x: x.base_key))
+            phi.set_property('sorted_support', sorted_support)
+        return list(sorted_support)
+
+    @staticmethod
+    def find_concepts(scope_key=None, facet: Facet = None, codomain=None, system_function=None) -> list:
+        """Return the concepts that match all the given criteria, in the order of their creation.
+
+        The query is answered from the indexes of the concept database:
+        the smallest matching index is intersected with the other criteria,
+        hence its cost is proportional to the size of that index, and not to the size of the database.
+
+        Example:
+            Core.find_concepts(scope_key=get_default_scope(), facet=Facets.atomic_variable, codomain=BA1.b)
+            Core.find_concepts(system_function=BA1.negation)
+
+        Args:
+            scope_key: Conditional: the scope key of the concepts.
+            facet (Facet): Conditional: a facet of the concepts.
+            codomain (Concept): Conditional: the codomain of the concepts.
+            system_function (Concept): Conditional: the system function of the formulae.
+
+        Returns:
+            list: The matching concepts.
+        """
+        candidates = []
+        if scope_key is not None:
+            candidates.append(_scope_index.get(scope_key, ()))
+        if facet is not None:
+            candidates.append(_facet_index.get(facet.bit, ()))
+        if codomain is not None:
+            codomain_key = get_index_key(codomain)
+            candidates.append(_codomain_index.get(codomain_key, ()))
+        if system_function is not None:
+            system_function_key = get_index_key(system_function)
+            candidates.append(_system_function_index.get(system_function_key, ()))
+        if len(candidates) == 0:
+            return list(_concept_handles)
+        concepts = []
+        # The buckets are sorted, hence the concepts are in the order of their creation.
+        for handle in min(candidates, key=len):
+            o = _concept_handles[handle]
+            if (scope_key is None or o.scope_key == scope_key) and \
+                    (facet is None or has_facet(o, facet)) and \
+                    (codomain is None or get_index_key(o.codomain) == codomain_key) and \
+                    (system_function is None or get_index_key(o.system_function) == system_function_key):
+                concepts.append(o)
+        return concepts
+
+    @staticmethod
+    def get_variable_positions(variables_list) -> dict:
+        """Return the mapping from the qualified keys of atomic variables to their positions in **variables_list**."""
+        return {variable.qualified_key: i for i, variable in enumerate(variables_list)}
 
-        # To allow sorting and indexing, convert the set to a list.
+    @staticmethod
+    def list_formulas_atomic_variables(formulas):
+        """Return the sorted set of variables present in any of the formulas, and their subformulae recursively."""
+        atomic_variables = set()
+        for phi in formulas:
+            atomic_variables.update(phi.support)
         atomic_variables = list(atomic_variables)
         atomic_variables.sort(key=lambda x: x.base_key)
         return atomic_variables
@@ -1275,6 +1625,11 @@ class Core:
     @staticmethod
     def write_formula(o, *args):
         global _FORMULA_AUTO_COUNTER
+        structural_key = None
+        if Core.HASH_CONSING and has_facet(o, Facets.programmatic_function):
+            structural_key = Core.get_structural_key(o, *args)
+            if structural_key is not None and structural_key in _formula_database:
+                return _formula_database[structural_key]
         scope_key = _DEFAULT_SCOPE_KEY
         index = Core._FORMULA_AUTO_COUNTER.get_value()
         base_key = 'f' + str(index)
@@ -1299,6 +1654,9 @@ class Core:
                 facets.add(Facets.programmatic_unary_operator_call)
             elif has_facet(o, Facets.programmatic_binary_operator):
                 facets.add(Facets.programmatic_binary_operator_call)
+            elif has_facet(o, Facets.programmatic_n_ary_function):
+                facets.add(Facets.programmatic_n_ary_function_call)
+                arity = len(args)
                 # TODO: Implement all other possibilities
         arguments = args
         formula = Core.Concept(
@@ -1310,6 +1668,8 @@ class Core:
             system_function=system_function, arguments=arguments,
             arity=arity, codomain=codomain
         )
+        if structural_key is not None:
+            _formula_database[structural_key] = formula
         Log.log_info(Repr.represent(formula))
         return formula
 
@@ -1349,6 +1709,195 @@ class Core:
             Log.log_info(Repr.represent_declaration(variable))
             return variable
 
+    class FormulaArena:
+        """An arena-backed store of formulae, where nodes are integer ids instead of **Concept** objects.
+
+        Nodes are stored in parallel typed arrays:
+            * operators: the id of the system function of the node, or -1 for an atomic variable,
+            * arities: the number of arguments of the node,
+            * offsets: the offset of the first argument of the node in the children array,
+                or the id of the atomic variable for an atomic variable,
+            * codomains: the id of the codomain of the node,
+        and the argument node ids of all nodes are stored in a single flat children array.
+        System functions, atomic variables and codomains are identified by their positions in small tables.
+
+        Nodes are appended after their arguments, i.e. node ids are a topological order of the DAG.
+        With **hash_consing**, structurally identical nodes are stored once,
+        at the cost of a structural index that is larger than the arrays themselves.
+        **Concept** views are materialised on demand (see **get_concept**).
+        """
+
+        def __init__(self, hash_consing: bool = True):
+            self._hash_consing = hash_consing
+            self._operators = array.array('i')
+            self._arities = array.array('i')
+            self._offsets = array.array('q')
+            self._codomains = array.array('i')
+            self._children = array.array('q')
+            self._operator_table = []
+            self._variable_table = []
+            self._codomain_table = []
+            self._operator_ids = {}
+            self._variable_ids = {}
+            self._codomain_ids = {}
+            self._nodes = {}
+            self._concepts = {}
+
+        def __len__(self):
+            return len(self._operators)
+
+        @staticmethod
+        def _get_table_id(table, ids, o):
+            if o.qualified_key not in ids:
+                ids[o.qualified_key] = len(table)
+                table.append(o)
+            return ids[o.qualified_key]
+
+        def _append_node(self, operator, arguments, offset, codomain):
+            structural_key = None
+            if self._hash_consing:
+                structural_key = (operator, offset if operator == -1 else tuple(arguments))
+                if structural_key in self._nodes:
+                    return self._nodes[structural_key]
+            node = len(self._operators)
+            self._operators.append(operator)
+            self._arities.append(len(arguments))
+            self._offsets.append(len(self._children) if operator != -1 else offset)
+            self._codomains.append(codomain)
+            self._children.extend(arguments)
+            if structural_key is not None:
+                self._nodes[structural_key] = node
+            return node
+
+        def add_atomic_variable(self, variable: Core.Concept) -> int:
+            """Add an atomic variable node, and return its node id."""
+            variable_id = self._get_table_id(self._variable_table, self._variable_ids, variable)
+            codomain = self._get_table_id(self._codomain_table, self._codomain_ids, variable.codomain)
+            return self._append_node(-1, (), variable_id, codomain)
+
+        def add_formula(self, system_function: Core.Concept, *arguments: int) -> int:
+            """Add a formula node, whose arguments are node ids, and return its node id."""
+            for argument in arguments:
+                if not 0 <= argument < len(self._operators):
+                    Log.log_error('Unknown node id', argument=argument)
+            operator = self._get_table_id(self._operator_table, self._operator_ids, system_function)
+            codomain = self._get_table_id(self._codomain_table, self._codomain_ids, system_function.codomain)
+            return self._append_node(operator, arguments, None, codomain)
+
+        def add_concept(self, phi: Core.Concept) -> int:
+            """Add a formula (or an atomic variable), given as a **Concept**, and return its node id.
+
+            The phi is walked with an explicit stack, hence deep phi do not hit the recursion limit."""
+            nodes = {}
+            stack = [phi]
+            while len(stack) > 0:
+                o = stack[-1]
+                if o.handle in nodes:
+                    stack.pop()
+                elif has_facet(o, Facets.atomic_variable):
+                    nodes[o.handle] = self.add_atomic_variable(o)
+                    stack.pop()
+                elif has_facet(o, Facets.programmatic_function_call):
+                    pending = [argument for argument in o.arguments if argument.handle not in nodes]
+                    if len(pending) > 0:
+                        stack.extend(pending)
+                    else:
+                        nodes[o.handle] = self.add_formula(
+                            o.system_function, *(nodes[argument.handle] for argument in o.arguments))
+                        self._concepts.setdefault(nodes[o.handle], o)
+                        stack.pop()
+                else:
+                    Log.log_error('Unexpected type', o=o, t=type(o), facets=o.facets)
+            return nodes[phi.handle]
+
+        def get_arguments(self, node: int) -> array.array:
+            """Return the argument node ids of a node."""
+            if self._operators[node] == -1:
+                return self._children[0:0]
+            offset = self._offsets[node]
+            return self._children[offset:offset + self._arities[node]]
+
+        def get_codomain(self, node: int) -> Core.Concept:
+            return self._codomain_table[self._codomains[node]]
+
+        def get_system_function(self, node: int) -> (None, Core.Concept):
+            """Return the system function of a node, or **None** for an atomic variable node."""
+            operator = self._operators[node]
+            return None if operator == -1 else self._operator_table[operator]
+
+        def get_atomic_variable(self, node: int) -> (None, Core.Concept):
+            """Return the atomic variable of a node, or **None** for a formula node."""
+            return self._variable_table[self._offsets[node]] if self._operators[node] == -1 else None
+
+        def list_reachable_nodes(self, node: int) -> typing.List[int]:
+            """Return the ids of the nodes of the sub-DAG of **node**, in topological order."""
+            reachable = bytearray(node + 1)
+            reachable[node] = 1
+            for i in range(node, -1, -1):
+                if reachable[i] and self._operators[i] != -1:
+                    offset = self._offsets[i]
+                    for argument in self._children[offset:offset + self._arities[i]]:
+                        reachable[argument] = 1
+            return [i for i in range(node + 1) if reachable[i]]
+
+        def list_atomic_variables(self, node: int) -> typing.List[Core.Concept]:
+            """Return the sorted set of atomic variables of the sub-DAG of **node**."""
+            return sorted((self._variable_table[self._offsets[i]]
+                           for i in self.list_reachable_nodes(node) if self._operators[i] == -1),
+                          key=lambda x: x.base_key)
+
+        def get_concept(self, node: int) -> Core.Concept:
+            """Return the **Concept** of a node, materialising the concepts of its sub-DAG if necessary."""
+            if node not in self._concepts:
+                for i in self.list_reachable_nodes(node):
+                    if i not in self._concepts:
+                        if self._operators[i] == -1:
+                            self._concepts[i] = self._variable_table[self._offsets[i]]
+                        else:
+                            self._concepts[i] = Core.write_formula(
+                                self._operator_table[self._operators[i]],
+                                *(self._concepts[argument] for argument in self.get_arguments(i)))
+            return self._concepts[node]
+
+        def serialize(self) -> bytes:
+            """Serialize the arena to bytes.
+
+            System functions, atomic variables and codomains are serialized by qualified key,
+            and must be declared again before deserialization."""
+            header = json.dumps({
+                'operators': [o.qualified_key for o in self._operator_table],
+                'variables': [o.qualified_key for o in self._variable_table],
+                'codomains': [o.qualified_key for o in self._codomain_table],
+                'lengths': [len(self._operators), len(self._children)]}).encode('utf-8')
+            return b''.join([len(header).to_bytes(8, 'little'), header,
+                             self._operators.tobytes(), self._arities.tobytes(), self._offsets.tobytes(),
+                             self._codomains.tobytes(), self._children.tobytes()])
+
+        @staticmethod
+        def deserialize(data: bytes, hash_consing: bool = True) -> Core.FormulaArena:
+            """Deserialize an arena serialized with **serialize**."""
+            header_length = int.from_bytes(data[0:8], 'little')
+            header = json.loads(data[8:8 + header_length].decode('utf-8'))
+            arena = Core.FormulaArena(hash_consing=hash_consing)
+            for table, ids, keys in ((arena._operator_table, arena._operator_ids, header['operators']),
+                                     (arena._variable_table, arena._variable_ids, header['variables']),
+                                     (arena._codomain_table, arena._codomain_ids, header['codomains'])):
+                for qualified_key in keys:
+                    if qualified_key not in _concept_database:
+                        Log.log_error('Unknown concept', qualified_key=qualified_key)
+                    Core.FormulaArena._get_table_id(table, ids, _concept_database[qualified_key])
+            nodes_number, children_number = header['lengths']
+            position = 8 + header_length
+            for values, length in ((arena._operators, nodes_number), (arena._arities, nodes_number),
+                                   (arena._offsets, nodes_number), (arena._codomains, nodes_number),
+                                   (arena._children, children_number)):
+                values.frombytes(data[position:position + length * values.itemsize])
+                position += length * values.itemsize
+            for node in range(nodes_number if hash_consing else 0):
+                operator = arena._operators[node]
+                arena._nodes[(operator, arena._offsets[node] if operator == -1 else tuple(arena.get_arguments(node)))] = node
+            return arena
+
 
 # TODO: Question: what should be the scope_key of user defined scopes? sys? the scope_key itself?
 
@@ -1463,11 +2012,152 @@ class BA1:
         v2 = Utils.flatten(v2)  # If scalar, convert to list.
         return [BA1.truth if (b1 == BA1.truth or b2 == BA1.truth) else BA1.falsum for b1, b2 in zip(v1, v2)]
 
+    @staticmethod
+    def n_ary_conjunction_algorithm(
+            *vectors: typing.List[Core.Concept],
+            vector_size: int = 1) -> \
+            typing.List[Core.Concept]:
+        """The vectorized n-ary conjunction boolean function.
+
+        All the arguments are folded in a single pass, with a single output vector.
+
+        Args:
+            vectors (typing.List[BooleanConstant]): Vectors of boolean constants.
+            vector_size (int): The size of the output vector, if there is no argument.
+
+        Returns:
+            typing.List[BooleanConstant]: The vector of the conjunction of **vectors**.
+        """
+        if len(vectors) == 0:
+            return BA1.truth_algorithm(vector_size=vector_size)
+        vectors = [Utils.flatten(v) for v in vectors]  # If scalar, convert to list.
+        return [BA1.truth if all(b == BA1.truth for b in bs) else BA1.falsum for bs in zip(*vectors)]
+
+    @staticmethod
+    def n_ary_disjunction_algorithm(
+            *vectors: typing.List[Core.Concept],
+            vector_size: int = 1) -> \
+            typing.List[Core.Concept]:
+        """The vectorized n-ary disjunction boolean function.
+
+        All the arguments are folded in a single pass, with a single output vector.
+
+        Args:
+            vectors (typing.List[BooleanConstant]): Vectors of boolean constants.
+            vector_size (int): The size of the output vector, if there is no argument.
+
+        Returns:
+            typing.List[BooleanConstant]: The vector of the disjunction of **vectors**.
+        """
+        if len(vectors) == 0:
+            return BA1.falsum_algorithm(vector_size=vector_size)
+        vectors = [Utils.flatten(v) for v in vectors]  # If scalar, convert to list.
+        return [BA1.truth if any(b == BA1.truth for b in bs) else BA1.falsum for bs in zip(*vectors)]
+
+    # Bit-packed algorithms.
+    @staticmethod
+    def falsum_mask_algorithm(vector_size: int = 1) -> int:
+        """The bit-packed falsum boolean function.
+
+        Args:
+            vector_size (int): The number of worlds in the mask.
+
+        Returns:
+            int: A mask whose **vector_size** bits are falsum.
+        """
+        return 0
+
+    @staticmethod
+    def truth_mask_algorithm(vector_size: int = 1) -> int:
+        """The bit-packed truth boolean function.
+
+        Args:
+            vector_size (int): The number of worlds in the mask.
+
+        Returns:
+            int: A mask whose **vector_size** bits are truth.
+        """
+        return (1 << vector_size) - 1
+
+    @staticmethod
+    def negation_mask_algorithm(m: int, vector_size: int = 1) -> int:
+        """The bit-packed negation boolean function.
+
+        Args:
+            m (int): A mask of boolean values.
+            vector_size (int): The number of worlds in the mask.
+
+        Returns:
+            int: The mask of the negation of **m**.
+        """
+        return m ^ ((1 << vector_size) - 1)
+
+    @staticmethod
+    def conjunction_mask_algorithm(m1: int, m2: int, vector_size: int = 1) -> int:
+        """The bit-packed conjunction boolean function.
+
+        Args:
+            m1 (int): A mask of boolean values.
+            m2 (int): A mask of boolean values.
+            vector_size (int): The number of worlds in the masks.
+
+        Returns:
+            int: The mask of the conjunction of **m1** and **m2**.
+        """
+        return m1 & m2
+
+    @staticmethod
+    def disjunction_mask_algorithm(m1: int, m2: int, vector_size: int = 1) -> int:
+        """The bit-packed disjunction boolean function.
+
+        Args:
+            m1 (int): A mask of boolean values.
+            m2 (int): A mask of boolean values.
+            vector_size (int): The number of worlds in the masks.
+
+        Returns:
+            int: The mask of the disjunction of **m1** and **m2**.
+        """
+        return m1 | m2
+
+    @staticmethod
+    def n_ary_conjunction_mask_algorithm(*masks: int, vector_size: int = 1) -> int:
+        """The bit-packed n-ary conjunction boolean function.
+
+        Args:
+            masks (int): Masks of boolean values.
+            vector_size (int): The number of worlds in the masks.
+
+        Returns:
+            int: The mask of the conjunction of **masks**.
+        """
+        result = (1 << vector_size) - 1
+        for m in masks:
+            result &= m
+        return result
+
+    @staticmethod
+    def n_ary_disjunction_mask_algorithm(*masks: int, vector_size: int = 1) -> int:
+        """The bit-packed n-ary disjunction boolean function.
+
+        Args:
+            masks (int): Masks of boolean values.
+            vector_size (int): The number of worlds in the masks.
+
+        Returns:
+            int: The mask of the disjunction of **masks**.
+        """
+        result = 0
+        for m in masks:
+            result |= m
+        return result
+
     # Functions.
     truth = Core.Concept(
         scope_key=_SCOPE_BA1, language_key=_LANGUAGE_BA1, base_key='truth',
         facets=[Facets.function, Facets.programmatic_function, Facets.programmatic_constant],
-        codomain=b, algorithm=truth_algorithm,
+        codomain=b, algorithm=truth_algorithm, mask_algorithm=truth_mask_algorithm,
+        mask_expression='{mask}',
         base_name=Glyphs.logical_truth,
         tokens=['⊤', 'truth', 'true', 't', '1'], # The last tokens are ambiguous!
         arity=0, python_value=True)
@@ -1475,7 +2165,8 @@ class BA1:
     falsum = Core.Concept(
         scope_key=_SCOPE_BA1, language_key=_LANGUAGE_BA1, base_key='falsum',
         facets=[Facets.function, Facets.programmatic_function, Facets.programmatic_constant],
-        codomain=b, algorithm=falsum_algorithm,
+        codomain=b, algorithm=falsum_algorithm, mask_algorithm=falsum_mask_algorithm,
+        mask_expression='0',
         base_name=Glyphs.logical_falsum,
         tokens=['⊥', 'falsum', 'false', 'f', '0'],
         arity=0, python_value=False)
@@ -1483,7 +2174,8 @@ class BA1:
     negation = Core.Concept(
         scope_key=_SCOPE_BA1, language_key=_LANGUAGE_BA1, base_key='negation',
         facets=[Facets.function, Facets.programmatic_function, Facets.programmatic_unary_operator],
-        codomain=b, algorithm=negation_algorithm,
+        codomain=b, algorithm=negation_algorithm, mask_algorithm=negation_mask_algorithm,
+        mask_expression='({mask} ^ {0})',
         base_name=Glyphs.logical_negation,
         tokens=['¬', 'not', 'lnot'],
         domain=b, arity=1)
@@ -1491,7 +2183,8 @@ class BA1:
     conjunction = Core.Concept(
         scope_key=_SCOPE_BA1, language_key=_LANGUAGE_BA1, base_key='conjunction',
         facets=[Facets.function, Facets.programmatic_function, Facets.programmatic_binary_operator],
-        codomain=b, algorithm=conjunction_algorithm,
+        codomain=b, algorithm=conjunction_algorithm, mask_algorithm=conjunction_mask_algorithm,
+        mask_expression='({0} & {1})',
         base_name=Glyphs.logical_conjunction,
         tokens=['∧', 'and', 'land'],
         domain=b, arity=2)
@@ -1499,11 +2192,30 @@ class BA1:
     disjunction = Core.Concept(
         scope_key=_SCOPE_BA1, language_key=_LANGUAGE_BA1, base_key='disjunction',
         facets=[Facets.function, Facets.programmatic_function, Facets.programmatic_binary_operator],
-        codomain=b, algorithm=disjunction_algorithm,
+        codomain=b, algorithm=disjunction_algorithm, mask_algorithm=disjunction_mask_algorithm,
+        mask_expression='({0} | {1})',
         base_name=Glyphs.logical_disjunction,
         tokens=['∨', 'or', 'lor'],
         domain=b, arity=2)
 
+    n_ary_conjunction = Core.Concept(
+        scope_key=_SCOPE_BA1, language_key=_LANGUAGE_BA1, base_key='n_ary_conjunction',
+        facets=[Facets.function, Facets.programmatic_function, Facets.programmatic_n_ary_function],
+        codomain=b, algorithm=n_ary_conjunction_algorithm, mask_algorithm=n_ary_conjunction_mask_algorithm,
+        mask_expression='&',
+        base_name=Glyphs.logical_n_ary_conjunction,
+        tokens=['⋀', 'big_and'],
+        domain=b)
+
+    n_ary_disjunction = Core.Concept(
+        scope_key=_SCOPE_BA1, language_key=_LANGUAGE_BA1, base_key='n_ary_disjunction',
+        facets=[Facets.function, Facets.programmatic_function, Facets.programmatic_n_ary_function],
+        codomain=b, algorithm=n_ary_disjunction_algorithm, mask_algorithm=n_ary_disjunction_mask_algorithm,
+        mask_expression='|',
+        base_name=Glyphs.logical_n_ary_disjunction,
+        tokens=['⋁', 'big_or'],
+        domain=b)
+
     @staticmethod
     def get_bn_domain(n):
         """Returns the n-tuple codomain 𝔹ⁿ where n is a natural number > 0.
@@ -1545,75 +2257,2213 @@ class BA1:
         return [(BA1.truth if (integer_value & 1 << c != 0) else BA1.falsum) for integer_value in range(0, 2 ** n)]
 
     @staticmethod
-    def satisfaction_index(phi: Core.Concept, variables_list=None):
-        """Compute the **satisfaction indexes** (:math:`\text{sat}_I`) of a Boolean phi (:math:`\phi`).
+    def get_boolean_combinations_mask(n, c, offset=0, vector_size=None):
+        """The bit-packed equivalent of **get_boolean_combinations_column**.
 
-        Alias:
-        **sat_i**
+        Bit i of the mask is set if and only if bit c of the world index offset + i is set,
+        i.e. the mask is the column of the c-th atomic variable in the block of worlds [offset, offset + vector_size).
+        The mask is built by doubling a single period of the column,
+        which costs n big-integer operations instead of 2ⁿ list slots.
 
-        Definition:
-        Let :math:`\phi` be a Boolean phi.
-        :math:`\text{sat}_I \colon= ` the truth value of :math:`\phi` in all possible worlds.
+        Args:
+            n (int): The number of atomic variables.
+            c (int): The index of the atomic variable.
+            offset (int): The index of the first world of the block, a multiple of **vector_size**.
+            vector_size (int): The number of worlds in the block, a power of 2. Defaults to 2ⁿ.
+        """
+        if vector_size is None:
+            vector_size = 1 << n
+        period = 1 << c
+        if period >= vector_size:
+            # The atomic variable is constant in the block.
+            return (1 << vector_size) - 1 if (offset >> c) & 1 else 0
+        mask = ((1 << period) - 1) << period
+        width = period << 1
+        while width < vector_size:
+            mask |= mask << width
+            width <<= 1
+        return mask
+
+    @staticmethod
+    def decode_mask(mask: int, vector_size: int) -> typing.List[Core.Concept]:
+        """Decode a bit-packed mask into a vector of Boolean constants.
 
         Args:
-            phi (BooleanFormula): The Boolean phi :math:`\phi` .
+            mask (int): A mask whose bit i is the truth value in world i.
+            vector_size (int): The number of worlds in the mask.
+
+        Returns:
+            typing.List[BooleanConstant]: The vector of **vector_size** Boolean constants.
+        """
+        bits = format(mask, f'0{vector_size}b')[::-1] if vector_size > 0 else ''
+        return [BA1.truth if bit == '1' else BA1.falsum for bit in bits]
+
+    @staticmethod
+    def satisfaction_mask(phi: Core.Concept, variables_list=None, results=None, offset=0, vector_size=None,
+                          positions=None) -> int:
+        """Compute the bit-packed **satisfaction indexes** of a Boolean phi.
+
+        Every atomic variable column is an arbitrary-precision **int** mask,
+        and every operator is applied with its bit-packed algorithm (**mask_algorithm**),
+        i.e. with one bitwise operation per phi node instead of one per phi node and world.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+            variables_list (list): The ordered atomic variables that define the worlds.
+            results (dict): The per-call result table, keyed by qualified key.
+                Every distinct subformula is evaluated once, even if it appears several times in the phi.
+            offset (int): The index of the first world of the evaluated block, a multiple of **vector_size**.
+            vector_size (int): The number of worlds of the evaluated block, a power of 2. Defaults to all 2ⁿ worlds.
+            positions (dict): Conditional: the positions of the atomic variables (see **Core.get_variable_positions**).
+
+        Returns:
+            int: A mask whose bit i is the truth value of **phi** in world offset + i.
         """
-        # Retrieve the computed results
-        # TODO: Check that all phi are Boolean phi. Otherwise, the phi
-        #   may not return a Boolean value, forbidding the computation of a satisfaction set.
         if variables_list is None:
             variables_list = Core.list_formula_atomic_variables(phi)
+        if positions is None:
+            positions = Core.get_variable_positions(variables_list)
+        if results is None:
+            results = {}
+        elif phi.qualified_key in results:
+            return results[phi.qualified_key]
         variables_number = len(variables_list)
-        arguments_number = phi.arity
-        argument_vectors = [None] * arguments_number
-        Log.log_debug(arguments_number=arguments_number)
-        for argument_index in range(0, arguments_number):
-            argument = phi.arguments[argument_index]
-            Log.log_debug(
-                argument=argument,
-                argument_index=argument_index,
-                argument_type=type(argument),
-                argument_codomain=argument.codomain,
-                argument_facets=argument.facets)
-            if has_facet(argument, Facets.programmatic_function_call) and \
-                    argument.codomain == BA1.b:
-                # This argument is a Boolean Formula.
-                Log.log_debug('This argument is a Boolean Formula')
-                # Recursively compute the satisfaction set of that phi,
-                # restricting the variables list to the subset of necessary variables.
-                vector = BA1.satisfaction_index(argument, variables_list=variables_list)
-                argument_vectors[argument_index] = vector
-            elif has_facet(argument, Facets.atomic_variable) and \
-                    argument.codomain == BA1.b:
-                # This argument is a Boolean atomic proposition.
-                Log.log_debug('This argument is a Boolean atomic proposition')
-                # We want to retrieve its values from the corresponding bit combinations column.
-                # But we need the vector to be relative to variables_list.
-                # Thus we must first find the position of this atomic variable,
-                # in the variables_list.
-                atomic_variable_index = variables_list.index(argument)
-                vector = BA1.get_boolean_combinations_column(variables_number, atomic_variable_index)
-                Log.log_debug(vector=vector)
-                argument_vectors[argument_index] = vector
+        if vector_size is None:
+            vector_size = 2 ** variables_number
+        if has_facet(phi, Facets.atomic_variable) and phi.codomain == BA1.b:
+            atomic_variable_index = positions[phi.qualified_key]
+            mask = BA1.get_boolean_combinations_mask(
+                variables_number, atomic_variable_index, offset=offset, vector_size=vector_size)
+        elif has_facet(phi, Facets.programmatic_function_call) and phi.codomain == BA1.b:
+            mask_algorithm = phi.system_function.mask_algorithm
+            if mask_algorithm is None:
+                Log.log_error('Missing mask_algorithm property', phi=phi, system_function=phi.system_function)
+            argument_masks = [BA1.satisfaction_mask(argument, variables_list=variables_list, results=results,
+                                                    offset=offset, vector_size=vector_size, positions=positions)
+                              for argument in phi.arguments]
+            mask = mask_algorithm(*argument_masks, vector_size=vector_size)
+        else:
+            Log.log_error('Unexpected type',
+                          phi=phi, t=type(phi), facets=phi.facets, codomain=phi.codomain)
+        results[phi.qualified_key] = mask
+        return mask
+
+    @staticmethod
+    def evaluate(phi: Core.Concept, assignment: dict, results: dict = None) -> Core.Concept:
+        """Compute the truth value of a Boolean phi in a single world.
+
+        The phi is evaluated as a DAG: every distinct subformula is evaluated at most once,
+        and conjunctions and disjunctions short-circuit,
+        i.e. the cost is at most linear in the size of the phi, and independent of the 2ⁿ worlds.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+            assignment (dict): The world, as a mapping from atomic variables to Boolean constants (or python bools).
+            results (dict): Conditional: the per-call result table, keyed by handle.
+
+        Returns:
+            BooleanConstant: **BA1.truth** or **BA1.falsum**.
+        """
+        if results is None:
+            results = {}
+        return BA1._evaluate(phi, assignment, results)
+
+    @staticmethod
+    def _evaluate(phi: Core.Concept, assignment: dict, results: dict) -> Core.Concept:
+        value = results.get(phi.handle)
+        if value is not None:
+            return value
+        if has_facet(phi, Facets.atomic_variable):
+            value = assignment.get(phi)
+            if value is BA1.truth or value is True:
+                value = BA1.truth
+            elif value is BA1.falsum or value is False:
+                value = BA1.falsum
             else:
-                Log.log_error('Unexpected type',
-                              argument=argument, t=type(argument), facets=argument.facets,
-                              codomain=argument.codomain)
-        Log.log_debug(argument_vectors=argument_vectors)
-        output_vector = None
-        Log.log_debug(phi=phi, arity=phi.arity, system_function=phi.system_function)
-        match phi.arity:
-            case 0:
-                output_vector = phi.system_function.algorithm(vector_size=2 ** variables_number)
-            case 1:
-                output_vector = phi.system_function.algorithm(argument_vectors[0])
+                Log.log_error('The assignment has no Boolean value for this atomic variable', phi=phi, value=value)
+        elif has_facet(phi, Facets.programmatic_function_call) and phi.codomain == BA1.b:
+            system_function = phi.system_function
+            if system_function is BA1.conjunction or system_function is BA1.n_ary_conjunction:
+                value = BA1.truth
+                for argument in phi.arguments:
+                    if BA1._evaluate(argument, assignment, results) is BA1.falsum:
+                        value = BA1.falsum
+                        break
+            elif system_function is BA1.disjunction or system_function is BA1.n_ary_disjunction:
+                value = BA1.falsum
+                for argument in phi.arguments:
+                    if BA1._evaluate(argument, assignment, results) is BA1.truth:
+                        value = BA1.truth
+                        break
+            elif system_function is BA1.negation:
+                value = BA1.falsum if BA1._evaluate(phi.arguments[0], assignment, results) is BA1.truth else BA1.truth
+            elif system_function is BA1.truth or system_function is BA1.falsum:
+                value = system_function
+            elif phi.arity == 0:
+                value = system_function.algorithm(vector_size=1)[0]
+            else:
+                # Fall back on the vectorized algorithm with vectors of size 1.
+                value = system_function.algorithm(
+                    *([BA1._evaluate(argument, assignment, results)] for argument in phi.arguments))[0]
+        else:
+            Log.log_error('Unexpected type',
+                          phi=phi, t=type(phi), facets=phi.facets, codomain=phi.codomain)
+        results[phi.handle] = value
+        return value
+
+    @staticmethod
+    def satisfaction_mask_from_arena(arena: Core.FormulaArena, node: int, variables_list=None,
+                                     offset: int = 0, vector_size: int = None) -> int:
+        """Compute the bit-packed **satisfaction indexes** of a Boolean phi stored in a formula arena.
+
+        The nodes of the sub-DAG of **node** are evaluated in a single pass over the arena arrays,
+        without materialising **Concept** objects.
+
+        Args:
+            arena (Core.FormulaArena): The formula arena.
+            node (int): The node id of the Boolean phi.
+            variables_list (list): The ordered atomic variables that define the worlds.
+            offset (int): The index of the first world of the evaluated block, a multiple of **vector_size**.
+            vector_size (int): The number of worlds of the evaluated block, a power of 2. Defaults to all 2ⁿ worlds.
+
+        Returns:
+            int: A mask whose bit i is the truth value of the phi in world offset + i.
+        """
+        if variables_list is None:
+            variables_list = arena.list_atomic_variables(node)
+        positions = Core.get_variable_positions(variables_list)
+        variables_number = len(variables_list)
+        if vector_size is None:
+            vector_size = 2 ** variables_number
+        mask_algorithms = [system_function.mask_algorithm for system_function in arena._operator_table]
+        operators, arities, offsets, children = arena._operators, arena._arities, arena._offsets, arena._children
+        masks = {}
+        for i in arena.list_reachable_nodes(node):
+            operator = operators[i]
+            if operator == -1:
+                masks[i] = BA1.get_boolean_combinations_mask(
+                    variables_number, positions[arena._variable_table[offsets[i]].qualified_key],
+                    offset=offset, vector_size=vector_size)
+            else:
+                first = offsets[i]
+                masks[i] = mask_algorithms[operator](
+                    *(masks[argument] for argument in children[first:first + arities[i]]), vector_size=vector_size)
+        return masks[node]
+
+    @staticmethod
+    def get_formula_program(phi: Core.Concept, variables_list=None) -> typing.List[tuple]:
+        """Return a compact, picklable description of a Boolean phi.
+
+        The program is the list of the distinct nodes of the phi DAG in topological order.
+        An atomic variable node is (None, c) where c is its index in **variables_list**.
+        A function call node is (k, (i, j, ...)) where k is the qualified key of the system function,
+        and i, j, ... are the indexes of the argument nodes in the program. The last node is **phi**.
+        """
+        if variables_list is None:
+            variables_list = Core.list_formula_atomic_variables(phi)
+        positions = Core.get_variable_positions(variables_list)
+        program = []
+        indexes = {}
+
+        def append(o):
+            if o.handle not in indexes:
+                if has_facet(o, Facets.atomic_variable) and o.codomain == BA1.b:
+                    program.append((None, positions[o.qualified_key]))
+                elif has_facet(o, Facets.programmatic_function_call) and o.codomain == BA1.b:
+                    arguments = tuple(append(argument) for argument in o.arguments)
+                    program.append((o.system_function.qualified_key, arguments))
+                else:
+                    Log.log_error('Unexpected type', o=o, t=type(o), facets=o.facets, codomain=o.codomain)
+                indexes[o.handle] = len(program) - 1
+            return indexes[o.handle]
+
+        append(phi)
+        return program
+
+    @staticmethod
+    def evaluate_program_mask(program, variables_number: int, offset: int = 0, vector_size: int = None) -> int:
+        """Compute the bit-packed truth values of a phi program (see **get_formula_program**) in a block of worlds.
+
+        Args:
+            program (list): The phi program.
+            variables_number (int): The number of atomic variables that define the worlds.
+            offset (int): The index of the first world of the block, a multiple of **vector_size**.
+            vector_size (int): The number of worlds of the block, a power of 2. Defaults to all 2ⁿ worlds.
+        """
+        if vector_size is None:
+            vector_size = 2 ** variables_number
+        masks = []
+        for function_key, arguments in program:
+            if function_key is None:
+                masks.append(BA1.get_boolean_combinations_mask(
+                    variables_number, arguments, offset=offset, vector_size=vector_size))
+            else:
+                mask_algorithm = _concept_database[function_key].mask_algorithm
+                masks.append(mask_algorithm(*(masks[i] for i in arguments), vector_size=vector_size))
+        return masks[-1]
+
+    PARALLEL_WORLDS_THRESHOLD = 2 ** 22
+    """The number of worlds below which **satisfaction_mask_parallel** falls back on **satisfaction_mask**.
+
+    Below that size, starting the worker processes costs more than the evaluation itself."""
+
+    PARALLEL_SHARDS_PER_WORKER = 1
+    """The number of shards per worker of **satisfaction_mask_parallel**."""
+
+    PARALLEL_BLOCK_SIZE = 2 ** 8
+    """The number of worlds that the shards of **satisfaction_mask_parallel** are aligned to, a power of 2."""
+
+    _worker_program = None
+    """The phi program and number of variables of a worker process of **satisfaction_mask_parallel**."""
+
+    @staticmethod
+    def split_worlds(worlds_number: int, shards_number: int, block_size: int = None) -> typing.List[tuple]:
+        """Split the worlds into contiguous shards of balanced sizes, aligned to blocks of **block_size** worlds.
+
+        Args:
+            worlds_number (int): The number of worlds, a power of 2.
+            shards_number (int): The maximal number of shards.
+            block_size (int): The number of worlds the shards are aligned to, a power of 2.
+                Defaults to **PARALLEL_BLOCK_SIZE**.
+
+        Returns:
+            list: The (offset, size) pairs of the shards, in order.
+        """
+        if block_size is None:
+            block_size = BA1.PARALLEL_BLOCK_SIZE
+        block_size = min(block_size, worlds_number)
+        blocks_number = worlds_number // block_size
+        shards_number = max(1, min(shards_number, blocks_number))
+        # The first shards receive the remaining blocks, one each.
+        quotient, remainder = divmod(blocks_number, shards_number)
+        shards = []
+        offset = 0
+        for i in range(shards_number):
+            size = (quotient + (1 if i < remainder else 0)) * block_size
+            shards.append((offset, size))
+            offset += size
+        return shards
+
+    @staticmethod
+    def _initialize_worker(program, variables_number: int):
+        """Store the phi program in a worker process, once, when the process starts."""
+        BA1._worker_program = (program, variables_number)
+
+    @staticmethod
+    def _evaluate_worker_shard(offset: int, shard_size: int) -> int:
+        """Evaluate the phi program of the worker process in a shard of worlds.
+
+        The shard is evaluated as a sequence of aligned blocks whose sizes are powers of 2, as large as possible."""
+        program, variables_number = BA1._worker_program
+        mask = 0
+        position = offset
+        end = offset + shard_size
+        while position < end:
+            # The largest power of 2 that divides position, and fits in the shard.
+            vector_size = position & -position or 1 << (end - 1).bit_length()
+            while vector_size > end - position:
+                vector_size >>= 1
+            mask |= BA1.evaluate_program_mask(
+                program, variables_number, offset=position, vector_size=vector_size) << (position - offset)
+            position += vector_size
+        return mask
+
+    @staticmethod
+    def satisfaction_mask_parallel(phi: Core.Concept, variables_list=None, workers=None, shard_size=None) -> int:
+        """Compute the bit-packed **satisfaction indexes** of a Boolean phi on multiple cores.
+
+        The 2ⁿ worlds are split into shards of contiguous worlds that are evaluated by a process pool.
+        Workers receive the compact phi program (see **get_formula_program**) once, when they start,
+        and the shard masks are concatenated in order.
+        Below **PARALLEL_WORLDS_THRESHOLD** worlds, or with a single worker, the phi is evaluated sequentially.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+            variables_list (list): The ordered atomic variables that define the worlds.
+            workers (int): The number of worker processes. Defaults to the number of processors.
+            shard_size (int): The number of worlds per shard, a power of 2.
+                Defaults to **PARALLEL_SHARDS_PER_WORKER** balanced shards per worker (see **split_worlds**).
+
+        Returns:
+            int: A mask whose bit i is the truth value of **phi** in world i.
+        """
+        if variables_list is None:
+            variables_list = Core.list_formula_atomic_variables(phi)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        variables_number = len(variables_list)
+        worlds_number = 2 ** variables_number
+        if shard_size is None:
+            shards = BA1.split_worlds(worlds_number, workers * BA1.PARALLEL_SHARDS_PER_WORKER)
+        else:
+            if not isinstance(shard_size, int) or shard_size < 1 or shard_size & (shard_size - 1) != 0:
+                Log.log_error('shard_size must be a power of 2', shard_size=shard_size)
+            shard_size = min(shard_size, worlds_number)
+            shards = [(offset, shard_size) for offset in range(0, worlds_number, shard_size)]
+        if workers == 1 or len(shards) == 1 or worlds_number < BA1.PARALLEL_WORLDS_THRESHOLD:
+            return BA1.satisfaction_mask(phi, variables_list=variables_list)
+        program = BA1.get_formula_program(phi, variables_list=variables_list)
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(workers, len(shards)),
+                initializer=BA1._initialize_worker, initargs=(program, variables_number)) as executor:
+            shard_masks = executor.map(BA1._evaluate_worker_shard, *zip(*shards))
+            if all(size % 8 == 0 for _, size in shards):
+                # Concatenate bytes in linear time, instead of shifting an ever growing int.
+                return int.from_bytes(b''.join(shard_mask.to_bytes(size // 8, 'little')
+                                               for shard_mask, (_, size) in zip(shard_masks, shards)), 'little')
+            mask = 0
+            for shard_mask, (offset, _) in zip(shard_masks, shards):
+                mask |= shard_mask << offset
+            return mask
+
+    @staticmethod
+    def compile(phi: Core.Concept, variables_list=None) -> typing.Callable:
+        """Compile a Boolean phi to a python function of its atomic variables.
+
+        The python source of the function is a straight-line sequence of bitwise operations,
+        generated from the phi program (see **get_formula_program**) and the **mask_expression** of system functions.
+        It is compiled once, and cached on the phi.
+
+        The compiled function takes one positional argument per atomic variable of **variables_list**,
+        the keyword argument **mask**, the all-truth mask (default: 1),
+        and the keyword argument **vector_size**, the number of worlds of the block (default: 1),
+        that is passed to the bit-packed algorithms of system functions that have no **mask_expression**.
+        Arguments may be 0/1 values in a single world, or masks of the same block of worlds,
+        or numpy bool arrays of the same length, in which case **mask** is an all-truth numpy bool array.
+
+        Example:
+            phi = f(BA1.conjunction, x, f(BA1.negation, y))
+            function = BA1.compile(phi, variables_list=[x, y])
+            function(1, 0)  # Returns 1
+            function(0b0101, 0b0011, mask=0b1111, vector_size=4)  # Returns 0b0100
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+            variables_list (list): The ordered atomic variables that are the arguments of the function.
+        """
+        if variables_list is None:
+            variables_list = Core.list_formula_atomic_variables(phi)
+        key = tuple(variable.qualified_key for variable in variables_list)
+        compilations = phi.get_property('compilations')
+        if compilations is None:
+            compilations = {}
+            phi.set_property('compilations', compilations)
+        elif key in compilations:
+            return compilations[key]
+        program = BA1.get_formula_program(phi, variables_list=variables_list)
+        parameters = [f'v{i}' for i in range(len(variables_list))]
+        namespace = {}
+        names = []
+        lines = []
+        for i, (function_key, arguments) in enumerate(program):
+            if function_key is None:
+                names.append(parameters[arguments])
+                continue
+            system_function = _concept_database[function_key]
+            argument_names = [names[j] for j in arguments]
+            if system_function.mask_expression is not None and \
+                    has_facet(system_function, Facets.programmatic_n_ary_function) and len(argument_names) > 0:
+                expression = '(' + f' {system_function.mask_expression} '.join(argument_names) + ')'
+            elif system_function.mask_expression is not None and \
+                    not has_facet(system_function, Facets.programmatic_n_ary_function):
+                expression = system_function.mask_expression.format(*argument_names, mask='mask')
+            else:
+                # Fall back on the bit-packed algorithm.
+                namespace['call_mask_algorithm'] = BA1.call_mask_algorithm
+                namespace[f'a{i}'] = system_function.mask_algorithm
+                expression = f'call_mask_algorithm({", ".join([f"a{i}"] + argument_names + ["mask=mask", "vector_size=vector_size"])})'
+            lines.append(f'    n{i} = {expression}')
+            names.append(f'n{i}')
+        lines.append(f'    return {names[-1]}')
+        source = f'def compiled_phi({", ".join(parameters + ["mask=1", "vector_size=1"])}):\n' + '\n'.join(lines) + '\n'
+        exec(compile(source, f'<naive compiled phi {phi.qualified_key}>', 'exec'), namespace)
+        function = namespace['compiled_phi']
+        function.source = source
+        compilations[key] = function
+        return function
+
+    @staticmethod
+    def call_mask_algorithm(mask_algorithm, *arguments, mask=1, vector_size: int = 1):
+        """Call a bit-packed algorithm on int masks, or on numpy bool arrays.
+
+        numpy arguments are packed into int masks of **vector_size** worlds, and the result is unpacked,
+        hence the bit-packed algorithm never mixes python ints with numpy arrays.
+
+        Args:
+            mask_algorithm (function): The bit-packed algorithm.
+            arguments: The int masks, or the numpy bool arrays (or bool scalars) of the arguments.
+            mask: The all-truth mask, an int, or an all-truth numpy bool array for numpy arguments.
+            vector_size (int): The number of worlds of the block.
+        """
+        if isinstance(mask, int):
+            return mask_algorithm(*arguments, vector_size=vector_size)
+        import numpy  # Optional dependency, only necessary for numpy columns.
+        masks = [int.from_bytes(numpy.packbits(
+            numpy.broadcast_to(numpy.asarray(argument, dtype=bool), (vector_size,)), bitorder='little').tobytes(),
+            'little') for argument in arguments]
+        result = mask_algorithm(*masks, vector_size=vector_size) & ((1 << vector_size) - 1)
+        return numpy.unpackbits(numpy.frombuffer(result.to_bytes((vector_size + 7) // 8, 'little'), dtype=numpy.uint8),
+                                count=vector_size, bitorder='little').astype(bool)
+
+    @staticmethod
+    def evaluate_columns(phi: Core.Concept, columns: dict, length: int = None, variables_list=None):
+        """Evaluate a Boolean phi over a batch of records, given as columns.
+
+        The phi is evaluated with the python function compiled by **compile**,
+        i.e. with one vectorized bitwise operation per phi node, instead of one operation per phi node and record.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+            columns (dict): A mapping from the atomic variables of **phi** to their columns.
+                Columns are either all numpy bool arrays,
+                or all bit-packed python ints whose bit i is the value in record i.
+            length (int): The number of records. Mandatory for bit-packed columns.
+            variables_list (list): Conditional: the atomic variables of **phi**.
+
+        Returns:
+            The result column, of the same type as **columns**.
+        """
+        if variables_list is None:
+            variables_list = Core.list_formula_atomic_variables(phi)
+        missing_variables = [variable for variable in variables_list if variable not in columns]
+        if missing_variables:
+            Log.log_error('Some atomic variables have no column', missing_variables=missing_variables)
+        values = [columns[variable] for variable in variables_list]
+        function = BA1.compile(phi, variables_list=variables_list)
+        if all(isinstance(value, int) for value in values) and not (len(values) == 0 and length is None):
+            if length is None:
+                Log.log_error('The length of bit-packed columns is mandatory')
+            return function(*values, mask=(1 << length) - 1, vector_size=length)
+        else:
+            import numpy  # Optional dependency, only necessary for numpy columns.
+            values = [numpy.asarray(value, dtype=bool) for value in values]
+            if length is None:
+                if len(values) == 0:
+                    Log.log_error('The length of columns is mandatory if phi has no atomic variable')
+                length = len(values[0])
+            if any(value.shape != (length,) for value in values):
+                Log.log_error('Columns must be 1-dimensional arrays of the same length', length=length)
+            result = function(*values, mask=numpy.ones(length, dtype=bool), vector_size=length)
+            # Constant phi return scalars, that must be broadcast to the column length.
+            return numpy.broadcast_to(numpy.asarray(result, dtype=bool), (length,)).copy()
+
+    @staticmethod
+    def concatenate_masks(masks, vector_size: int) -> int:
+        """Concatenate in order consecutive masks of **vector_size** worlds each."""
+        if vector_size % 8 == 0:
+            # Concatenate bytes in linear time, instead of shifting an ever growing int.
+            return int.from_bytes(b''.join(mask.to_bytes(vector_size // 8, 'little') for mask in masks), 'little')
+        mask = 0
+        for i, shard_mask in enumerate(masks):
+            mask |= shard_mask << (i * vector_size)
+        return mask
+
+    @staticmethod
+    def broadcast_mask(mask: int, support, target_support, columns: dict = None) -> int:
+        """Broadcast a mask from the worlds of its support variables to the worlds of a superset of variables.
+
+        Args:
+            mask (int): A mask whose bit i is a truth value in world i of the **support** variables.
+            support (tuple): The sorted indexes of the support variables, among all atomic variables.
+            target_support (tuple): The sorted indexes of the target variables, a superset of **support**.
+            columns (dict): Conditional: a cache of the column masks used by the broadcast.
+
+        Returns:
+            int: The mask whose bit i is the truth value in world i of the **target_support** variables.
+        """
+        if columns is None:
+            columns = {}
+        if len(support) == 0:
+            # Constants are scalars.
+            return (1 << (1 << len(target_support))) - 1 if mask else 0
+        support = list(support)
+        for target_position, variable in enumerate(target_support):
+            if target_position < len(support) and support[target_position] == variable:
+                continue
+            # Insert the new variable at position q of the current support:
+            # world indexes are spread apart by moving their bits >= q one position up,
+            # and the resulting mask is duplicated for both values of the new variable.
+            q = target_position
+            k = len(support)
+            for c in range(k - 1, q - 1, -1):
+                if (k + 1, c) not in columns:
+                    columns[(k + 1, c)] = BA1.get_boolean_combinations_mask(k + 1, c)
+                column = columns[(k + 1, c)]
+                mask = (mask & ~column) | ((mask & column) << (1 << c))
+            mask |= mask << (1 << q)
+            support.insert(q, variable)
+        return mask
+
+    @staticmethod
+    def satisfaction_mask_by_support(phi: Core.Concept, variables_list=None) -> int:
+        """Compute the bit-packed **satisfaction indexes** of a Boolean phi, evaluating subformulae on their support.
+
+        Every distinct subformula is evaluated only in the worlds of its own support variables,
+        and its mask is broadcast to the worlds of its parent on demand (see **broadcast_mask**).
+        Constants are evaluated as scalars.
+        Hence, wide phi composed of many small independent subformulae allocate far less than 2ⁿ bits per node.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+            variables_list (list): The ordered atomic variables that define the worlds.
+
+        Returns:
+            int: A mask whose bit i is the truth value of **phi** in world i.
+        """
+        if variables_list is None:
+            variables_list = Core.list_formula_atomic_variables(phi)
+        positions = Core.get_variable_positions(variables_list)
+        results = {}
+        columns = {}
+
+        def evaluate(o):
+            if o.handle not in results:
+                if has_facet(o, Facets.atomic_variable) and o.codomain == BA1.b:
+                    results[o.handle] = 0b10, (positions[o.qualified_key],)
+                elif has_facet(o, Facets.programmatic_function_call) and o.codomain == BA1.b:
+                    arguments = [evaluate(argument) for argument in o.arguments]
+                    support = tuple(sorted(set().union(*(s for _, s in arguments))))
+                    masks = [BA1.broadcast_mask(m, s, support, columns=columns) for m, s in arguments]
+                    mask = o.system_function.mask_algorithm(*masks, vector_size=1 << len(support))
+                    results[o.handle] = mask, support
+                else:
+                    Log.log_error('Unexpected type', o=o, t=type(o), facets=o.facets, codomain=o.codomain)
+            return results[o.handle]
+
+        mask, support = evaluate(phi)
+        return BA1.broadcast_mask(mask, support, tuple(range(len(variables_list))), columns=columns)
+
+    @staticmethod
+    def flatten_associative_operators(phi: Core.Concept) -> Core.Concept:
+        """Convert the chains of conjunctions (resp. disjunctions) of a Boolean phi to n-ary conjunctions (resp. disjunctions).
+
+        E.g. ((x ∧ y) ∧ (z ∧ ¬x)) becomes ⋀(x, y, z, ¬x).
+        The phi is walked with an explicit stack, hence deep binary chains do not hit the recursion limit.
+        Subformulae that are left unchanged are reused as is.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+
+        Returns:
+            BooleanFormula: An equivalent Boolean phi, without nested associative operators.
+        """
+        n_ary_functions = {
+            BA1.conjunction.handle: BA1.n_ary_conjunction,
+            BA1.n_ary_conjunction.handle: BA1.n_ary_conjunction,
+            BA1.disjunction.handle: BA1.n_ary_disjunction,
+            BA1.n_ary_disjunction.handle: BA1.n_ary_disjunction}
+
+        def get_n_ary_function(o):
+            if has_facet(o, Facets.programmatic_function_call):
+                return n_ary_functions.get(o.system_function.handle)
+            return None
+
+        def list_operands(o):
+            n_ary_function = get_n_ary_function(o)
+            if n_ary_function is None:
+                return list(o.arguments) if has_facet(o, Facets.programmatic_function_call) else []
+            operands = []
+            pending = [o]
+            while len(pending) > 0:
+                p = pending.pop()
+                if get_n_ary_function(p) is n_ary_function:
+                    pending.extend(reversed(p.arguments))
+                else:
+                    operands.append(p)
+            return operands
+
+        results = {}
+        stack = [(phi, None)]
+        while len(stack) > 0:
+            o, operands = stack.pop()
+            if o.handle in results:
+                continue
+            if operands is None:
+                operands = list_operands(o)
+                stack.append((o, operands))
+                stack.extend((operand, None) for operand in operands)
+                continue
+            flattened_operands = [results[operand.handle] for operand in operands]
+            n_ary_function = get_n_ary_function(o)
+            if n_ary_function is not None:
+                if n_ary_function is o.system_function and \
+                        all(x is y for x, y in zip(flattened_operands, o.arguments)) and \
+                        len(flattened_operands) == len(o.arguments):
+                    results[o.handle] = o
+                else:
+                    results[o.handle] = Core.write_formula(n_ary_function, *flattened_operands)
+            elif all(x is y for x, y in zip(flattened_operands, operands)):
+                results[o.handle] = o
+            else:
+                results[o.handle] = Core.write_formula(o.system_function, *flattened_operands)
+        return results[phi.handle]
+
+    @staticmethod
+    def simplify(phi: Core.Concept) -> Core.Concept:
+        """Return a smaller Boolean phi that is equivalent to **phi**.
+
+        The phi is simplified bottom-up with the following rules:
+            * constant folding: ¬⊤ = ⊥, ⊤ ∧ x = x, ⊥ ∧ x = ⊥, ⊥ ∨ x = x, ⊤ ∨ x = ⊤,
+            * double negation: ¬¬x = x,
+            * associativity: nested conjunctions (resp. disjunctions) are merged,
+            * idempotence: x ∧ x = x, x ∨ x = x,
+            * complement: x ∧ ¬x = ⊥, x ∨ ¬x = ⊤,
+            * absorption: x ∧ (x ∨ y) = x, x ∨ (x ∧ y) = x.
+
+        Subformulae are compared by structural signature (and not by qualified key),
+        and the operands of conjunctions and disjunctions are compared regardless of their order.
+        The result is memoised on every simplified subformula.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+
+        Returns:
+            BooleanFormula: The simplified phi. It may be **phi** itself, or one of its subformulae.
+        """
+        families = {
+            BA1.conjunction.handle: BA1.n_ary_conjunction,
+            BA1.n_ary_conjunction.handle: BA1.n_ary_conjunction,
+            BA1.disjunction.handle: BA1.n_ary_disjunction,
+            BA1.n_ary_disjunction.handle: BA1.n_ary_disjunction}
+        signatures = {}
+        node_signatures = {}
+
+        def get_family(o):
+            if has_facet(o, Facets.programmatic_function_call):
+                return families.get(o.system_function.handle)
+            return None
+
+        def is_call(o, system_function):
+            return has_facet(o, Facets.programmatic_function_call) and o.system_function is system_function
+
+        def get_signature(o):
+            # Structures are interned to small ints, so that signatures are cheap to compare and sort.
+            if o.handle not in node_signatures:
+                if has_facet(o, Facets.programmatic_function_call):
+                    arguments = tuple(get_signature(argument) for argument in o.arguments)
+                    family = get_family(o)
+                    if family is not None:
+                        structure = (family.handle, tuple(sorted(set(arguments))))
+                    else:
+                        structure = (o.system_function.handle, arguments)
+                else:
+                    structure = (o.handle,)
+                node_signatures[o.handle] = signatures.setdefault(structure, len(signatures))
+            return node_signatures[o.handle]
+
+        def rebuild(o, arguments):
+            if all(x is y for x, y in zip(arguments, o.arguments)):
+                return o
+            return Core.write_formula(o.system_function, *arguments)
+
+        def simplify_associative(o, family, arguments):
+            if family is BA1.n_ary_conjunction:
+                identity, annihilator, dual = BA1.truth, BA1.falsum, BA1.n_ary_disjunction
+            else:
+                identity, annihilator, dual = BA1.falsum, BA1.truth, BA1.n_ary_conjunction
+            operands = []
+            for argument in arguments:
+                if get_family(argument) is family:
+                    # Simplified arguments are already flat.
+                    operands.extend(argument.arguments)
+                else:
+                    operands.append(argument)
+            kept = []
+            seen = set()
+            for operand in operands:
+                if is_call(operand, identity):
+                    continue
+                if is_call(operand, annihilator):
+                    return Core.write_formula(annihilator)
+                signature = get_signature(operand)
+                if signature not in seen:
+                    seen.add(signature)
+                    kept.append(operand)
+            if any(is_call(operand, BA1.negation) and get_signature(operand.arguments[0]) in seen for operand in kept):
+                return Core.write_formula(annihilator)
+            kept = [operand for operand in kept
+                    if not (get_family(operand) is dual and
+                            any(get_signature(argument) in seen for argument in operand.arguments))]
+            if len(kept) == 0:
+                return Core.write_formula(identity)
+            elif len(kept) == 1:
+                return kept[0]
+            elif len(kept) == len(o.arguments) and all(x is y for x, y in zip(kept, o.arguments)):
+                return o
+            elif len(kept) == 2 and o.system_function is not family:
+                return Core.write_formula(o.system_function, *kept)
+            else:
+                return Core.write_formula(family, *kept)
+
+        def simplify(o):
+            simplification = o.get_property('simplification')
+            if simplification is not None:
+                return simplification
+            if has_facet(o, Facets.programmatic_function_call) and o.codomain == BA1.b:
+                arguments = [simplify(argument) for argument in o.arguments]
+                family = get_family(o)
+                if o.system_function is BA1.negation:
+                    argument = arguments[0]
+                    if is_call(argument, BA1.truth):
+                        result = Core.write_formula(BA1.falsum)
+                    elif is_call(argument, BA1.falsum):
+                        result = Core.write_formula(BA1.truth)
+                    elif is_call(argument, BA1.negation):
+                        result = argument.arguments[0]
+                    else:
+                        result = rebuild(o, arguments)
+                elif family is not None:
+                    result = simplify_associative(o, family, arguments)
+                else:
+                    result = rebuild(o, arguments)
+            elif has_facet(o, Facets.atomic_variable) and o.codomain == BA1.b:
+                result = o
+            else:
+                Log.log_error('Unexpected type', o=o, t=type(o), facets=o.facets, codomain=o.codomain)
+            o.set_property('simplification', result)
+            result.set_property('simplification', result)
+            return result
+
+        return simplify(phi)
+
+    @staticmethod
+    def _write_balanced_formula(system_function: Core.Concept, operands: list) -> Core.Concept:
+        """Combine operands with an associative binary system function, as a balanced binary tree of formulae."""
+        while len(operands) > 1:
+            pairs = [Core.write_formula(system_function, operands[i], operands[i + 1])
+                     for i in range(0, len(operands) - 1, 2)]
+            operands = pairs + ([operands[-1]] if len(operands) % 2 == 1 else [])
+        return operands[0]
+
+    @staticmethod
+    def minimize(phi: Core.Concept, variables_list=None) -> Core.Concept:
+        """Return a minimal sum-of-products Boolean phi that is equivalent to **phi**.
+
+        The prime implicants are derived from the bit-packed mask of the models of **phi**
+        by recursive Shannon expansions, where cubes are pairs of ints (value, dashes),
+        and the prime implicants of the sub-functions are memoised by hashing their masks.
+        The prime implicants that are essential are selected first,
+        and the remaining models are covered greedily by the prime implicants that cover the most of them.
+        Coverages are bit-packed masks over the worlds.
+        Hence the sum-of-products is heuristically minimal.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+            variables_list (list): The ordered atomic variables that define the worlds.
+
+        Returns:
+            BooleanFormula: A disjunction of conjunctions of atomic variables and negated atomic variables,
+                or a Boolean constant.
+        """
+        if variables_list is None:
+            variables_list = Core.list_formula_atomic_variables(phi)
+        variables_number = len(variables_list)
+        worlds_number = 2 ** variables_number
+        full_mask = (1 << worlds_number) - 1
+        models_mask = BA1.satisfaction_mask(phi, variables_list=variables_list)
+        if models_mask == 0:
+            return Core.write_formula(BA1.falsum)
+        elif models_mask == full_mask:
+            return Core.write_formula(BA1.truth)
+
+        # Prime implicants.
+        prime_implicants = {}
+
+        def list_prime_implicants(mask, k):
+            # The prime implicants of the function of the k first variables whose models are mask.
+            # Let x be the variable k - 1, with f = x'.f0 + x.f1. The prime implicants of f are
+            # the prime implicants of f0.f1, the prime implicants x'.p of f0 where p is not an implicant of f1,
+            # and the prime implicants x.p of f1 where p is not an implicant of f0.
+            if mask == 0:
+                return []
+            if mask == (1 << (1 << k)) - 1:
+                return [(0, (1 << k) - 1)]
+            if (mask, k) not in prime_implicants:
+                half = 1 << (k - 1)
+                bit = 1 << (k - 1)
+                f0 = mask & ((1 << half) - 1)
+                f1 = mask >> half
+                if f0 == f1:
+                    cubes = [(value, dashes | bit) for value, dashes in list_prime_implicants(f0, k - 1)]
+                else:
+                    both = list_prime_implicants(f0 & f1, k - 1)
+                    both_set = set(both)
+                    cubes = [(value, dashes | bit) for value, dashes in both]
+                    cubes.extend(cube for cube in list_prime_implicants(f0, k - 1) if cube not in both_set)
+                    cubes.extend((value | bit, dashes) for value, dashes in list_prime_implicants(f1, k - 1)
+                                 if (value, dashes) not in both_set)
+                prime_implicants[(mask, k)] = cubes
+            return prime_implicants[(mask, k)]
+
+        primes = sorted(list_prime_implicants(models_mask, variables_number))
+
+        # Cover.
+        columns = [BA1.get_boolean_combinations_mask(variables_number, c) for c in range(variables_number)]
+        coverages = []
+        for value, dashes in primes:
+            coverage = full_mask
+            for c in range(variables_number):
+                if not (dashes >> c) & 1:
+                    coverage &= columns[c] if (value >> c) & 1 else columns[c] ^ full_mask
+            coverages.append(coverage)
+        once, twice = 0, 0
+        for coverage in coverages:
+            twice |= once & coverage
+            once |= coverage
+        essential_models = once & ~twice
+        selected = [i for i, coverage in enumerate(coverages) if coverage & essential_models]
+        remaining = models_mask
+        for i in selected:
+            remaining &= ~coverages[i]
+        # Gains only decrease, hence stale gains in the heap are upper bounds.
+        heap = [(-(coverage & remaining).bit_count(), i) for i, coverage in enumerate(coverages)]
+        heapq.heapify(heap)
+        while remaining != 0:
+            gain, i = heapq.heappop(heap)
+            actual_gain = (coverages[i] & remaining).bit_count()
+            if actual_gain == -gain:
+                selected.append(i)
+                remaining &= ~coverages[i]
+            elif actual_gain > 0:
+                heapq.heappush(heap, (-actual_gain, i))
+
+        # Sum of products.
+        products = []
+        for i in sorted(selected):
+            value, dashes = primes[i]
+            literals = [variables_list[c] if (value >> c) & 1 else Core.write_formula(BA1.negation, variables_list[c])
+                        for c in range(variables_number) if not (dashes >> c) & 1]
+            products.append(BA1._write_balanced_formula(BA1.conjunction, literals))
+        return BA1._write_balanced_formula(BA1.disjunction, products)
+
+    DEFAULT_BLOCK_SIZE = 2 ** 16
+    """The default number of worlds per block of **iterate_satisfaction_index**."""
+
+    @staticmethod
+    def iterate_satisfaction_index(phi: Core.Concept, variables_list=None, block_size=None, bit_packed=False):
+        """Iterate the **satisfaction indexes** of a Boolean phi, by contiguous blocks of worlds.
+
+        Blocks are evaluated on demand with **satisfaction_mask**,
+        hence the peak memory is bounded by the block size and not by the 2ⁿ worlds.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+            variables_list (list): The ordered atomic variables that define the worlds.
+            block_size (int): The number of worlds per block, a power of 2. Defaults to **DEFAULT_BLOCK_SIZE**.
+            bit_packed (bool): Yield blocks as masks instead of vectors of Boolean constants.
+
+        Yields:
+            tuple: (offset, block) where offset is the index of the first world of the block,
+                and block is the vector (or mask) of the truth values of **phi** in the worlds of the block.
+        """
+        if variables_list is None:
+            variables_list = Core.list_formula_atomic_variables(phi)
+        if block_size is None:
+            block_size = BA1.DEFAULT_BLOCK_SIZE
+        if not isinstance(block_size, int) or block_size < 1 or block_size & (block_size - 1) != 0:
+            Log.log_error('block_size must be a power of 2', block_size=block_size)
+        positions = Core.get_variable_positions(variables_list)
+        worlds_number = 2 ** len(variables_list)
+        block_size = min(block_size, worlds_number)
+        for offset in range(0, worlds_number, block_size):
+            mask = BA1.satisfaction_mask(phi, variables_list=variables_list, offset=offset, vector_size=block_size,
+                                         positions=positions)
+            yield offset, mask if bit_packed else BA1.decode_mask(mask, block_size)
+
+    @staticmethod
+    def iterate_gray_code(phi: Core.Concept, variables_list=None):
+        """Iterate the truth values of a Boolean phi in all worlds, in Gray code order.
+
+        Consecutive worlds differ by a single atomic variable,
+        and only the nodes whose arguments changed are re-evaluated, in topological order,
+        from that atomic variable towards the root.
+        Hence the cost per world is bounded by the number of ancestors of the flipped variable,
+        and the memory is linear in the size of the phi.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+            variables_list (list): The ordered atomic variables that define the worlds.
+
+        Yields:
+            tuple: (world, value) where world is the world index (see **satisfaction_index**),
+                and value is the truth value of **phi** in that world.
+        """
+        if variables_list is None:
+            variables_list = Core.list_formula_atomic_variables(phi)
+        program = BA1.get_formula_program(phi, variables_list=variables_list)
+        mask_algorithms = [None if function_key is None else _concept_database[function_key].mask_algorithm
+                           for function_key, _ in program]
+        parents = [[] for _ in program]
+        variable_nodes = {}
+        values = [0] * len(program)
+        for i, (function_key, arguments) in enumerate(program):
+            if function_key is None:
+                variable_nodes[arguments] = i
+            else:
+                for j in arguments:
+                    parents[j].append(i)
+                # In world 0, all atomic variables are falsum.
+                values[i] = mask_algorithms[i](*(values[j] for j in arguments), vector_size=1)
+        root = len(program) - 1
+        world = 0
+        yield world, BA1.truth if values[root] else BA1.falsum
+        for k in range(1, 2 ** len(variables_list)):
+            # The Gray code of k differs from the Gray code of k - 1 by its lowest set bit.
+            c = (k & -k).bit_length() - 1
+            world ^= 1 << c
+            if c in variable_nodes:
+                i = variable_nodes[c]
+                values[i] ^= 1
+                pending = list(parents[i])
+                heapq.heapify(pending)
+                scheduled = set(pending)
+                while len(pending) > 0:
+                    i = heapq.heappop(pending)
+                    value = mask_algorithms[i](*(values[j] for j in program[i][1]), vector_size=1)
+                    if value != values[i]:
+                        values[i] = value
+                        for parent in parents[i]:
+                            if parent not in scheduled:
+                                scheduled.add(parent)
+                                heapq.heappush(pending, parent)
+            yield world, BA1.truth if values[root] else BA1.falsum
+
+    class TruthTable:
+        """A lazy, read-only view of the **satisfaction indexes** of a Boolean phi.
+
+        The table behaves like the list returned by **satisfaction_index**,
+        i.e. the row w is the truth value of the phi in world w,
+        but rows are computed on demand by blocks of worlds with **satisfaction_mask**.
+        Hence huge tables may be queried without materialising the 2ⁿ rows.
+
+        Example:
+            table = BA1.TruthTable(phi)
+            table[5]  # The truth value of phi in world 5.
+            table[-4:]  # The truth values of phi in the last 4 worlds.
+            table.get_assignment(5)  # World 5, as a mapping from atomic variables to Boolean constants.
+            table.count_true()  # The number of models of phi.
+        """
+
+        def __init__(self, phi: Core.Concept, variables_list=None, block_size: int = None, cache_blocks: bool = True):
+            """
+            Args:
+                phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+                variables_list (list): The ordered atomic variables that define the worlds.
+                block_size (int): The number of worlds per block, a power of 2. Defaults to **DEFAULT_BLOCK_SIZE**.
+                cache_blocks (bool): Keep the masks of the evaluated blocks.
+            """
+            if variables_list is None:
+                variables_list = Core.list_formula_atomic_variables(phi)
+            if block_size is None:
+                block_size = BA1.DEFAULT_BLOCK_SIZE
+            if not isinstance(block_size, int) or block_size < 1 or block_size & (block_size - 1) != 0:
+                Log.log_error('block_size must be a power of 2', block_size=block_size)
+            self._phi = phi
+            self._variables_list = list(variables_list)
+            self._positions = Core.get_variable_positions(self._variables_list)
+            self._worlds_number = 2 ** len(self._variables_list)
+            self._block_size = min(block_size, self._worlds_number)
+            self._blocks = {} if cache_blocks else None
+
+        @property
+        def phi(self):
+            return self._phi
+
+        @property
+        def variables_list(self):
+            return self._variables_list
+
+        def __len__(self):
+            return self._worlds_number
+
+        def __getitem__(self, world):
+            if isinstance(world, slice):
+                return [self._get_row(w) for w in range(self._worlds_number)[world]]
+            if world < 0:
+                world += self._worlds_number
+            if not 0 <= world < self._worlds_number:
+                raise IndexError('world out of range')
+            return self._get_row(world)
+
+        def __iter__(self):
+            for offset in range(0, self._worlds_number, self._block_size):
+                yield from BA1.decode_mask(self.get_block_mask(offset), self._block_size)
+
+        def __repr__(self):
+            return f'TruthTable({Repr.represent(self._phi)}, worlds={self._worlds_number})'
+
+        def _get_row(self, world):
+            offset = world - world % self._block_size
+            return BA1.truth if (self.get_block_mask(offset) >> (world - offset)) & 1 else BA1.falsum
+
+        def get_block_mask(self, offset: int) -> int:
+            """Return the mask of the block of worlds that starts at world **offset**, a multiple of the block size."""
+            if self._blocks is not None and offset in self._blocks:
+                return self._blocks[offset]
+            mask = BA1.satisfaction_mask(self._phi, variables_list=self._variables_list,
+                                         offset=offset, vector_size=self._block_size, positions=self._positions)
+            if self._blocks is not None:
+                self._blocks[offset] = mask
+            return mask
+
+        def get_assignment(self, world: int) -> dict:
+            """Decode a world number to a mapping from atomic variables to Boolean constants (see **BA1.find_model**)."""
+            if world < 0:
+                world += self._worlds_number
+            if not 0 <= world < self._worlds_number:
+                raise IndexError('world out of range')
+            return {variable: BA1.truth if (world >> c) & 1 else BA1.falsum
+                    for c, variable in enumerate(self._variables_list)}
+
+        def count_true(self) -> int:
+            """Return the number of worlds where the phi is true."""
+            return sum(self.get_block_mask(offset).bit_count()
+                       for offset in range(0, self._worlds_number, self._block_size))
+
+    @staticmethod
+    def satisfaction_index(phi: Core.Concept, variables_list=None, bit_packed=False, results=None, positions=None):
+        """Compute the **satisfaction indexes** (:math:`\text{sat}_I`) of a Boolean phi (:math:`\phi`).
+
+        Alias:
+        **sat_i**
+
+        Definition:
+        Let :math:`\phi` be a Boolean phi.
+        :math:`\text{sat}_I \colon= ` the truth value of :math:`\phi` in all possible worlds.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\phi` .
+            bit_packed (bool): Evaluate the phi with **satisfaction_mask**, and decode the resulting mask.
+            results (dict): The per-call result table, keyed by qualified key.
+                The phi is evaluated as a DAG: every distinct subformula is evaluated once,
+                even if it appears several times in the phi.
+            positions (dict): Conditional: the positions of the atomic variables (see **Core.get_variable_positions**).
+        """
+        if bit_packed:
+            if variables_list is None:
+                variables_list = Core.list_formula_atomic_variables(phi)
+            mask = BA1.satisfaction_mask(phi, variables_list=variables_list, results=results)
+            return BA1.decode_mask(mask, 2 ** len(variables_list))
+        if results is None:
+            results = {}
+        # TODO: Check that all phi are Boolean phi. Otherwise, the phi
+        #   may not return a Boolean value, forbidding the computation of a satisfaction set.
+        if variables_list is None:
+            variables_list = Core.list_formula_atomic_variables(phi)
+        if positions is None:
+            positions = Core.get_variable_positions(variables_list)
+        return BA1._satisfaction_index(phi, len(variables_list), positions, results)
+
+    @staticmethod
+    def _satisfaction_index(phi: Core.Concept, variables_number: int, positions: dict, results: dict):
+        """Compute the satisfaction indexes of a Boolean phi, with the positions and result table of the top-level call."""
+        arguments_number = phi.arity
+        argument_vectors = [None] * arguments_number
+        Log.log_debug(arguments_number=arguments_number)
+        for argument_index in range(0, arguments_number):
+            argument = phi.arguments[argument_index]
+            Log.log_debug(
+                argument=argument,
+                argument_index=argument_index,
+                argument_type=type(argument),
+                argument_codomain=argument.codomain,
+                argument_facets=argument.facets)
+            if argument.qualified_key in results:
+                # This subformula was already evaluated in this call.
+                argument_vectors[argument_index] = results[argument.qualified_key]
+            elif has_facet(argument, Facets.programmatic_function_call) and \
+                    argument.codomain == BA1.b:
+                # This argument is a Boolean Formula.
+                Log.log_debug('This argument is a Boolean Formula')
+                # Recursively compute the satisfaction set of that phi,
+                # restricting the variables list to the subset of necessary variables.
+                vector = BA1._satisfaction_index(argument, variables_number, positions, results)
+                results[argument.qualified_key] = vector
+                argument_vectors[argument_index] = vector
+            elif has_facet(argument, Facets.atomic_variable) and \
+                    argument.codomain == BA1.b:
+                # This argument is a Boolean atomic proposition.
+                Log.log_debug('This argument is a Boolean atomic proposition')
+                # We want to retrieve its values from the corresponding bit combinations column.
+                # But we need the vector to be relative to variables_list.
+                # Thus we must first find the position of this atomic variable,
+                # in the variables_list.
+                atomic_variable_index = positions[argument.qualified_key]
+                vector = BA1.get_boolean_combinations_column(variables_number, atomic_variable_index)
+                Log.log_debug(vector=vector)
+                results[argument.qualified_key] = vector
+                argument_vectors[argument_index] = vector
+            else:
+                Log.log_error('Unexpected type',
+                              argument=argument, t=type(argument), facets=argument.facets,
+                              codomain=argument.codomain)
+        Log.log_debug(argument_vectors=argument_vectors)
+        output_vector = None
+        Log.log_debug(phi=phi, arity=phi.arity, system_function=phi.system_function)
+        match phi.arity:
+            case 0:
+                output_vector = phi.system_function.algorithm(vector_size=2 ** variables_number)
+            case 1:
+                output_vector = phi.system_function.algorithm(argument_vectors[0])
             case 2:
                 output_vector = phi.system_function.algorithm(argument_vectors[0], argument_vectors[1])
             case _:
-                Log.log_error('Arity > 2 are not yet supported, sorry')
+                output_vector = phi.system_function.algorithm(*argument_vectors)
         Log.log_debug(output_vector=output_vector)
         return output_vector
 
+    EARLY_EXIT_BLOCK_SIZE = 2 ** 6
+    """The number of worlds of the first block of **equivalent**, **is_tautology** and **entails**."""
+
+    @staticmethod
+    def _find_counterexample(formulas, violation, variables_list=None) -> (None, dict):
+        """Return the first world where **violation** holds, or **None**.
+
+        The worlds are evaluated in blocks of growing size, starting with **EARLY_EXIT_BLOCK_SIZE** worlds,
+        and doubling up to **DEFAULT_BLOCK_SIZE** worlds, to stop early when the violation is found in the first worlds.
+        In every block, all **formulas** share the same result table, i.e. their common subformulae are evaluated once.
+
+        Args:
+            formulas (list): The Boolean phi.
+            violation (typing.Callable): A function of the masks of **formulas** and the all-truth mask,
+                that returns the mask of the violating worlds.
+            variables_list (list): The ordered atomic variables that define the worlds.
+                Defaults to the atomic variables of all the **formulas**.
+        """
+        if variables_list is None:
+            variables_list = Core.list_formulas_atomic_variables(formulas)
+        positions = Core.get_variable_positions(variables_list)
+        worlds_number = 2 ** len(variables_list)
+        offset = 0
+        vector_size = min(BA1.EARLY_EXIT_BLOCK_SIZE, worlds_number)
+        while offset < worlds_number:
+            results = {}
+            masks = [BA1.satisfaction_mask(phi, variables_list=variables_list, results=results,
+                                           offset=offset, vector_size=vector_size, positions=positions)
+                     for phi in formulas]
+            violations = violation(*masks, (1 << vector_size) - 1)
+            if violations != 0:
+                world = offset + (violations & -violations).bit_length() - 1
+                return {variable: BA1.truth if (world >> c) & 1 else BA1.falsum
+                        for c, variable in enumerate(variables_list)}
+            offset += vector_size
+            # Offsets remain multiples of the block size.
+            vector_size = min(offset, BA1.DEFAULT_BLOCK_SIZE, worlds_number - offset) or vector_size
+        return None
+
+    @staticmethod
+    def equivalent(phi: Core.Concept, psi: Core.Concept, variables_list=None, return_counterexample=False):
+        """Return **True** if the Boolean phi and psi have the same truth value in all worlds, **False** otherwise.
+
+        The evaluation stops at the first world where they differ.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+            psi (BooleanFormula): The Boolean phi :math:`\\psi` .
+            variables_list (list): Conditional: the ordered atomic variables that define the worlds.
+            return_counterexample (bool): Return a (result, counterexample) tuple,
+                where counterexample is a world where phi and psi differ (see **find_model**), or **None**.
+        """
+        counterexample = BA1._find_counterexample(
+            [phi, psi], lambda m1, m2, mask: m1 ^ m2, variables_list=variables_list)
+        if return_counterexample:
+            return counterexample is None, counterexample
+        return counterexample is None
+
+    @staticmethod
+    def is_tautology(phi: Core.Concept, variables_list=None, return_counterexample=False):
+        """Return **True** if the Boolean phi is true in all worlds, **False** otherwise.
+
+        The evaluation stops at the first world where phi is false.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+            variables_list (list): Conditional: the ordered atomic variables that define the worlds.
+            return_counterexample (bool): Return a (result, counterexample) tuple,
+                where counterexample is a world where phi is false (see **find_model**), or **None**.
+        """
+        counterexample = BA1._find_counterexample(
+            [phi], lambda m, mask: m ^ mask, variables_list=variables_list)
+        if return_counterexample:
+            return counterexample is None, counterexample
+        return counterexample is None
+
+    @staticmethod
+    def entails(phi: Core.Concept, psi: Core.Concept, variables_list=None, return_counterexample=False):
+        """Return **True** if the Boolean psi is true in all worlds where the Boolean phi is true, **False** otherwise.
+
+        The evaluation stops at the first world where phi is true and psi is false.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+            psi (BooleanFormula): The Boolean phi :math:`\\psi` .
+            variables_list (list): Conditional: the ordered atomic variables that define the worlds.
+            return_counterexample (bool): Return a (result, counterexample) tuple,
+                where counterexample is a world where phi is true and psi is false (see **find_model**), or **None**.
+        """
+        counterexample = BA1._find_counterexample(
+            [phi, psi], lambda m1, m2, mask: m1 & (m2 ^ mask), variables_list=variables_list)
+        if return_counterexample:
+            return counterexample is None, counterexample
+        return counterexample is None
+
+    @staticmethod
+    def satisfaction_indexes(formulas, variables_list=None, bit_packed=False) -> list:
+        """Compute the **satisfaction indexes** of many Boolean phi over the same worlds, in a single pass.
+
+        The phi DAG are merged: the atomic variable columns are generated once,
+        and every distinct node is evaluated once, even if it is shared by several phi.
+
+        Args:
+            formulas (list): The Boolean phi.
+            variables_list (list): The ordered atomic variables that define the worlds.
+                Defaults to the atomic variables of all the **formulas**.
+            bit_packed (bool): Evaluate the phi with **satisfaction_mask**, and decode the resulting masks.
+
+        Returns:
+            list: The satisfaction indexes of every phi, in the order of **formulas**.
+        """
+        formulas = list(formulas)
+        if variables_list is None:
+            variables_list = Core.list_formulas_atomic_variables(formulas)
+        variables_number = len(variables_list)
+        positions = Core.get_variable_positions(variables_list)
+        results = {}
+        indexes = []
+        for phi in formulas:
+            if bit_packed:
+                mask = BA1.satisfaction_mask(phi, variables_list=variables_list, results=results, positions=positions)
+                index = BA1.decode_mask(mask, 2 ** variables_number)
+            elif phi.qualified_key in results:
+                index = results[phi.qualified_key]
+            elif has_facet(phi, Facets.atomic_variable) and phi.codomain == BA1.b:
+                index = BA1.get_boolean_combinations_column(variables_number, positions[phi.qualified_key])
+                results[phi.qualified_key] = index
+            else:
+                index = BA1.satisfaction_index(phi, variables_list=variables_list, results=results,
+                                               positions=positions)
+                results[phi.qualified_key] = index
+            indexes.append(index)
+        return indexes
+
+    @staticmethod
+    def is_satisfiable(phi: Core.Concept) -> bool:
+        """Return **True** if there is at least one world where the Boolean phi is true, **False** otherwise.
+
+        The satisfiability is decided with a CDCL SAT solver on the Tseitin transformation of the phi,
+        i.e. without enumerating the 2ⁿ worlds.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+        """
+        return BA1.find_model(phi) is not None
+
+    @staticmethod
+    def find_model(phi: Core.Concept) -> (None, dict):
+        """Find a world where the Boolean phi is true.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+
+        Returns:
+            dict: A mapping from the atomic variables of **phi** to Boolean constants, or **None** if **phi** is not satisfiable.
+        """
+        cnf = SAT.tseitin(phi)
+        solver = SAT.Solver(variables_number=cnf.variables_number, clauses=cnf.clauses)
+        if not solver.solve():
+            return None
+        model = solver.model
+        return {atomic_variable: BA1.truth if model[variable] else BA1.falsum
+                for atomic_variable, variable in cnf.atomic_variables}
+
+    @staticmethod
+    def count_models(phi: Core.Concept, variables_list=None) -> int:
+        """Return the number of worlds where the Boolean phi is true.
+
+        The count is exact, and computed with a component caching #SAT counter on the Tseitin transformation of the phi,
+        i.e. without enumerating the 2ⁿ worlds.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+            variables_list (list): Conditional: the atomic variables that define the worlds.
+                Defaults to the atomic variables of **phi**.
+        """
+        cnf = SAT.tseitin(phi)
+        atomic_variables = [atomic_variable for atomic_variable, _ in cnf.atomic_variables]
+        free_variables_number = 0
+        if variables_list is not None:
+            if any(atomic_variable not in variables_list for atomic_variable in atomic_variables):
+                Log.log_error('Some atomic variables of phi are missing from variables_list',
+                              phi=phi, variables_list=variables_list)
+            free_variables_number = len(variables_list) - len(atomic_variables)
+        counter = SAT.ModelCounter(priority_variables=[variable for _, variable in cnf.atomic_variables])
+        return counter.count(cnf.clauses, range(1, cnf.variables_number + 1)) << free_variables_number
+
+
+class SAT:
+    """A library of Boolean satisfiability algorithms.
+
+    Clauses are lists of non-zero **int** literals in the DIMACS convention:
+    variables are numbered from 1, the literal v is the variable v, and the literal -v is its negation.
+    """
+
+    class CNF:
+        """A conjunctive normal form that is equisatisfiable with a Boolean phi.
+
+        Properties:
+            * clauses: the list of clauses.
+            * variables_number: the number of variables used by the clauses.
+            * atomic_variables: the list of (atomic variable, variable) pairs of the phi.
+        """
+
+        def __init__(self):
+            self.clauses = []
+            self.variables_number = 0
+            self.atomic_variables = []
+            self._literals = {}
+            self._truth_variable = None
+
+        def new_variable(self) -> int:
+            self.variables_number += 1
+            return self.variables_number
+
+        def get_literal(self, phi: Core.Concept) -> int:
+            """Return the literal that is equivalent to **phi**, adding the necessary definition clauses.
+
+            Every distinct subformula is defined once (by handle).
+            The subformulae are visited with an explicit stack, hence deep formulae do not hit the recursion limit."""
+            stack = [(phi, False)]
+            while stack:
+                o, expanded = stack.pop()
+                if o.handle in self._literals:
+                    continue
+                if not expanded and has_facet(o, Facets.programmatic_function_call):
+                    # Define the arguments first.
+                    stack.append((o, True))
+                    stack.extend((argument, False) for argument in reversed(o.arguments))
+                    continue
+                self._literals[o.handle] = self._define_literal(o)
+            return self._literals[phi.handle]
+
+        def _define_literal(self, phi: Core.Concept) -> int:
+            """Return a new literal equivalent to **phi**, whose arguments are already defined."""
+            if has_facet(phi, Facets.atomic_variable) and phi.codomain == BA1.b:
+                literal = self.new_variable()
+                self.atomic_variables.append((phi, literal))
+            elif has_facet(phi, Facets.programmatic_function_call) and phi.codomain == BA1.b:
+                arguments = [self._literals[argument.handle] for argument in phi.arguments]
+                system_function = phi.system_function
+                if system_function is BA1.truth or system_function is BA1.falsum:
+                    if self._truth_variable is None:
+                        self._truth_variable = self.new_variable()
+                        self.clauses.append([self._truth_variable])
+                    literal = self._truth_variable if system_function is BA1.truth else -self._truth_variable
+                elif system_function is BA1.negation:
+                    literal = -arguments[0]
+                elif system_function is BA1.conjunction or system_function is BA1.n_ary_conjunction:
+                    # g ⇔ (a ∧ b ∧ ...)
+                    literal = self.new_variable()
+                    self.clauses.extend([-literal, argument] for argument in arguments)
+                    self.clauses.append([literal] + [-argument for argument in arguments])
+                elif system_function is BA1.disjunction or system_function is BA1.n_ary_disjunction:
+                    # g ⇔ (a ∨ b ∨ ...)
+                    literal = self.new_variable()
+                    self.clauses.extend([literal, -argument] for argument in arguments)
+                    self.clauses.append([-literal] + arguments)
+                else:
+                    Log.log_error('Unsupported system function', phi=phi, system_function=system_function)
+            else:
+                Log.log_error('Unexpected type',
+                              phi=phi, t=type(phi), facets=phi.facets, codomain=phi.codomain)
+            return literal
+
+    @staticmethod
+    def tseitin(phi: Core.Concept) -> SAT.CNF:
+        """Convert a Boolean phi to an equisatisfiable CNF with the Tseitin transformation.
+
+        Every subformula is represented by a fresh variable defined by a few clauses,
+        hence the size of the CNF is linear in the size of the phi.
+
+        Args:
+            phi (BooleanFormula): The Boolean phi :math:`\\phi` .
+
+        Returns:
+            SAT.CNF: The CNF, whose models are the models of **phi** extended to the Tseitin variables.
+        """
+        cnf = SAT.CNF()
+        cnf.clauses.append([cnf.get_literal(phi)])
+        return cnf
+
+    @staticmethod
+    def luby(i: int) -> int:
+        """Return the i-th element (starting at 0) of the Luby sequence: 1, 1, 2, 1, 1, 2, 4, 1, ..."""
+        size, sequence = 1, 0
+        while size < i + 1:
+            sequence += 1
+            size = 2 * size + 1
+        while size - 1 != i:
+            size = (size - 1) >> 1
+            sequence -= 1
+            i = i % size
+        return 2 ** sequence
+
+    class ModelCounter:
+        """An exact model counter (#SAT) for clauses.
+
+        The counter is a DPLL search with unit propagation, that decomposes the residual clauses
+        into connected components (clauses that share no variable are counted independently),
+        and caches the count of every component, keyed on its residual clauses and variables.
+
+        Assignments are propagated on occurrence lists, with counters of true and false literals per clause
+        that are restored from the trail on backtrack, hence the clauses are never copied.
+        The search is driven by an explicit stack of generators, one per component,
+        hence deep searches do not hit the recursion limit.
+        Within a component, the counter branches on a variable close to its center,
+        so that its assignment tends to split the component in two.
+
+        Bibliography:
+            * Bacchus, F., Dalmao, S., Pitassi, T. (2003). DPLL with Caching: A new algorithm for #SAT and Bayesian Inference.
+            * Sang, T., Bacchus, F., Beame, P., Kautz, H., Pitassi, T. (2004). Combining Component Caching and Clause Learning for Effective Model Counting.
+            * Thurley, M. (2006). sharpSAT - Counting Models with Advanced Component Caching and Implicit BCP.
+        """
+
+        def __init__(self, priority_variables=None):
+            """
+            Args:
+                priority_variables (typing.Iterable[int]): Conditional: variables to branch on first.
+                    When counting the Tseitin transformation of a phi, branching on its atomic variables
+                    lets unit propagation assign the Tseitin variables.
+            """
+            self._priority_variables = frozenset() if priority_variables is None else frozenset(priority_variables)
+            self._clauses = []
+            self._occurrences = {}
+            self._values = {}
+            self._true_counts = []
+            self._false_counts = []
+            self._trail = []
+            self._cache = {}
+
+        def count(self, clauses, variables) -> int:
+            """Return the number of assignments of **variables** that satisfy **clauses**.
+
+            Args:
+                clauses (list): The clauses, whose variables must be in **variables**.
+                variables (typing.Iterable[int]): The variables of the assignments.
+            """
+            clauses = [tuple(sorted(set(clause))) for clause in clauses]
+            # Tautologies are satisfied by all assignments.
+            clauses = [clause for clause in clauses if not any(-literal in clause for literal in clause)]
+            if any(len(clause) == 0 for clause in clauses):
+                return 0
+            variables = frozenset(variables)
+            self._clauses = clauses
+            self._occurrences = {}
+            for index, clause in enumerate(clauses):
+                for literal in clause:
+                    self._occurrences.setdefault(literal, []).append(index)
+            self._values = dict.fromkeys(variables.union(abs(literal) for clause in clauses for literal in clause), 0)
+            self._true_counts = [0] * len(clauses)
+            self._false_counts = [0] * len(clauses)
+            self._trail = []
+            # The components are keyed on clause indexes, that are specific to these clauses.
+            self._cache = {}
+            units = [clause[0] for clause in clauses if len(clause) == 1]
+            # Trampoline: every generator yields the components it needs counted, and receives their counts.
+            stack = [self._count_branch(range(len(clauses)), variables, units)]
+            count = None
+            while stack:
+                try:
+                    component = stack[-1].send(count)
+                except StopIteration as stop:
+                    stack.pop()
+                    count = stop.value
+                else:
+                    stack.append(self._count_component(*component))
+                    count = None
+            return count
+
+        def _assign(self, literals) -> bool:
+            """Assign the **literals** to true, and propagate the units. Return **False** on conflict."""
+            clauses = self._clauses
+            values = self._values
+            true_counts = self._true_counts
+            false_counts = self._false_counts
+            queue = list(literals)
+            conflict = False
+            while queue and not conflict:
+                literal = queue.pop()
+                variable = abs(literal)
+                value = values[variable] if literal > 0 else -values[variable]
+                if value == 1:
+                    continue
+                if value == -1:
+                    return False
+                values[variable] = 1 if literal > 0 else -1
+                self._trail.append(literal)
+                for index in self._occurrences.get(literal, ()):
+                    true_counts[index] += 1
+                # The counters of all the clauses are updated, even on conflict, so that _undo restores them.
+                for index in self._occurrences.get(-literal, ()):
+                    false_counts[index] += 1
+                    if true_counts[index] == 0:
+                        clause = clauses[index]
+                        free = len(clause) - false_counts[index]
+                        if free == 0:
+                            conflict = True
+                        elif free == 1:
+                            for unit in clause:
+                                if values[abs(unit)] == 0:
+                                    queue.append(unit)
+                                    break
+            return not conflict
+
+        def _undo(self, mark: int):
+            """Unassign the literals of the trail, back to its length **mark**."""
+            values = self._values
+            true_counts = self._true_counts
+            false_counts = self._false_counts
+            trail = self._trail
+            while len(trail) > mark:
+                literal = trail.pop()
+                values[abs(literal)] = 0
+                for index in self._occurrences.get(literal, ()):
+                    true_counts[index] -= 1
+                for index in self._occurrences.get(-literal, ()):
+                    false_counts[index] -= 1
+
+        def _get_variable_clauses(self, clause_indexes) -> dict:
+            """Map the unassigned variables of the unsatisfied clauses to the indexes of these clauses."""
+            clauses = self._clauses
+            values = self._values
+            true_counts = self._true_counts
+            variable_clauses = {}
+            for index in clause_indexes:
+                if true_counts[index] == 0:
+                    for literal in clauses[index]:
+                        variable = abs(literal)
+                        if values[variable] == 0:
+                            variable_clauses.setdefault(variable, []).append(index)
+            return variable_clauses
+
+        def _get_distances(self, start: int, variable_clauses: dict) -> dict:
+            """Return the distances from **start** to the variables of its component, by breadth-first search."""
+            clauses = self._clauses
+            distances = {start: 0}
+            visited = set()
+            frontier = [start]
+            while frontier:
+                successors = []
+                for variable in frontier:
+                    for index in variable_clauses[variable]:
+                        if index in visited:
+                            continue
+                        visited.add(index)
+                        for literal in clauses[index]:
+                            neighbour = abs(literal)
+                            if neighbour in variable_clauses and neighbour not in distances:
+                                distances[neighbour] = distances[variable] + 1
+                                successors.append(neighbour)
+                frontier = successors
+            return distances
+
+        def _choose_variable(self, clause_indexes, variables) -> int:
+            """Choose the branching variable of a component: a priority variable close to its center."""
+            variable_clauses = self._get_variable_clauses(clause_indexes)
+            # The second search starts from a peripheral variable, and measures how far every variable is from the center.
+            distances = self._get_distances(next(iter(variables)), variable_clauses)
+            peripheral = max(distances, key=distances.get)
+            distances = self._get_distances(peripheral, variable_clauses)
+            eccentricity = max(distances.values())
+            candidates = [variable for variable in variables if variable in self._priority_variables] or variables
+            return max(candidates, key=lambda variable: (
+                -abs(2 * distances[variable] - eccentricity), len(variable_clauses[variable])))
+
+        def _get_components(self, clause_indexes, variables):
+            """Split the unsatisfied clauses into connected components of clauses that share unassigned variables.
+
+            Returns:
+                tuple: The number of free variables, i.e. unassigned variables that appear in no unsatisfied clause,
+                    and the list of (clause indexes, variables) components.
+            """
+            clauses = self._clauses
+            values = self._values
+            variable_clauses = self._get_variable_clauses(clause_indexes)
+            free_variables_number = sum(
+                1 for variable in variables if values[variable] == 0 and variable not in variable_clauses)
+            visited_clauses = set()
+            visited_variables = set()
+            components = []
+            for start in variable_clauses:
+                if start in visited_variables:
+                    continue
+                visited_variables.add(start)
+                component_clauses = []
+                component_variables = [start]
+                stack = [start]
+                while stack:
+                    for index in variable_clauses[stack.pop()]:
+                        if index in visited_clauses:
+                            continue
+                        visited_clauses.add(index)
+                        component_clauses.append(index)
+                        for literal in clauses[index]:
+                            neighbour = abs(literal)
+                            if neighbour in variable_clauses and neighbour not in visited_variables:
+                                visited_variables.add(neighbour)
+                                component_variables.append(neighbour)
+                                stack.append(neighbour)
+                components.append((frozenset(component_clauses), frozenset(component_variables)))
+            return free_variables_number, components
+
+        def _count_branch(self, clause_indexes, variables, literals):
+            """Count the models of a component where the **literals** are true, as a trampolined generator."""
+            mark = len(self._trail)
+            count = 0
+            if self._assign(literals):
+                free_variables_number, components = self._get_components(clause_indexes, variables)
+                count = 1 << free_variables_number
+                for component in components:
+                    count *= yield component
+                    if count == 0:
+                        break
+            self._undo(mark)
+            return count
+
+        def _count_component(self, clause_indexes: frozenset, variables: frozenset):
+            """Count the models of a component, as a trampolined generator."""
+            key = (clause_indexes, variables)
+            count = self._cache.get(key)
+            if count is None:
+                variable = self._choose_variable(clause_indexes, variables)
+                count = yield from self._count_branch(clause_indexes, variables, (variable,))
+                count += yield from self._count_branch(clause_indexes, variables, (-variable,))
+                self._cache[key] = count
+            return count
+
+    class Solver:
+        """A conflict-driven clause-learning (CDCL) SAT solver.
+
+        The solver implements two watched literals unit propagation, first-UIP clause learning,
+        VSIDS-style branching with phase saving, and Luby restarts.
+
+        Bibliography:
+            * Eén, N., Sörensson, N. (2003). An Extensible SAT-solver.
+        """
+
+        RESTART_BASE = 100
+        """The number of conflicts of the first restart interval, multiplied by the Luby sequence."""
+
+        ACTIVITY_DECAY = 0.95
+
+        def __init__(self, variables_number: int = 0, clauses=None):
+            self._values = [0]  # 1: true, -1: false, 0: unassigned.
+            self._levels = [0]
+            self._reasons = [None]
+            self._activities = [0.0]
+            self._polarities = [False]
+            self._watches = [[], []]  # Indexed by literal code.
+            self._heap = []
+            self._trail = []
+            self._trail_limits = []
+            self._propagation_head = 0
+            self._activity_increment = 1.0
+            self._unsatisfiable = False
+            self._model = None
+            self.variables_number = 0
+            self.conflicts = 0
+            self.add_variables(variables_number)
+            if clauses is not None:
+                for clause in clauses:
+                    self.add_clause(clause)
+
+        @staticmethod
+        def _code(literal: int) -> int:
+            return literal << 1 if literal > 0 else (-literal << 1) | 1
+
+        def _value(self, literal: int) -> int:
+            value = self._values[abs(literal)]
+            return value if literal > 0 else -value
+
+        def add_variables(self, n: int):
+            for _ in range(n):
+                self.variables_number += 1
+                self._values.append(0)
+                self._levels.append(0)
+                self._reasons.append(None)
+                self._activities.append(0.0)
+                self._polarities.append(False)
+                self._watches.extend(([], []))
+                heapq.heappush(self._heap, (0.0, self.variables_number))
+
+        def add_clause(self, clause):
+            """Add a clause at decision level 0."""
+            literals = []
+            for literal in clause:
+                if -literal in literals:
+                    # Tautology.
+                    return
+                if literal not in literals:
+                    literals.append(literal)
+            self._cancel_until(0)
+            # Remove the literals that are false at level 0.
+            literals = [literal for literal in literals if self._value(literal) != -1]
+            if any(self._value(literal) == 1 for literal in literals):
+                return
+            if len(literals) == 0:
+                self._unsatisfiable = True
+            elif len(literals) == 1:
+                self._enqueue(literals[0], None)
+                if self._propagate() is not None:
+                    self._unsatisfiable = True
+            else:
+                self._attach(literals)
+
+        def _attach(self, clause):
+            self._watches[self._code(clause[0])].append(clause)
+            self._watches[self._code(clause[1])].append(clause)
+
+        def _enqueue(self, literal: int, reason):
+            variable = abs(literal)
+            self._values[variable] = 1 if literal > 0 else -1
+            self._levels[variable] = len(self._trail_limits)
+            self._reasons[variable] = reason
+            self._trail.append(literal)
+
+        def _propagate(self):
+            """Propagate the assignments of the trail. Return the conflicting clause, or **None**."""
+            values = self._values
+            watches = self._watches
+            code = self._code
+            while self._propagation_head < len(self._trail):
+                false_literal = -self._trail[self._propagation_head]
+                self._propagation_head += 1
+                watch_list = watches[code(false_literal)]
+                i = j = 0
+                n = len(watch_list)
+                while i < n:
+                    clause = watch_list[i]
+                    i += 1
+                    # Assure that the false literal is the second watch.
+                    if clause[0] == false_literal:
+                        clause[0], clause[1] = clause[1], false_literal
+                    first = clause[0]
+                    first_value = values[first] if first > 0 else -values[-first]
+                    if first_value == 1:
+                        watch_list[j] = clause
+                        j += 1
+                        continue
+                    # Look for a new literal to watch.
+                    for k in range(2, len(clause)):
+                        literal = clause[k]
+                        if (values[literal] if literal > 0 else -values[-literal]) != -1:
+                            clause[1], clause[k] = literal, false_literal
+                            watches[code(literal)].append(clause)
+                            break
+                    else:
+                        watch_list[j] = clause
+                        j += 1
+                        if first_value == -1:
+                            # Conflict: keep the remaining watches.
+                            while i < n:
+                                watch_list[j] = watch_list[i]
+                                j += 1
+                                i += 1
+                            del watch_list[j:]
+                            self._propagation_head = len(self._trail)
+                            return clause
+                        self._enqueue(first, clause)
+                del watch_list[j:]
+            return None
+
+        def _bump(self, variable: int):
+            self._activities[variable] += self._activity_increment
+            if self._activities[variable] > 1e100:
+                # Rescale all activities to avoid floating point overflows.
+                self._activities = [activity * 1e-100 for activity in self._activities]
+                self._activity_increment *= 1e-100
+                self._heap = [(-self._activities[v], v) for v in range(1, self.variables_number + 1)
+                              if self._values[v] == 0]
+                heapq.heapify(self._heap)
+            elif self._values[variable] == 0:
+                heapq.heappush(self._heap, (-self._activities[variable], variable))
+
+        def _analyze(self, conflict):
+            """Derive the first-UIP learnt clause from a conflict, and the level to backtrack to."""
+            seen = set()
+            learnt = [None]  # The asserting literal is set at the end.
+            counter = 0
+            literal = None
+            index = len(self._trail) - 1
+            clause = conflict
+            level = len(self._trail_limits)
+            while True:
+                for q in (clause if literal is None else clause[1:]):
+                    variable = abs(q)
+                    if variable not in seen and self._levels[variable] > 0:
+                        seen.add(variable)
+                        self._bump(variable)
+                        if self._levels[variable] == level:
+                            counter += 1
+                        else:
+                            learnt.append(q)
+                # Select the next literal of the current level to resolve on.
+                while abs(self._trail[index]) not in seen:
+                    index -= 1
+                literal = self._trail[index]
+                index -= 1
+                clause = self._reasons[abs(literal)]
+                seen.discard(abs(literal))
+                counter -= 1
+                if counter == 0:
+                    break
+            learnt[0] = -literal
+            backtrack_level = 0
+            if len(learnt) > 1:
+                # Watch the literal of the highest level as the second literal.
+                highest = max(range(1, len(learnt)), key=lambda k: self._levels[abs(learnt[k])])
+                learnt[1], learnt[highest] = learnt[highest], learnt[1]
+                backtrack_level = self._levels[abs(learnt[1])]
+            return learnt, backtrack_level
+
+        def _cancel_until(self, level: int):
+            if len(self._trail_limits) > level:
+                limit = self._trail_limits[level]
+                for literal in reversed(self._trail[limit:]):
+                    variable = abs(literal)
+                    self._values[variable] = 0
+                    self._reasons[variable] = None
+                    self._polarities[variable] = literal > 0
+                    heapq.heappush(self._heap, (-self._activities[variable], variable))
+                del self._trail[limit:]
+                del self._trail_limits[level:]
+                self._propagation_head = len(self._trail)
+
+        def _pick_branching_variable(self):
+            while self._heap:
+                _, variable = heapq.heappop(self._heap)
+                if self._values[variable] == 0:
+                    return variable
+            return None
+
+        def solve(self) -> bool:
+            """Return **True** if the clauses are satisfiable, **False** otherwise."""
+            self._model = None
+            if self._unsatisfiable:
+                return False
+            self._cancel_until(0)
+            if self._propagate() is not None:
+                self._unsatisfiable = True
+                return False
+            restart = 0
+            while True:
+                budget = SAT.Solver.RESTART_BASE * SAT.luby(restart)
+                conflicts = 0
+                while True:
+                    conflict = self._propagate()
+                    if conflict is not None:
+                        conflicts += 1
+                        self.conflicts += 1
+                        if len(self._trail_limits) == 0:
+                            self._unsatisfiable = True
+                            return False
+                        learnt, backtrack_level = self._analyze(conflict)
+                        self._cancel_until(backtrack_level)
+                        if len(learnt) == 1:
+                            self._enqueue(learnt[0], None)
+                        else:
+                            self._attach(learnt)
+                            self._enqueue(learnt[0], learnt)
+                        self._activity_increment /= SAT.Solver.ACTIVITY_DECAY
+                    elif conflicts >= budget:
+                        self._cancel_until(0)
+                        break
+                    else:
+                        variable = self._pick_branching_variable()
+                        if variable is None:
+                            self._model = [value == 1 for value in self._values]
+                            self._cancel_until(0)
+                            return True
+                        self._trail_limits.append(len(self._trail))
+                        self._enqueue(variable if self._polarities[variable] else -variable, None)
+                restart += 1
+
+        @property
+        def model(self):
+            """The list of variable values of the last satisfiable call to **solve**, indexed by variable."""
+            return self._model
+
+
+class BDD:
+    """A library of reduced ordered binary decision diagrams (ROBDD).
+
+    Nodes are **int** identifiers in a **BDD.Manager**: 0 is the falsum terminal, 1 is the truth terminal.
+    Because ROBDDs are canonical for a given variable order, two Boolean phi are equivalent
+    if and only if they compile to the same node in the same manager.
+
+    Bibliography:
+        * Bryant, R. E. (1986). Graph-Based Algorithms for Boolean Function Manipulation.
+        * Brace, K. S., Rudell, R. L., Bryant, R. E. (1990). Efficient Implementation of a BDD Package.
+    """
+
+    FALSUM = 0
+    TRUTH = 1
+
+    class Manager:
+        """A BDD manager, with a unique table, a bounded computed table (ITE cache), and reference counting.
+
+        Nodes returned by the public operations (**compile**, **variable**, **ite**, **negation**, **conjunction**,
+        **disjunction**, **restrict**, **exists** and **forall**) carry an external reference
+        that the caller releases with **deref**.
+        Nodes whose reference count drops to 0 are reclaimed by **collect_garbage**.
+        """
+
+        def __init__(self, variables_list=None, cache_size: int = 2 ** 16):
+            """
+            Args:
+                variables_list (list): Conditional: the initial variable order, from top to bottom.
+                cache_size (int): The maximal number of entries of the computed table.
+            """
+            self.variables = []
+            self._variable_levels = {}
+            # Terminal nodes are stored at the pseudo-level None and are never reclaimed.
+            self._node_levels = [None, None]
+            self._lows = [0, 1]
+            self._highs = [0, 1]
+            self._references = [1, 1]
+            self._unique = {}
+            self._free = []
+            self._computed = {}
+            self.cache_size = cache_size
+            if variables_list is not None:
+                for variable in variables_list:
+                    self.add_variable(variable)
+
+        def add_variable(self, variable: Core.Concept) -> int:
+            """Append an atomic variable at the bottom of the variable order, and return its level."""
+            if variable.qualified_key not in self._variable_levels:
+                self._variable_levels[variable.qualified_key] = len(self.variables)
+                self.variables.append(variable)
+            return self._variable_levels[variable.qualified_key]
+
+        def _level(self, node: int) -> int:
+            level = self._node_levels[node]
+            return len(self.variables) if node <= 1 else level
+
+        def make_node(self, level: int, low: int, high: int) -> int:
+            """Return the unique node for (level, low, high)."""
+            if low == high:
+                return low
+            key = (level, low, high)
+            node = self._unique.get(key)
+            if node is None:
+                if self._free:
+                    node = self._free.pop()
+                    self._node_levels[node] = level
+                    self._lows[node] = low
+                    self._highs[node] = high
+                    self._references[node] = 0
+                else:
+                    node = len(self._node_levels)
+                    self._node_levels.append(level)
+                    self._lows.append(low)
+                    self._highs.append(high)
+                    self._references.append(0)
+                self._references[low] += 1
+                self._references[high] += 1
+                self._unique[key] = node
+            return node
+
+        def _cache_get(self, key):
+            return self._computed.get(key)
+
+        def _cache_put(self, key, node: int):
+            if len(self._computed) >= self.cache_size:
+                # Evict the oldest entry.
+                del self._computed[next(iter(self._computed))]
+            self._computed[key] = node
+
+        def variable(self, variable: Core.Concept) -> int:
+            """Return the referenced node of an atomic variable."""
+            return self.ref(self._variable(variable))
+
+        def _variable(self, variable: Core.Concept) -> int:
+            return self.make_node(self.add_variable(variable), BDD.FALSUM, BDD.TRUTH)
+
+        def ite(self, f: int, g: int, h: int) -> int:
+            """If-then-else: return the referenced node of (f ∧ g) ∨ (¬f ∧ h)."""
+            return self.ref(self._ite(f, g, h))
+
+        def _ite(self, f: int, g: int, h: int) -> int:
+            if f == BDD.TRUTH:
+                return g
+            if f == BDD.FALSUM:
+                return h
+            if g == h:
+                return g
+            if g == BDD.TRUTH and h == BDD.FALSUM:
+                return f
+            key = ('ite', f, g, h)
+            node = self._cache_get(key)
+            if node is not None:
+                return node
+            level = min(self._level(f), self._level(g), self._level(h))
+            f0, f1 = self._cofactors(f, level)
+            g0, g1 = self._cofactors(g, level)
+            h0, h1 = self._cofactors(h, level)
+            node = self.make_node(level, self._ite(f0, g0, h0), self._ite(f1, g1, h1))
+            self._cache_put(key, node)
+            return node
+
+        def _cofactors(self, node: int, level: int):
+            if self._level(node) == level:
+                return self._lows[node], self._highs[node]
+            return node, node
+
+        def negation(self, f: int) -> int:
+            """Return the referenced node of ¬f."""
+            return self.ref(self._ite(f, BDD.FALSUM, BDD.TRUTH))
+
+        def conjunction(self, f: int, g: int) -> int:
+            """Return the referenced node of f ∧ g."""
+            return self.ref(self._ite(f, g, BDD.FALSUM))
+
+        def disjunction(self, f: int, g: int) -> int:
+            """Return the referenced node of f ∨ g."""
+            return self.ref(self._ite(f, BDD.TRUTH, g))
+
+        def compile(self, phi: Core.Concept) -> int:
+            """Compile a Boolean phi to a referenced BDD node.
+
+            Atomic variables that are not yet in the variable order are appended in the order
+            of **Core.list_formula_atomic_variables**.
+            """
+            for variable in Core.list_formula_atomic_variables(phi):
+                self.add_variable(variable)
+            return self.ref(self._compile(phi, {}))
+
+        def _compile(self, phi: Core.Concept, results: dict) -> int:
+            if phi.handle in results:
+                return results[phi.handle]
+            if has_facet(phi, Facets.atomic_variable) and phi.codomain == BA1.b:
+                node = self._variable(phi)
+            elif has_facet(phi, Facets.programmatic_function_call) and phi.codomain == BA1.b:
+                arguments = [self._compile(argument, results) for argument in phi.arguments]
+                system_function = phi.system_function
+                if system_function is BA1.truth:
+                    node = BDD.TRUTH
+                elif system_function is BA1.falsum:
+                    node = BDD.FALSUM
+                elif system_function is BA1.negation:
+                    node = self._ite(arguments[0], BDD.FALSUM, BDD.TRUTH)
+                elif system_function is BA1.conjunction or system_function is BA1.n_ary_conjunction:
+                    node = BDD.TRUTH
+                    for argument in arguments:
+                        node = self._ite(node, argument, BDD.FALSUM)
+                elif system_function is BA1.disjunction or system_function is BA1.n_ary_disjunction:
+                    node = BDD.FALSUM
+                    for argument in arguments:
+                        node = self._ite(node, BDD.TRUTH, argument)
+                else:
+                    Log.log_error('Unsupported system function', phi=phi, system_function=system_function)
+            else:
+                Log.log_error('Unexpected type',
+                              phi=phi, t=type(phi), facets=phi.facets, codomain=phi.codomain)
+            results[phi.handle] = node
+            return node
+
+        def ref(self, node: int) -> int:
+            """Add an external reference to a node, protecting it from garbage collection."""
+            self._references[node] += 1
+            return node
+
+        def deref(self, node: int):
+            """Release an external reference to a node."""
+            if node > 1:
+                if self._references[node] <= 0:
+                    Log.log_error('The node is not referenced', node=node)
+                self._references[node] -= 1
+
+        def collect_garbage(self) -> int:
+            """Reclaim the nodes that are no longer referenced, and return their number."""
+            dead = [node for node in range(2, len(self._node_levels))
+                    if self._node_levels[node] is not None and self._references[node] == 0]
+            reclaimed = 0
+            while dead:
+                node = dead.pop()
+                low, high = self._lows[node], self._highs[node]
+                del self._unique[(self._node_levels[node], low, high)]
+                self._node_levels[node] = None
+                self._free.append(node)
+                reclaimed += 1
+                for child in (low, high):
+                    self._references[child] -= 1
+                    if child > 1 and self._references[child] == 0:
+                        dead.append(child)
+            # Cached results may reference reclaimed nodes.
+            self._computed.clear()
+            return reclaimed
+
+        @property
+        def nodes_number(self) -> int:
+            """The number of non-terminal nodes in the unique table."""
+            return len(self._unique)
+
+        def equivalent(self, f: int, g: int) -> bool:
+            """Return **True** if the nodes represent equivalent Boolean functions, **False** otherwise."""
+            return f == g
+
+        def count_models(self, f: int) -> int:
+            """Return the number of satisfying assignments of the variables of the manager."""
+            counts = {}
+
+            def count(node):
+                # The number of satisfying assignments of the variables at levels >= level(node).
+                if node <= 1:
+                    return node
+                if node not in counts:
+                    level = self._node_levels[node]
+                    low, high = self._lows[node], self._highs[node]
+                    counts[node] = (count(low) << (self._level(low) - level - 1)) + \
+                                   (count(high) << (self._level(high) - level - 1))
+                return counts[node]
+
+            return count(f) << self._level(f)
+
+        def restrict(self, f: int, variable: Core.Concept, value: bool) -> int:
+            """Return the referenced node of **f** where the atomic variable is replaced by the constant **value**."""
+            return self.ref(self._restrict(f, variable, value))
+
+        def _restrict(self, f: int, variable: Core.Concept, value: bool) -> int:
+            level = self.add_variable(variable)
+            branch = 1 if value else 0
+
+            def restrict(node):
+                node_level = self._level(node)
+                if node_level > level:
+                    return node
+                if node_level == level:
+                    return self._highs[node] if branch else self._lows[node]
+                key = ('restrict', node, level, branch)
+                result = self._cache_get(key)
+                if result is None:
+                    result = self.make_node(node_level, restrict(self._lows[node]), restrict(self._highs[node]))
+                    self._cache_put(key, result)
+                return result
+
+            return restrict(f)
+
+        def exists(self, f: int, variables) -> int:
+            """Existential quantification: return the referenced node of ∃ variables f."""
+            for variable in Utils.flatten(variables):
+                f = self._ite(self._restrict(f, variable, False), BDD.TRUTH, self._restrict(f, variable, True))
+            return self.ref(f)
+
+        def forall(self, f: int, variables) -> int:
+            """Universal quantification: return the referenced node of ∀ variables f."""
+            for variable in Utils.flatten(variables):
+                f = self._ite(self._restrict(f, variable, False), self._restrict(f, variable, True), BDD.FALSUM)
+            return self.ref(f)
+
 
 class SA1:
     """The **Set Algebra 1** library."""
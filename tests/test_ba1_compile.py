@@ -0,0 +1,68 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1Compile(TestCase):
+    def test_compile(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        phi = naive.f(naive.BA1.conjunction, x, naive.f(naive.BA1.negation, y))
+        function = naive.BA1.compile(phi)
+        self.assertEqual(1, function(1, 0))
+        self.assertEqual(0, function(1, 1))
+        self.assertEqual(0b0100, function(0b0101, 0b0011, mask=0b1111))
+        # The compiled function is cached on the phi.
+        self.assertIs(function, naive.BA1.compile(phi))
+        self.assertIsNot(function, naive.BA1.compile(phi, variables_list=[y, x]))
+        self.assertEqual(1, naive.BA1.compile(phi, variables_list=[y, x])(0, 1))
+
+    def test_compile_against_satisfaction_mask(self):
+        naive.set_unique_scope()
+        variables = [naive.av(naive.BA1.b, 'x', i) for i in range(4)]
+        phi1 = naive.f(naive.BA1.disjunction, naive.f(naive.BA1.negation, variables[0]),
+                       naive.f(naive.BA1.conjunction, variables[1], variables[3]))
+        phi2 = naive.f(naive.BA1.conjunction, phi1, naive.f(naive.BA1.disjunction, phi1, naive.f(naive.BA1.truth)))
+        phi3 = naive.f(naive.BA1.disjunction, phi2, naive.f(naive.BA1.falsum))
+        columns = [naive.BA1.get_boolean_combinations_mask(4, c) for c in range(4)]
+        function = naive.BA1.compile(phi3, variables_list=variables)
+        self.assertEqual(naive.BA1.satisfaction_mask(phi3, variables_list=variables),
+                         function(*columns, mask=2 ** 16 - 1))
+
+    def test_compile_fallback_vector_size(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        # A system function without mask_expression is compiled as a call to its bit-packed algorithm.
+        nand = naive.Core.Concept(
+            scope_key=x.scope_key, language_key=x.language, base_key='nand',
+            facets=[naive.Facets.function, naive.Facets.programmatic_function,
+                    naive.Facets.programmatic_binary_operator],
+            codomain=naive.BA1.b, arity=2, utf8='⊼', base_name='⊼',
+            mask_algorithm=lambda m1, m2, vector_size=1: ((1 << vector_size) - 1) ^ (m1 & m2))
+        function = naive.BA1.compile(naive.f(nand, x, y))
+        self.assertEqual(0b1010, function(0b0101, 0b0111, mask=0b1111, vector_size=4))
+        self.assertEqual(0b11111110, function(0b00000001, 0b00000001, vector_size=8))
+
+    def test_compile_fallback_numpy(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest('numpy is not installed')
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        nand = naive.Core.Concept(
+            scope_key=x.scope_key, language_key=x.language, base_key='nand',
+            facets=[naive.Facets.function, naive.Facets.programmatic_function,
+                    naive.Facets.programmatic_binary_operator],
+            codomain=naive.BA1.b, arity=2, utf8='⊼', base_name='⊼',
+            mask_algorithm=lambda m1, m2, vector_size=1: ((1 << vector_size) - 1) ^ (m1 & m2))
+        for length in [3, 64, 100, 1000]:
+            columns = {x: numpy.arange(length) % 2 == 0, y: numpy.arange(length) % 3 == 0}
+            # The empty n-ary conjunction falls back on its bit-packed algorithm.
+            phi = naive.f(naive.BA1.n_ary_disjunction, x, naive.f(naive.BA1.n_ary_conjunction))
+            self.assertEqual([True] * length, naive.BA1.evaluate_columns(phi, columns).tolist())
+            psi = naive.f(naive.BA1.conjunction, naive.f(nand, x, y), y)
+            self.assertEqual((~columns[x] & columns[y]).tolist(), naive.BA1.evaluate_columns(psi, columns).tolist())
@@ -0,0 +1,62 @@
+import random
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1CountModels(TestCase):
+    def test_small_formulas(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        z = naive.av(naive.BA1.b, 'z')
+        self.assertEqual(1, naive.BA1.count_models(x))
+        self.assertEqual(3, naive.BA1.count_models(naive.f(naive.BA1.disjunction, x, y)))
+        self.assertEqual(6, naive.BA1.count_models(naive.f(naive.BA1.disjunction, x, y), variables_list=[x, y, z]))
+        self.assertEqual(0, naive.BA1.count_models(naive.f(naive.BA1.conjunction, x, naive.f(naive.BA1.negation, x))))
+        self.assertEqual(1, naive.BA1.count_models(naive.f(naive.BA1.truth)))
+        self.assertEqual(0, naive.BA1.count_models(naive.f(naive.BA1.falsum)))
+
+    def test_against_satisfaction_mask(self):
+        naive.set_unique_scope()
+        rng = random.Random(4)
+        variables = [naive.av(naive.BA1.b, 'x', i) for i in range(7)]
+        for _ in range(30):
+            phi = rng.choice(variables)
+            for _ in range(10):
+                operator = rng.choice([naive.BA1.conjunction, naive.BA1.disjunction])
+                argument = rng.choice(variables)
+                if rng.random() < 0.5:
+                    argument = naive.f(naive.BA1.negation, argument)
+                phi = naive.f(operator, argument, phi) if rng.random() < 0.5 else naive.f(operator, phi, argument)
+            expected = bin(naive.BA1.satisfaction_mask(phi)).count('1')
+            self.assertEqual(expected, naive.BA1.count_models(phi))
+
+    def test_many_variables(self):
+        naive.set_unique_scope()
+        variables = [naive.av(naive.BA1.b, 'x', i) for i in range(200)]
+        # 100 independent clauses (x₂ᵢ ∨ x₂ᵢ₊₁), each with 3 models out of 4.
+        clauses = [naive.f(naive.BA1.disjunction, variables[i], variables[i + 1]) for i in range(0, 200, 2)]
+        while len(clauses) > 1:
+            clauses = [naive.f(naive.BA1.conjunction, clauses[i], clauses[i + 1]) if i + 1 < len(clauses)
+                       else clauses[i] for i in range(0, len(clauses), 2)]
+        self.assertEqual(3 ** 100, naive.BA1.count_models(clauses[0]))
+
+    def test_chain(self):
+        naive.set_unique_scope()
+        n = 400
+        variables = [naive.av(naive.BA1.b, 'x', i) for i in range(n)]
+        # (x₀ ∨ x₁) ∧ (x₁ ∨ x₂) ∧ ..., whose number of models is a Fibonacci number.
+        phi = naive.f(naive.BA1.disjunction, variables[0], variables[1])
+        for i in range(1, n - 1):
+            phi = naive.f(naive.BA1.conjunction, phi, naive.f(naive.BA1.disjunction, variables[i], variables[i + 1]))
+        a, b = 1, 2
+        for _ in range(n - 1):
+            a, b = b, a + b
+        self.assertEqual(b, naive.BA1.count_models(phi))
+
+    def test_model_counter_chain(self):
+        n = 5000
+        # x₁ ⇒ x₂ ⇒ ... ⇒ xₙ has n + 1 models.
+        clauses = [[-i, i + 1] for i in range(1, n)]
+        self.assertEqual(n + 1, naive.SAT.ModelCounter().count(clauses, range(1, n + 1)))
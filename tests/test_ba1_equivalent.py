@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1Equivalent(TestCase):
+    def test_equivalent(self):
+        naive.set_unique_scope()
+        x, y = naive.av(naive.BA1.b, 'x'), naive.av(naive.BA1.b, 'y')
+        phi = naive.f(naive.BA1.negation, naive.f(naive.BA1.conjunction, x, y))
+        psi = naive.f(naive.BA1.disjunction, naive.f(naive.BA1.negation, x), naive.f(naive.BA1.negation, y))
+        self.assertTrue(naive.BA1.equivalent(phi, psi))
+        self.assertEqual((True, None), naive.BA1.equivalent(phi, psi, return_counterexample=True))
+        chi = naive.f(naive.BA1.negation, x)
+        result, counterexample = naive.BA1.equivalent(phi, chi, return_counterexample=True)
+        self.assertFalse(result)
+        self.assertEqual({x: naive.BA1.truth, y: naive.BA1.falsum}, counterexample)
+
+    def test_is_tautology(self):
+        naive.set_unique_scope()
+        x, y = naive.av(naive.BA1.b, 'x'), naive.av(naive.BA1.b, 'y')
+        self.assertTrue(naive.BA1.is_tautology(naive.f(naive.BA1.disjunction, x, naive.f(naive.BA1.negation, x))))
+        result, counterexample = naive.BA1.is_tautology(naive.f(naive.BA1.disjunction, x, y), return_counterexample=True)
+        self.assertFalse(result)
+        self.assertEqual({x: naive.BA1.falsum, y: naive.BA1.falsum}, counterexample)
+        self.assertTrue(naive.BA1.is_tautology(naive.f(naive.BA1.truth)))
+        self.assertFalse(naive.BA1.is_tautology(naive.f(naive.BA1.falsum)))
+
+    def test_entails(self):
+        naive.set_unique_scope()
+        x = [naive.av(naive.BA1.b, 'x', i) for i in range(10)]
+        phi = naive.f(naive.BA1.n_ary_conjunction, *x)
+        psi = naive.f(naive.BA1.disjunction, x[0], x[9])
+        self.assertTrue(naive.BA1.entails(phi, psi))
+        result, counterexample = naive.BA1.entails(psi, phi, return_counterexample=True)
+        self.assertFalse(result)
+        self.assertIs(naive.BA1.truth, naive.BA1.evaluate(psi, counterexample))
+        self.assertIs(naive.BA1.falsum, naive.BA1.evaluate(phi, counterexample))
+        # The last world is only reached after several growing blocks.
+        chi = naive.f(naive.BA1.negation, phi)
+        result, counterexample = naive.BA1.is_tautology(chi, return_counterexample=True)
+        self.assertFalse(result)
+        self.assertEqual({v: naive.BA1.truth for v in x}, counterexample)
@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1Evaluate(TestCase):
+    def test_evaluate(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        phi = naive.f(naive.BA1.disjunction, naive.f(naive.BA1.conjunction, x, naive.f(naive.BA1.negation, y)),
+                      naive.f(naive.BA1.falsum))
+        self.assertIs(naive.BA1.truth, naive.BA1.evaluate(phi, {x: naive.BA1.truth, y: naive.BA1.falsum}))
+        self.assertIs(naive.BA1.falsum, naive.BA1.evaluate(phi, {x: naive.BA1.truth, y: naive.BA1.truth}))
+        self.assertIs(naive.BA1.falsum, naive.BA1.evaluate(phi, {x: False, y: False}))
+        self.assertIs(naive.BA1.truth, naive.BA1.evaluate(x, {x: True}))
+
+    def test_evaluate_against_satisfaction_index(self):
+        naive.set_unique_scope()
+        b1 = naive.av(codomain=naive.BA1.b, base_name='b', indexes=1)
+        b2 = naive.av(codomain=naive.BA1.b, base_name='b', indexes=2)
+        b3 = naive.av(codomain=naive.BA1.b, base_name='b', indexes=3)
+        psi = naive.f(naive.BA1.conjunction, naive.f(naive.BA1.disjunction, b3, naive.f(naive.BA1.truth)),
+                      naive.f(naive.BA1.negation, naive.f(naive.BA1.conjunction, b1, b2)))
+        sat_i = naive.BA1.satisfaction_index(psi)
+        for world in range(8):
+            assignment = {b: bool(world >> c & 1) for c, b in enumerate([b1, b2, b3])}
+            self.assertIs(sat_i[world], naive.BA1.evaluate(psi, assignment))
+
+    def test_short_circuit(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        # y has no value in the assignment, but it is never evaluated.
+        self.assertIs(naive.BA1.falsum,
+                      naive.BA1.evaluate(naive.f(naive.BA1.conjunction, x, y), {x: naive.BA1.falsum}))
+        self.assertIs(naive.BA1.truth,
+                      naive.BA1.evaluate(naive.f(naive.BA1.disjunction, x, y), {x: naive.BA1.truth}))
+        with self.assertRaises(naive.Log.NaiveError):
+            naive.BA1.evaluate(naive.f(naive.BA1.conjunction, x, y), {x: naive.BA1.truth})
+
+    def test_shared_subformulae(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        calls = []
+
+        def exclusive_disjunction(v1, v2):
+            calls.append(None)
+            return [naive.BA1.truth if (a is naive.BA1.truth) != (b is naive.BA1.truth) else naive.BA1.falsum
+                    for a, b in zip(v1, v2)]
+
+        xor = naive.Core.Concept(
+            scope_key=x.scope_key, language_key=x.language, base_key='xor',
+            facets=[naive.Facets.function, naive.Facets.programmatic_function,
+                    naive.Facets.programmatic_binary_operator],
+            codomain=naive.BA1.b, arity=2, utf8='⊻', base_name='⊻', algorithm=exclusive_disjunction)
+        # Every node is shared by the two arguments of its parent: 2¹⁴ paths, but 15 distinct nodes.
+        phi = naive.f(naive.BA1.conjunction, x, x)
+        for _ in range(14):
+            phi = naive.f(xor, phi, phi)
+        results = {}
+        self.assertIs(naive.BA1.falsum, naive.BA1.evaluate(phi, {x: True}, results=results))
+        self.assertEqual(14, len(calls))
+        self.assertEqual(16, len(results))
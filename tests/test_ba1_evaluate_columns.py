@@ -0,0 +1,41 @@
+import random
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1EvaluateColumns(TestCase):
+    def setUp(self):
+        naive.set_unique_scope()
+        self.x = naive.av(naive.BA1.b, 'x')
+        self.y = naive.av(naive.BA1.b, 'y')
+        self.z = naive.av(naive.BA1.b, 'z')
+        self.phi = naive.f(naive.BA1.disjunction,
+                           naive.f(naive.BA1.conjunction, self.x, naive.f(naive.BA1.negation, self.y)),
+                           naive.f(naive.BA1.conjunction, self.z, naive.f(naive.BA1.truth)))
+        rng = random.Random(5)
+        self.records = [{v: rng.random() < 0.5 for v in (self.x, self.y, self.z)} for _ in range(100)]
+        self.expected = [naive.BA1.evaluate(self.phi, record) is naive.BA1.truth for record in self.records]
+
+    def test_bit_packed_columns(self):
+        columns = {v: sum(1 << i for i, record in enumerate(self.records) if record[v])
+                   for v in (self.x, self.y, self.z)}
+        result = naive.BA1.evaluate_columns(self.phi, columns, length=len(self.records))
+        self.assertEqual(self.expected, [bool(result >> i & 1) for i in range(len(self.records))])
+
+    def test_numpy_columns(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest('numpy is not installed')
+        columns = {v: numpy.array([record[v] for record in self.records]) for v in (self.x, self.y, self.z)}
+        result = naive.BA1.evaluate_columns(self.phi, columns)
+        self.assertEqual(bool, result.dtype)
+        self.assertEqual(self.expected, result.tolist())
+        constant = naive.f(naive.BA1.negation, naive.f(naive.BA1.falsum))
+        result = naive.BA1.evaluate_columns(constant, columns, variables_list=[self.x])
+        self.assertEqual([True] * len(self.records), result.tolist())
+
+    def test_constant_bit_packed(self):
+        constant = naive.f(naive.BA1.negation, naive.f(naive.BA1.falsum))
+        self.assertEqual(0b111, naive.BA1.evaluate_columns(constant, {}, length=3))
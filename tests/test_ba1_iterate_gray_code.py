@@ -0,0 +1,24 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1IterateGrayCode(TestCase):
+    def test_iterate_gray_code(self):
+        naive.set_unique_scope()
+        x = [naive.av(naive.BA1.b, 'x', i) for i in range(5)]
+        shared = naive.f(naive.BA1.conjunction, x[1], naive.f(naive.BA1.negation, x[3]))
+        phi = naive.f(naive.BA1.n_ary_disjunction,
+                      naive.f(naive.BA1.conjunction, x[0], shared),
+                      naive.f(naive.BA1.negation, naive.f(naive.BA1.disjunction, shared, x[4])),
+                      naive.f(naive.BA1.falsum))
+        expected = naive.BA1.satisfaction_index(phi, variables_list=x)
+        worlds = []
+        previous = None
+        for world, value in naive.BA1.iterate_gray_code(phi, variables_list=x):
+            self.assertIs(expected[world], value)
+            if previous is not None:
+                self.assertEqual(1, bin(world ^ previous).count('1'))
+            previous = world
+            worlds.append(world)
+        self.assertEqual(list(range(32)), sorted(worlds))
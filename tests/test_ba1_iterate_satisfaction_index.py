@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1IterateSatisfactionIndex(TestCase):
+    def test_blocks(self):
+        naive.set_unique_scope()
+        b1 = naive.av(codomain=naive.BA1.b, base_name='b', indexes=1)
+        b2 = naive.av(codomain=naive.BA1.b, base_name='b', indexes=2)
+        b3 = naive.av(codomain=naive.BA1.b, base_name='b', indexes=3)
+        b4 = naive.av(codomain=naive.BA1.b, base_name='b', indexes=4)
+        psi1 = naive.f(naive.BA1.conjunction, naive.f(naive.BA1.disjunction, b1, b4),
+                       naive.f(naive.BA1.negation, naive.f(naive.BA1.conjunction, b2, b3)))
+        sat_i = naive.BA1.satisfaction_index(psi1)
+        for block_size in [1, 2, 4, 16, 1024]:
+            blocks = list(naive.BA1.iterate_satisfaction_index(psi1, block_size=block_size))
+            self.assertEqual(list(range(0, 16, min(block_size, 16))), [offset for offset, _ in blocks])
+            self.assertEqual(str(sat_i), str([value for _, block in blocks for value in block]))
+
+    def test_bit_packed_blocks(self):
+        naive.set_unique_scope()
+        variables = [naive.av(naive.BA1.b, 'x', i) for i in range(24)]
+        psi1 = naive.f(naive.BA1.conjunction, variables[0], variables[23])
+        count = sum(bin(mask).count('1') for _, mask in
+                    naive.BA1.iterate_satisfaction_index(psi1, variables_list=variables, bit_packed=True))
+        self.assertEqual(2 ** 22, count)
+
+    def test_invalid_block_size(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        with self.assertRaises(naive.Log.NaiveError):
+            next(naive.BA1.iterate_satisfaction_index(x, block_size=3))
@@ -0,0 +1,48 @@
+import random
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1Minimize(TestCase):
+    def count_products(self, phi):
+        if phi.system_function is naive.BA1.disjunction:
+            return sum(self.count_products(argument) for argument in phi.arguments)
+        return 1
+
+    def test_minimize(self):
+        naive.set_unique_scope()
+        x = [naive.av(naive.BA1.b, 'x', i) for i in range(3)]
+        # The worlds 0, 1, 2, 5, 6, 7 have a minimal cover of 3 products.
+        models = [0, 1, 2, 5, 6, 7]
+        products = []
+        for world in models:
+            literals = [x[c] if (world >> c) & 1 else naive.f(naive.BA1.negation, x[c]) for c in range(3)]
+            products.append(naive.f(naive.BA1.n_ary_conjunction, *literals))
+        phi = naive.f(naive.BA1.n_ary_disjunction, *products)
+        psi = naive.BA1.minimize(phi)
+        self.assertTrue(naive.BA1.equivalent(phi, psi, variables_list=x))
+        self.assertEqual(3, self.count_products(psi))
+
+    def test_constants(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        self.assertIs(naive.BA1.truth,
+                      naive.BA1.minimize(naive.f(naive.BA1.disjunction, x, naive.f(naive.BA1.negation, x))).system_function)
+        self.assertIs(naive.BA1.falsum,
+                      naive.BA1.minimize(naive.f(naive.BA1.conjunction, x, naive.f(naive.BA1.negation, x))).system_function)
+        self.assertIs(x, naive.BA1.minimize(naive.f(naive.BA1.conjunction, x, x)))
+
+    def test_random(self):
+        naive.set_unique_scope()
+        rng = random.Random(19)
+        x = [naive.av(naive.BA1.b, 'x', i) for i in range(10)]
+        for _ in range(5):
+            products = [naive.f(naive.BA1.n_ary_conjunction,
+                                *(v if rng.random() < 0.5 else naive.f(naive.BA1.negation, v)
+                                  for v in rng.sample(x, rng.randint(1, 6))))
+                        for _ in range(12)]
+            phi = naive.f(naive.BA1.n_ary_disjunction, *products)
+            psi = naive.BA1.minimize(phi, variables_list=x)
+            self.assertTrue(naive.BA1.equivalent(phi, psi, variables_list=x))
+            self.assertLessEqual(self.count_products(psi), 12)
@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1NAry(TestCase):
+    def test_n_ary_formulas(self):
+        naive.set_unique_scope()
+        x, y, z = (naive.av(naive.BA1.b, 'x', i) for i in range(3))
+        phi = naive.f(naive.BA1.n_ary_conjunction, x, y, naive.f(naive.BA1.negation, z))
+        psi = naive.f(naive.BA1.n_ary_disjunction, x, y, z)
+        self.assertTrue(naive.has_facet(phi, naive.Facets.programmatic_n_ary_function_call))
+        self.assertEqual(3, phi.arity)
+        t, f = naive.BA1.truth, naive.BA1.falsum
+        self.assertEqual([f, f, f, t, f, f, f, f], naive.BA1.satisfaction_index(phi))
+        self.assertEqual([f, t, t, t, t, t, t, t], naive.BA1.satisfaction_index(psi))
+        for o in (phi, psi):
+            expected = naive.BA1.satisfaction_index(o)
+            self.assertEqual(expected, naive.BA1.satisfaction_index(o, bit_packed=True))
+            mask = naive.BA1.compile(o)(0b10101010, 0b11001100, 0b11110000, mask=0b11111111)
+            self.assertEqual(expected, naive.BA1.decode_mask(mask, 8))
+            self.assertEqual(expected.count(t), naive.BA1.count_models(o))
+            self.assertEqual(expected[3], naive.BA1.evaluate(o, {x: True, y: True, z: False}))
+        manager = naive.BDD.Manager()
+        self.assertEqual(1, manager.count_models(manager.compile(phi)))
+
+    def test_no_argument(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        phi = naive.f(naive.BA1.disjunction, x, naive.f(naive.BA1.n_ary_conjunction))
+        psi = naive.f(naive.BA1.conjunction, x, naive.f(naive.BA1.n_ary_disjunction))
+        self.assertEqual([naive.BA1.truth] * 2, naive.BA1.satisfaction_index(phi))
+        self.assertEqual([naive.BA1.falsum] * 2, naive.BA1.satisfaction_index(psi))
+        self.assertEqual(0b11, naive.BA1.compile(phi)(0b10, mask=0b11))
+        self.assertEqual(0, naive.BA1.compile(psi)(0b10, mask=0b11))
+
+    def test_flatten_associative_operators(self):
+        naive.set_unique_scope()
+        x = [naive.av(naive.BA1.b, 'x', i) for i in range(6)]
+        left = naive.f(naive.BA1.conjunction, naive.f(naive.BA1.conjunction, x[0], x[1]), x[2])
+        right = naive.f(naive.BA1.disjunction, naive.f(naive.BA1.disjunction, x[3], x[4]), x[5])
+        phi = naive.f(naive.BA1.negation, naive.f(naive.BA1.conjunction, left, naive.f(naive.BA1.negation, right)))
+        flat = naive.BA1.flatten_associative_operators(phi)
+        self.assertIs(naive.BA1.negation, flat.system_function)
+        conjunction = flat.arguments[0]
+        self.assertIs(naive.BA1.n_ary_conjunction, conjunction.system_function)
+        self.assertEqual([x[0], x[1], x[2]], list(conjunction.arguments[:3]))
+        disjunction = conjunction.arguments[3].arguments[0]
+        self.assertIs(naive.BA1.n_ary_disjunction, disjunction.system_function)
+        self.assertEqual([x[3], x[4], x[5]], list(disjunction.arguments))
+        self.assertEqual(naive.BA1.satisfaction_index(phi, variables_list=x),
+                         naive.BA1.satisfaction_index(flat, variables_list=x))
+        # Formulae without associative chains are left unchanged.
+        self.assertIs(flat, naive.BA1.flatten_associative_operators(flat))
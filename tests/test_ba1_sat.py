@@ -0,0 +1,88 @@
+import random
+from unittest import TestCase
+
+import naive
+
+
+def evaluate(phi, model):
+    # A minimal reference evaluator, independent of the SAT solver.
+    if naive.has_facet(phi, naive.Facets.atomic_variable):
+        return model[phi] == naive.BA1.truth
+    values = [evaluate(argument, model) for argument in phi.arguments]
+    return {
+        naive.BA1.truth: lambda: True,
+        naive.BA1.falsum: lambda: False,
+        naive.BA1.negation: lambda: not values[0],
+        naive.BA1.conjunction: lambda: values[0] and values[1],
+        naive.BA1.disjunction: lambda: values[0] or values[1]}[phi.system_function]()
+
+
+def random_formula(variables, depth, rng):
+    if depth == 0 or rng.random() < 0.2:
+        return rng.choice(variables)
+    operator = rng.choice([naive.BA1.negation, naive.BA1.conjunction, naive.BA1.disjunction])
+    if operator is naive.BA1.negation:
+        return naive.f(operator, random_formula(variables, depth - 1, rng))
+    return naive.f(operator, random_formula(variables, depth - 1, rng), random_formula(variables, depth - 1, rng))
+
+
+class TestBA1SAT(TestCase):
+    def test_luby(self):
+        self.assertEqual([1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8], [naive.SAT.luby(i) for i in range(15)])
+
+    def test_small_formulas(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        self.assertTrue(naive.BA1.is_satisfiable(x))
+        self.assertFalse(naive.BA1.is_satisfiable(naive.f(naive.BA1.conjunction, x, naive.f(naive.BA1.negation, x))))
+        self.assertFalse(naive.BA1.is_satisfiable(naive.f(naive.BA1.falsum)))
+        self.assertTrue(naive.BA1.is_satisfiable(naive.f(naive.BA1.truth)))
+        phi = naive.f(naive.BA1.conjunction, naive.f(naive.BA1.negation, x), y)
+        self.assertEqual({x: naive.BA1.falsum, y: naive.BA1.truth}, naive.BA1.find_model(phi))
+
+    def test_against_satisfaction_mask(self):
+        naive.set_unique_scope()
+        rng = random.Random(1)
+        variables = [naive.av(naive.BA1.b, 'x', i) for i in range(6)]
+        for _ in range(40):
+            phi = random_formula(variables, 6, rng)
+            model = naive.BA1.find_model(phi)
+            self.assertEqual(naive.BA1.satisfaction_mask(phi) != 0, model is not None)
+            if model is not None:
+                self.assertTrue(evaluate(phi, model))
+
+    def test_pigeonhole_is_unsatisfiable(self):
+        # 5 pigeons in 4 holes.
+        pigeons, holes = 5, 4
+        p = lambda i, j: i * holes + j + 1
+        clauses = [[p(i, j) for j in range(holes)] for i in range(pigeons)]
+        for j in range(holes):
+            for i1 in range(pigeons):
+                for i2 in range(i1 + 1, pigeons):
+                    clauses.append([-p(i1, j), -p(i2, j)])
+        solver = naive.SAT.Solver(variables_number=pigeons * holes, clauses=clauses)
+        self.assertFalse(solver.solve())
+
+    def test_many_variables(self):
+        naive.set_unique_scope()
+        rng = random.Random(2)
+        variables = [naive.av(naive.BA1.b, 'x', i) for i in range(300)]
+        # A satisfiable conjunction of random 3-clauses, with a planted solution.
+        planted = {v: rng.random() < 0.5 for v in variables}
+        clauses = []
+        for _ in range(900):
+            literals = [(v, rng.random() < 0.5) for v in rng.sample(variables, 3)]
+            if not any(planted[v] == positive for v, positive in literals):
+                literals[0] = (literals[0][0], not literals[0][1])
+            literals = [v if positive else naive.f(naive.BA1.negation, v) for v, positive in literals]
+            clauses.append(naive.f(naive.BA1.disjunction, naive.f(naive.BA1.disjunction, literals[0], literals[1]),
+                                   literals[2]))
+        # Build a balanced conjunction tree.
+        while len(clauses) > 1:
+            clauses = [naive.f(naive.BA1.conjunction, clauses[i], clauses[i + 1]) if i + 1 < len(clauses)
+                       else clauses[i] for i in range(0, len(clauses), 2)]
+        phi = clauses[0]
+        model = naive.BA1.find_model(phi)
+        self.assertIsNotNone(model)
+        self.assertTrue(evaluate(phi, model))
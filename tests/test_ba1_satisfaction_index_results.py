@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1SatisfactionIndexResults(TestCase):
+    def test_shared_subformula_is_evaluated_once(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        phi1 = naive.f(naive.BA1.negation, x)
+        phi2 = naive.f(naive.BA1.conjunction, phi1, y)
+        phi3 = naive.f(naive.BA1.disjunction, phi2, phi1)
+        results = {}
+        sat_i = naive.BA1.satisfaction_index(phi3, results=results)
+        self.assertEqual('[⊤, ⊥, ⊤, ⊥]', str(sat_i))
+        # x, y, phi1 and phi2 are the distinct arguments.
+        self.assertEqual(
+            {x.qualified_key, y.qualified_key, phi1.qualified_key, phi2.qualified_key},
+            set(results.keys()))
+
+    def test_shared_subformula_is_evaluated_once_bit_packed(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        phi1 = naive.f(naive.BA1.negation, x)
+        phi2 = naive.f(naive.BA1.conjunction, phi1, phi1)
+        phi3 = naive.f(naive.BA1.disjunction, phi2, naive.f(naive.BA1.conjunction, phi2, y))
+        results = {}
+        self.assertEqual(0b0101, naive.BA1.satisfaction_mask(phi3, results=results))
+        self.assertEqual(6, len(results))
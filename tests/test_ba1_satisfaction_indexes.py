@@ -0,0 +1,23 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1SatisfactionIndexes(TestCase):
+    def test_satisfaction_indexes(self):
+        naive.set_unique_scope()
+        x, y, z = (naive.av(naive.BA1.b, 'x', i) for i in range(3))
+        shared = naive.f(naive.BA1.conjunction, x, naive.f(naive.BA1.negation, y))
+        formulas = [
+            shared,
+            naive.f(naive.BA1.disjunction, shared, z),
+            naive.f(naive.BA1.negation, shared),
+            y,
+            naive.f(naive.BA1.truth)]
+        variables_list = [x, y, z]
+        expected = [naive.BA1.satisfaction_index(phi, variables_list=variables_list) for phi in formulas[:3]]
+        expected.append(naive.BA1.get_boolean_combinations_column(3, 1))
+        expected.append([naive.BA1.truth] * 8)
+        self.assertEqual(expected, naive.BA1.satisfaction_indexes(formulas))
+        self.assertEqual(expected, naive.BA1.satisfaction_indexes(formulas, bit_packed=True))
+        self.assertEqual(expected, naive.BA1.satisfaction_indexes(iter(formulas), variables_list=variables_list))
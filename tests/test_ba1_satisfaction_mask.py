@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1SatisfactionMask(TestCase):
+    def test_boolean_combinations_mask(self):
+        for n in range(1, 6):
+            for c in range(0, n):
+                column = naive.BA1.get_boolean_combinations_column(n, c)
+                mask = naive.BA1.get_boolean_combinations_mask(n, c)
+                self.assertEqual(str(column), str(naive.BA1.decode_mask(mask, 2 ** n)))
+
+    def test_satisfaction_mask(self):
+        naive.set_unique_scope()
+        b1 = naive.av(codomain=naive.BA1.b, base_name='b', indexes=1)
+        b2 = naive.av(codomain=naive.BA1.b, base_name='b', indexes=2)
+        b3 = naive.av(codomain=naive.BA1.b, base_name='b', indexes=3)
+        psi1 = naive.f(naive.BA1.conjunction, b1, b2)
+        psi2 = naive.f(naive.BA1.disjunction, b3, naive.f(naive.BA1.negation, b1))
+        psi3 = naive.f(naive.BA1.conjunction, psi1, psi2)
+        self.assertEqual(0b10000000, naive.BA1.satisfaction_mask(psi3))
+        self.assertEqual(
+            str(naive.BA1.satisfaction_index(psi3)),
+            str(naive.BA1.satisfaction_index(psi3, bit_packed=True)))
+
+    def test_satisfaction_mask_of_constants(self):
+        naive.set_unique_scope()
+        b1 = naive.av(codomain=naive.BA1.b, base_name='b', indexes=1)
+        psi1 = naive.f(naive.BA1.disjunction, b1, naive.f(naive.BA1.truth))
+        self.assertEqual(0b11, naive.BA1.satisfaction_mask(psi1))
+        psi2 = naive.f(naive.BA1.falsum)
+        self.assertEqual('[⊥]', str(naive.BA1.satisfaction_index(psi2, bit_packed=True)))
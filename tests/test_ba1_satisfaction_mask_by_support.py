@@ -0,0 +1,32 @@
+import random
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1SatisfactionMaskBySupport(TestCase):
+    def test_broadcast_mask(self):
+        # x₀ ∧ x₂ over the support (0, 2), broadcast to (0, 1, 2).
+        self.assertEqual(naive.BA1.get_boolean_combinations_mask(3, 0) & naive.BA1.get_boolean_combinations_mask(3, 2),
+                         naive.BA1.broadcast_mask(0b1000, (0, 2), (0, 1, 2)))
+        # Scalars.
+        self.assertEqual(0b1111, naive.BA1.broadcast_mask(1, (), (3, 5)))
+        self.assertEqual(0, naive.BA1.broadcast_mask(0, (), (3, 5)))
+        # A single variable, at every position of a 4 variables target.
+        for c in range(4):
+            self.assertEqual(naive.BA1.get_boolean_combinations_mask(4, c),
+                             naive.BA1.broadcast_mask(0b10, (c,), (0, 1, 2, 3)))
+
+    def test_against_satisfaction_mask(self):
+        naive.set_unique_scope()
+        rng = random.Random(6)
+        variables = [naive.av(naive.BA1.b, 'x', i) for i in range(8)]
+        for _ in range(30):
+            phi = naive.f(rng.choice([naive.BA1.truth, naive.BA1.falsum]))
+            for _ in range(8):
+                operator = rng.choice([naive.BA1.conjunction, naive.BA1.disjunction])
+                argument = naive.f(rng.choice([naive.BA1.conjunction, naive.BA1.disjunction]),
+                                   rng.choice(variables), naive.f(naive.BA1.negation, rng.choice(variables)))
+                phi = naive.f(operator, phi, argument) if rng.random() < 0.5 else naive.f(operator, argument, phi)
+            self.assertEqual(naive.BA1.satisfaction_mask(phi, variables_list=variables),
+                             naive.BA1.satisfaction_mask_by_support(phi, variables_list=variables))
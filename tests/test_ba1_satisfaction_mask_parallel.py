@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1SatisfactionMaskParallel(TestCase):
+    def test_program(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        phi1 = naive.f(naive.BA1.negation, x)
+        phi2 = naive.f(naive.BA1.disjunction, naive.f(naive.BA1.conjunction, phi1, y), phi1)
+        program = naive.BA1.get_formula_program(phi2)
+        # x, ¬x, y, (¬x ∧ y), ((¬x ∧ y) ∨ ¬x)
+        self.assertEqual(5, len(program))
+        self.assertEqual((None, 0), program[0])
+        self.assertEqual((naive.BA1.disjunction.qualified_key, (3, 1)), program[4])
+        self.assertEqual(naive.BA1.satisfaction_mask(phi2), naive.BA1.evaluate_program_mask(program, 2))
+
+    def test_parallel(self):
+        naive.set_unique_scope()
+        variables = [naive.av(naive.BA1.b, 'x', i) for i in range(12)]
+        phi = naive.f(naive.BA1.truth)
+        for i in range(0, 12, 3):
+            phi = naive.f(naive.BA1.conjunction, phi,
+                          naive.f(naive.BA1.disjunction, variables[i],
+                                  naive.f(naive.BA1.negation, naive.f(naive.BA1.conjunction,
+                                                                      variables[i + 1], variables[i + 2]))))
+        expected = naive.BA1.satisfaction_mask(phi, variables_list=variables)
+        # Small inputs fall back on the sequential evaluation.
+        self.assertEqual(expected, naive.BA1.satisfaction_mask_parallel(phi, variables_list=variables, workers=2))
+        self.assertEqual(expected, naive.BA1.satisfaction_mask_parallel(phi, variables_list=variables, workers=1))
+        threshold = naive.BA1.PARALLEL_WORLDS_THRESHOLD
+        naive.BA1.PARALLEL_WORLDS_THRESHOLD = 0
+        try:
+            for shard_size in [None, 4, 64, 1024, 8192]:
+                self.assertEqual(expected, naive.BA1.satisfaction_mask_parallel(
+                    phi, variables_list=variables, workers=2, shard_size=shard_size))
+            self.assertEqual(expected, naive.BA1.satisfaction_mask_parallel(phi, variables_list=variables, workers=3))
+        finally:
+            naive.BA1.PARALLEL_WORLDS_THRESHOLD = threshold
+
+    def test_split_worlds(self):
+        # With 3 workers, the 16 blocks of 256 worlds are split in 3 balanced shards.
+        shards = naive.BA1.split_worlds(2 ** 12, 3, block_size=256)
+        self.assertEqual([(0, 1536), (1536, 1280), (2816, 1280)], shards)
+        self.assertEqual([(0, 4)], naive.BA1.split_worlds(4, 3, block_size=256))
+        self.assertEqual(64, len(naive.BA1.split_worlds(2 ** 20, 64)))
+
+    def test_unaligned_shards(self):
+        naive.set_unique_scope()
+        variables = [naive.av(naive.BA1.b, 'x', i) for i in range(8)]
+        phi = naive.f(naive.BA1.disjunction, naive.f(naive.BA1.conjunction, variables[0], variables[5]),
+                      naive.f(naive.BA1.negation, variables[7]))
+        expected = naive.BA1.satisfaction_mask(phi, variables_list=variables)
+        naive.BA1._initialize_worker(naive.BA1.get_formula_program(phi, variables_list=variables), 8)
+        try:
+            for offset, size in naive.BA1.split_worlds(256, 3, block_size=16):
+                self.assertEqual((expected >> offset) & ((1 << size) - 1),
+                                 naive.BA1._evaluate_worker_shard(offset, size))
+        finally:
+            naive.BA1._worker_program = None
@@ -0,0 +1,62 @@
+import random
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1Simplify(TestCase):
+    def test_rules(self):
+        naive.set_unique_scope()
+        x, y = naive.av(naive.BA1.b, 'x'), naive.av(naive.BA1.b, 'y')
+        t, f = naive.f(naive.BA1.truth), naive.f(naive.BA1.falsum)
+        conjunction, disjunction, negation = naive.BA1.conjunction, naive.BA1.disjunction, naive.BA1.negation
+        # Double negation.
+        self.assertIs(x, naive.BA1.simplify(naive.f(negation, naive.f(negation, x))))
+        # Constant folding.
+        self.assertIs(x, naive.BA1.simplify(naive.f(conjunction, t, x)))
+        self.assertIs(x, naive.BA1.simplify(naive.f(disjunction, x, f)))
+        self.assertIs(naive.BA1.falsum, naive.BA1.simplify(naive.f(conjunction, x, f)).system_function)
+        self.assertIs(naive.BA1.falsum, naive.BA1.simplify(naive.f(negation, t)).system_function)
+        # Idempotence, regardless of the qualified keys.
+        self.assertIs(x, naive.BA1.simplify(naive.f(conjunction, x, x)))
+        phi = naive.BA1.simplify(naive.f(conjunction, naive.f(disjunction, x, y), naive.f(disjunction, y, x)))
+        self.assertIs(naive.BA1.disjunction, phi.system_function)
+        # Complement.
+        self.assertIs(naive.BA1.falsum, naive.BA1.simplify(naive.f(conjunction, x, naive.f(negation, x))).system_function)
+        self.assertIs(naive.BA1.truth, naive.BA1.simplify(naive.f(disjunction, naive.f(negation, x), x)).system_function)
+        # Absorption.
+        self.assertIs(x, naive.BA1.simplify(naive.f(conjunction, x, naive.f(disjunction, y, x))))
+        self.assertIs(x, naive.BA1.simplify(naive.f(disjunction, naive.f(conjunction, x, y), x)))
+        # Associativity.
+        phi = naive.BA1.simplify(naive.f(conjunction, naive.f(conjunction, x, y), naive.f(negation, x)))
+        self.assertIs(naive.BA1.falsum, phi.system_function)
+
+    def test_memoisation(self):
+        naive.set_unique_scope()
+        x, y = naive.av(naive.BA1.b, 'x'), naive.av(naive.BA1.b, 'y')
+        phi = naive.f(naive.BA1.conjunction, x, naive.f(naive.BA1.negation, naive.f(naive.BA1.negation, y)))
+        psi = naive.BA1.simplify(phi)
+        self.assertIs(psi, naive.BA1.simplify(phi))
+        self.assertIs(psi, naive.BA1.simplify(psi))
+
+    def test_equivalence(self):
+        naive.set_unique_scope()
+        rng = random.Random(14)
+        variables = [naive.av(naive.BA1.b, 'x', i) for i in range(4)]
+        constants = [naive.BA1.truth, naive.BA1.falsum]
+        functions = [naive.BA1.conjunction, naive.BA1.disjunction, naive.BA1.n_ary_conjunction, naive.BA1.n_ary_disjunction]
+
+        def generate(depth):
+            if depth == 0:
+                return rng.choice(variables) if rng.random() < 0.8 else naive.f(rng.choice(constants))
+            if rng.random() < 0.3:
+                return naive.f(naive.BA1.negation, generate(depth - 1))
+            function = rng.choice(functions)
+            arity = 2 if function.arity == 2 else rng.randint(0, 3)
+            return naive.f(function, *(generate(depth - 1) for _ in range(arity)))
+
+        for _ in range(50):
+            phi = generate(4)
+            psi = naive.BA1.simplify(phi)
+            self.assertEqual(naive.BA1.satisfaction_mask(phi, variables_list=variables),
+                             naive.BA1.satisfaction_mask(psi, variables_list=variables))
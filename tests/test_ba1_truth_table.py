@@ -0,0 +1,34 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestBA1TruthTable(TestCase):
+    def test_truth_table(self):
+        naive.set_unique_scope()
+        x = [naive.av(naive.BA1.b, 'x', i) for i in range(5)]
+        phi = naive.f(naive.BA1.disjunction,
+                      naive.f(naive.BA1.conjunction, x[0], naive.f(naive.BA1.negation, x[3])),
+                      naive.f(naive.BA1.conjunction, x[2], x[4]))
+        expected = naive.BA1.satisfaction_index(phi, variables_list=x)
+        for cache_blocks in (True, False):
+            table = naive.BA1.TruthTable(phi, variables_list=x, block_size=4, cache_blocks=cache_blocks)
+            self.assertEqual(32, len(table))
+            self.assertEqual(expected, list(table))
+            self.assertEqual(expected[7], table[7])
+            self.assertEqual(expected[-1], table[-1])
+            self.assertEqual(expected[3:29:5], table[3:29:5])
+            self.assertEqual(expected.count(naive.BA1.truth), table.count_true())
+        self.assertEqual({x[0]: naive.BA1.truth, x[1]: naive.BA1.falsum, x[2]: naive.BA1.truth,
+                          x[3]: naive.BA1.falsum, x[4]: naive.BA1.falsum}, table.get_assignment(5))
+        with self.assertRaises(IndexError):
+            table[32]
+
+    def test_huge_truth_table(self):
+        naive.set_unique_scope()
+        x = [naive.av(naive.BA1.b, 'x', i) for i in range(40)]
+        phi = naive.f(naive.BA1.n_ary_conjunction, *x)
+        table = naive.BA1.TruthTable(phi, variables_list=x)
+        self.assertEqual(2 ** 40, len(table))
+        self.assertIs(naive.BA1.truth, table[-1])
+        self.assertIs(naive.BA1.falsum, table[2 ** 40 - 2])
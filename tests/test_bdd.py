@@ -0,0 +1,102 @@
+import random
+from unittest import TestCase
+
+import naive
+
+
+class TestBDD(TestCase):
+    def test_equivalence(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        manager = naive.BDD.Manager()
+        # De Morgan: ¬(x ∧ y) ≡ (¬x ∨ ¬y)
+        phi1 = naive.f(naive.BA1.negation, naive.f(naive.BA1.conjunction, x, y))
+        phi2 = naive.f(naive.BA1.disjunction, naive.f(naive.BA1.negation, x), naive.f(naive.BA1.negation, y))
+        self.assertTrue(manager.equivalent(manager.compile(phi1), manager.compile(phi2)))
+        phi3 = naive.f(naive.BA1.disjunction, x, naive.f(naive.BA1.negation, y))
+        self.assertFalse(manager.equivalent(manager.compile(phi1), manager.compile(phi3)))
+        tautology = naive.f(naive.BA1.disjunction, x, naive.f(naive.BA1.negation, x))
+        self.assertEqual(naive.BDD.TRUTH, manager.compile(tautology))
+
+    def test_count_models_against_satisfaction_mask(self):
+        naive.set_unique_scope()
+        rng = random.Random(3)
+        variables = [naive.av(naive.BA1.b, 'x', i) for i in range(5)]
+        manager = naive.BDD.Manager(variables_list=variables)
+        for _ in range(20):
+            phi = variables[0]
+            for _ in range(8):
+                operator = rng.choice([naive.BA1.conjunction, naive.BA1.disjunction])
+                argument = rng.choice(variables)
+                if rng.random() < 0.5:
+                    argument = naive.f(naive.BA1.negation, argument)
+                phi = naive.f(operator, phi, argument)
+            mask = naive.BA1.satisfaction_mask(phi, variables_list=variables)
+            self.assertEqual(bin(mask).count('1'), manager.count_models(manager.compile(phi)))
+
+    def test_restriction_and_quantification(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        manager = naive.BDD.Manager()
+        node = manager.compile(naive.f(naive.BA1.conjunction, x, y))
+        self.assertEqual(manager.compile(y), manager.restrict(node, x, True))
+        self.assertEqual(naive.BDD.FALSUM, manager.restrict(node, x, False))
+        self.assertEqual(manager.compile(y), manager.exists(node, x))
+        self.assertEqual(naive.BDD.FALSUM, manager.forall(node, x))
+        self.assertEqual(naive.BDD.TRUTH, manager.exists(node, [x, y]))
+
+    def test_garbage_collection(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        z = naive.av(naive.BA1.b, 'z')
+        manager = naive.BDD.Manager(cache_size=4)
+        kept = manager.compile(naive.f(naive.BA1.conjunction, x, y))
+        dropped = manager.compile(naive.f(naive.BA1.disjunction, naive.f(naive.BA1.conjunction, x, z), y))
+        manager.deref(dropped)
+        self.assertGreater(manager.collect_garbage(), 0)
+        self.assertEqual(0, manager.collect_garbage())
+        self.assertEqual(2, manager.nodes_number)
+        self.assertEqual(kept, manager.compile(naive.f(naive.BA1.conjunction, y, x)))
+        # x ∧ y is true in 2 of the 8 worlds of x, y, z.
+        self.assertEqual(2, manager.count_models(kept))
+
+    def test_many_variables(self):
+        naive.set_unique_scope()
+        variables = [naive.av(naive.BA1.b, 'x', i) for i in range(100)]
+        # Pairwise equalities x₂ᵢ ⇔ x₂ᵢ₊₁ have a linear BDD in the interleaved order.
+        manager = naive.BDD.Manager(variables_list=variables)
+        node = naive.BDD.TRUTH
+        for i in range(0, 100, 2):
+            a, b = variables[i], variables[i + 1]
+            equality = naive.f(naive.BA1.disjunction,
+                               naive.f(naive.BA1.conjunction, a, b),
+                               naive.f(naive.BA1.conjunction, naive.f(naive.BA1.negation, a),
+                                       naive.f(naive.BA1.negation, b)))
+            node = manager.conjunction(node, manager.compile(equality))
+        self.assertEqual(2 ** 50, manager.count_models(node))
+
+    def test_references_across_garbage_collection(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        z = naive.av(naive.BA1.b, 'z')
+        manager = naive.BDD.Manager()
+        node = manager.compile(naive.f(naive.BA1.conjunction, x, naive.f(naive.BA1.disjunction, y, z)))
+        restricted = manager.restrict(node, x, True)
+        negated = manager.negation(restricted)
+        manager.deref(node)
+        manager.collect_garbage()
+        # The nodes returned by restrict and negation survive the collection.
+        self.assertEqual(3, manager.count_models(restricted) >> 1)
+        self.assertEqual(naive.BDD.TRUTH, manager.exists(negated, [y, z]))
+        quantified = manager.forall(restricted, y)
+        manager.deref(restricted)
+        manager.collect_garbage()
+        self.assertEqual(manager.compile(z), quantified)
+        self.assertEqual(manager.disjunction(quantified, negated), manager.compile(
+            naive.f(naive.BA1.disjunction, z, naive.f(naive.BA1.negation, naive.f(naive.BA1.disjunction, y, z)))))
+        manager.deref(negated)
+        manager.deref(quantified)
@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestCoreConceptSlots(TestCase):
+    def test_compact_layout(self):
+        naive.set_unique_scope()
+        x, y = naive.av(naive.BA1.b, 'x'), naive.av(naive.BA1.b, 'y')
+        phi = naive.f(naive.BA1.conjunction, x, y)
+        for o in (x, phi):
+            self.assertFalse(hasattr(o, '__dict__'))
+            with self.assertRaises(AttributeError):
+                o.undeclared_property = None
+        # Absent optional properties are not stored.
+        self.assertIsNone(phi._properties)
+        self.assertIsNone(phi.get_representation(naive.RFormats.LATEX))
+        self.assertIsNone(phi.algorithm)
+        # Facet sets are shared.
+        self.assertIs(x.facets, y.facets)
+        self.assertEqual(2, naive.BA1.conjunction.arity)
+        self.assertEqual('({0} & {1})', naive.BA1.conjunction.mask_expression)
+        self.assertEqual('ba1_scope', naive.BA1.ba1_scope.get_representation(naive.RFormats.UTF8))
+        self.assertEqual('ba1_scope', naive.Repr.represent(naive.BA1.ba1_scope, naive.RFormats.UTF8))
+
+    def test_elements(self):
+        naive.set_unique_scope()
+        s = naive.SA1.declare_abstract_set(3)
+        self.assertEqual(3, len(s.elements))
+        self.assertIs(s, s.elements[0].parent_set)
+
+    def test_programmatic_value(self):
+        self.assertIs(True, naive.Core.compute_programmatic_value(naive.BA1.truth))
+        self.assertIs(False, naive.Core.compute_programmatic_value(naive.BA1.falsum))
+        self.assertTrue(naive.Core.equal_programmatic_value(naive.BA1.truth, naive.BA1.truth))
+        self.assertFalse(naive.Core.equal_programmatic_value(naive.BA1.truth, naive.BA1.falsum))
@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestCoreFindConcepts(TestCase):
+    def test_find_concepts(self):
+        naive.set_unique_scope()
+        x, y = naive.av(naive.BA1.b, 'x'), naive.av(naive.BA1.b, 'y')
+        scope_key = x.scope_key
+        phi = naive.f(naive.BA1.negation, x)
+        psi = naive.f(naive.BA1.conjunction, phi, naive.f(naive.BA1.negation, y))
+        chi = psi.arguments[1]
+        self.assertEqual([x, y], naive.Core.find_concepts(
+            scope_key=scope_key, facet=naive.Facets.atomic_variable, codomain=naive.BA1.b))
+        negations = naive.Core.find_concepts(system_function=naive.BA1.negation)
+        self.assertIn(phi, negations)
+        self.assertIn(chi, negations)
+        self.assertNotIn(psi, negations)
+        self.assertEqual([phi, chi], naive.Core.find_concepts(scope_key=scope_key, system_function=naive.BA1.negation))
+        self.assertEqual([phi, chi, psi], naive.Core.find_concepts(scope_key=scope_key, facet=naive.Facets.formula)[2:])
+        self.assertEqual([x, y, phi, chi, psi], naive.Core.find_concepts(scope_key=scope_key))
+        self.assertIn(naive.BA1.conjunction, naive.Core.find_concepts(facet=naive.Facets.programmatic_binary_operator))
+        self.assertEqual([], naive.Core.find_concepts(scope_key='unknown scope'))
+
+    def test_late_facets(self):
+        naive.set_unique_scope()
+        x, y = naive.av(naive.BA1.b, 'x'), naive.av(naive.BA1.b, 'y')
+        naive.add_facets(y, naive.Facets.atomic_property)
+        naive.add_facets(x, naive.Facets.atomic_property)
+        self.assertEqual([x, y], naive.Core.find_concepts(scope_key=x.scope_key, facet=naive.Facets.atomic_property))
+
+    def test_key_spaces(self):
+        naive.set_unique_scope()
+        # A codomain that is not a concept does not collide with the handle of a concept.
+        o = naive.Core.Concept(scope_key=naive.get_default_scope(), language_key='language_test', base_key='o',
+                               facets=[naive.Facets.domain], codomain=naive.BA1.b.handle)
+        self.assertEqual([o], naive.Core.find_concepts(scope_key=o.scope_key, codomain=naive.BA1.b.handle))
+        self.assertEqual([], naive.Core.find_concepts(scope_key=o.scope_key, codomain=naive.BA1.b))
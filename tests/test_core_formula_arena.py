@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestCoreFormulaArena(TestCase):
+    def test_formula_arena(self):
+        naive.set_unique_scope()
+        x, y, z = (naive.av(naive.BA1.b, 'x', i) for i in range(3))
+        arena = naive.Core.FormulaArena()
+        nx, ny, nz = (arena.add_atomic_variable(v) for v in (x, y, z))
+        shared = arena.add_formula(naive.BA1.conjunction, nx, arena.add_formula(naive.BA1.negation, ny))
+        root = arena.add_formula(naive.BA1.n_ary_disjunction, shared, nz, arena.add_formula(naive.BA1.falsum))
+        # Structurally identical nodes are stored once.
+        self.assertEqual(shared, arena.add_formula(naive.BA1.conjunction, nx, arena.add_formula(naive.BA1.negation, ny)))
+        self.assertEqual(nx, arena.add_atomic_variable(x))
+        self.assertEqual(7, len(arena))
+        self.assertEqual([shared, nz, 5], list(arena.get_arguments(root)))
+        self.assertIs(naive.BA1.n_ary_disjunction, arena.get_system_function(root))
+        self.assertIs(x, arena.get_atomic_variable(nx))
+        self.assertIs(naive.BA1.b, arena.get_codomain(root))
+        self.assertEqual([x, y, z], arena.list_atomic_variables(root))
+        # Concept views.
+        phi = arena.get_concept(root)
+        self.assertIs(phi, arena.get_concept(root))
+        self.assertEqual(naive.BA1.satisfaction_mask(phi, variables_list=[x, y, z]),
+                         naive.BA1.satisfaction_mask_from_arena(arena, root))
+        self.assertEqual(naive.BA1.satisfaction_mask(phi, variables_list=[x, y, z], offset=4, vector_size=4),
+                         naive.BA1.satisfaction_mask_from_arena(arena, root, offset=4, vector_size=4))
+        # Serialization.
+        copy = naive.Core.FormulaArena.deserialize(arena.serialize())
+        self.assertEqual(len(arena), len(copy))
+        self.assertEqual(naive.BA1.satisfaction_mask_from_arena(arena, root),
+                         naive.BA1.satisfaction_mask_from_arena(copy, root))
+        self.assertEqual(shared, copy.add_formula(naive.BA1.conjunction, nx, copy.add_formula(naive.BA1.negation, ny)))
+
+    def test_add_concept(self):
+        naive.set_unique_scope()
+        x, y = naive.av(naive.BA1.b, 'x'), naive.av(naive.BA1.b, 'y')
+        phi = naive.f(naive.BA1.disjunction, naive.f(naive.BA1.conjunction, x, y), naive.f(naive.BA1.negation, x))
+        arena = naive.Core.FormulaArena()
+        node = arena.add_concept(phi)
+        self.assertIs(phi, arena.get_concept(node))
+        self.assertEqual(naive.BA1.satisfaction_mask(phi), naive.BA1.satisfaction_mask_from_arena(arena, node))
+        self.assertEqual(node, arena.add_concept(phi))
+
+    def test_no_hash_consing(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        arena = naive.Core.FormulaArena(hash_consing=False)
+        nx = arena.add_atomic_variable(x)
+        self.assertNotEqual(arena.add_formula(naive.BA1.negation, nx), arena.add_formula(naive.BA1.negation, nx))
+        self.assertEqual(3, len(arena))
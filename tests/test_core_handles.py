@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestCoreHandles(TestCase):
+    def test_handles(self):
+        naive.set_unique_scope()
+        x, y = naive.av(naive.BA1.b, 'x'), naive.av(naive.BA1.b, 'y')
+        phi = naive.f(naive.BA1.conjunction, x, y)
+        self.assertEqual(x.handle + 1, y.handle)
+        self.assertLess(y.handle, phi.handle)
+        for o in (x, y, phi, naive.BA1.truth):
+            self.assertIs(o, naive.Core.Concept.get_concept_from_handle(o.handle))
+        self.assertTrue(phi.is_equal_concept(phi))
+        self.assertFalse(phi.is_equal_concept(x))
+
+    def test_qualified_keys(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        self.assertIs(x.qualified_key, x.qualified_key)
+        self.assertEqual(naive.get_qualified_key(scope_key=x.scope_key, language_key=x.language, base_key=x.base_key),
+                         x.qualified_key)
+        self.assertIs(x, naive.Core.Concept.get_concept_from_qualified_key(x.qualified_key))
+
+    def test_unregistered_concepts(self):
+        o1, o2 = naive.Core.Concept.__new__(naive.Core.Concept), naive.Core.Concept.__new__(naive.Core.Concept)
+        o1._handle = o2._handle = None
+        self.assertFalse(o1.is_equal_concept(o2))
+        self.assertTrue(o1.is_equal_concept(o1))
@@ -0,0 +1,44 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestCoreHashConsing(TestCase):
+    def tearDown(self):
+        naive.Core.HASH_CONSING = False
+
+    def test_hash_consing_disabled_by_default(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        phi1 = naive.f(naive.BA1.negation, x)
+        phi2 = naive.f(naive.BA1.negation, x)
+        self.assertIsNot(phi1, phi2)
+
+    def test_hash_consing(self):
+        naive.set_unique_scope()
+        naive.Core.HASH_CONSING = True
+        x = naive.av(naive.BA1.b, 'x')
+        y = naive.av(naive.BA1.b, 'y')
+        phi1 = naive.f(naive.BA1.conjunction, naive.f(naive.BA1.negation, x), y)
+        phi2 = naive.f(naive.BA1.conjunction, naive.f(naive.BA1.negation, x), y)
+        self.assertIs(phi1, phi2)
+        self.assertIsNot(phi1, naive.f(naive.BA1.conjunction, y, naive.f(naive.BA1.negation, x)))
+        self.assertIs(naive.f(naive.BA1.truth), naive.f(naive.BA1.truth))
+
+    def test_hash_consing_of_parsed_formulas(self):
+        naive.set_unique_scope()
+        naive.Core.HASH_CONSING = True
+        phi1 = naive.parse_string_utf8(r'((p ∨ q) ∧ ¬(p ∨ q))')
+        self.assertIs(phi1.arguments[0], phi1.arguments[1].arguments[0])
+        self.assertIs(phi1, naive.parse_string_utf8(r'((p ∨ q) ∧ ¬(p ∨ q))'))
+
+    def test_hash_consing_of_non_concept_arguments(self):
+        naive.set_unique_scope()
+        naive.Core.HASH_CONSING = True
+        x = naive.av(naive.BA1.b, 'x')
+        phi1 = naive.f(naive.SA1.element_of, x, 3)
+        self.assertIs(phi1, naive.f(naive.SA1.element_of, x, 3))
+        # Equal values of distinct types are distinct arguments.
+        self.assertIsNot(phi1, naive.f(naive.SA1.element_of, x, 3.0))
+        # Unhashable arguments are not hash-consed.
+        self.assertIsNot(naive.f(naive.SA1.element_of, x, [3]), naive.f(naive.SA1.element_of, x, [3]))
@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestCoreSupport(TestCase):
+    def test_support(self):
+        naive.set_unique_scope()
+        y, x, z = naive.av(naive.BA1.b, 'y'), naive.av(naive.BA1.b, 'x'), naive.av(naive.BA1.b, 'z')
+        self.assertEqual(x.variable_number + 1, z.variable_number)
+        self.assertEqual(frozenset((x,)), x.support)
+        self.assertEqual(1 << x.variable_number, x.support_mask)
+        phi = naive.f(naive.BA1.conjunction, naive.f(naive.BA1.negation, y), naive.f(naive.BA1.disjunction, x, y))
+        self.assertEqual(frozenset((x, y)), phi.support)
+        self.assertEqual(x.support_mask | y.support_mask, phi.support_mask)
+        self.assertEqual([x, y], naive.Core.list_formula_atomic_variables(phi))
+        constant = naive.f(naive.BA1.truth)
+        self.assertEqual(frozenset(), constant.support)
+        self.assertEqual(0, constant.support_mask)
+        self.assertEqual([x, y, z], naive.Core.list_formulas_atomic_variables([phi, z, constant]))
+
+    def test_get_variable_positions(self):
+        naive.set_unique_scope()
+        x, y = naive.av(naive.BA1.b, 'x'), naive.av(naive.BA1.b, 'y')
+        self.assertEqual({y.qualified_key: 0, x.qualified_key: 1}, naive.Core.get_variable_positions([y, x]))
+
+    def test_failed_declaration(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        with self.assertRaises(naive.Log.NaiveError):
+            naive.Core.Concept(scope_key=x.scope_key, language_key=x.language, base_key=x.base_key,
+                               facets=[naive.Facets.atomic_variable], codomain=naive.BA1.b)
+        # The failed declaration does not shift the variable numbers.
+        y = naive.av(naive.BA1.b, 'y')
+        self.assertEqual(x.variable_number + 1, y.variable_number)
@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+import naive
+
+
+class TestFacetMasks(TestCase):
+    def test_masks(self):
+        facets = naive.Facets.programmatic_binary_operator_call
+        self.assertEqual(1 << facets.bit, facets.mask)
+        self.assertTrue(facets.inclusions_mask & naive.Facets.programmatic_function_call.mask)
+        self.assertTrue(facets.inclusions_mask & naive.Facets.formula.mask)
+
+    def test_has_facet(self):
+        naive.set_unique_scope()
+        x = naive.av(naive.BA1.b, 'x')
+        phi = naive.f(naive.BA1.negation, x)
+        self.assertTrue(naive.has_facet(phi, naive.Facets.programmatic_unary_operator_call))
+        self.assertTrue(naive.has_facet(phi, naive.Facets.formula))
+        self.assertFalse(naive.has_facet(phi, naive.Facets.atomic_variable))
+        self.assertFalse(naive.has_facet('not a concept', naive.Facets.formula))
+        self.assertTrue(naive.has_any_facet(phi, [naive.Facets.atomic_variable, naive.Facets.formula]))
+        self.assertIn(naive.Facets.formula, phi.facets)
+        self.assertEqual(naive.get_facets_mask(naive.Facets.programmatic_unary_operator_call), phi.facet_mask)
+
+    def test_exclusions(self):
+        left = naive.Facet('test_exclusions_left')
+        right = naive.Facet('test_exclusions_right', exclusions=[left])
+        naive.set_unique_scope()
+        with self.assertRaises(naive.Log.NaiveError):
+            naive.Core.Concept(scope_key=None, base_key='inconsistent', facets=[left, right])